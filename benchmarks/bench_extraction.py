@@ -0,0 +1,119 @@
+"""
+Benchmarks the unified extraction pipeline against the three extractors it replaced.
+
+Usage:
+    python benchmarks/bench_extraction.py path/to/resumes/ --repeat 5
+
+The corpus directory should mix text-based and scanned resumes. The legacy
+extractors are reproduced here without their Streamlit calls, exactly as they
+parsed PDFs before ``rezumex.extraction`` existed.
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rezumex.extraction import extract_document  # noqa: E402
+
+
+def legacy_convert_pdf_to_text(pdf_bytes):
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(pdf_bytes)) as pdf:
+        return "\n".join([page.extract_text() or "" for page in pdf.pages])
+
+
+def _legacy_ocr(pdf_bytes):
+    import pytesseract
+    from pdf2image import convert_from_bytes
+
+    text = ""
+    for image in convert_from_bytes(pdf_bytes):
+        text += pytesseract.image_to_string(image) + "\n"
+    return text
+
+
+def legacy_input_pdf_setup(pdf_bytes):
+    from pypdf import PdfReader
+
+    text = ""
+    for page in PdfReader(io.BytesIO(pdf_bytes)).pages:
+        text += (page.extract_text() or "") + "\n"
+    if not text.strip():
+        text += _legacy_ocr(pdf_bytes)
+    return text.strip()
+
+
+def legacy_convert_pdf_to(pdf_bytes):
+    from pypdf import PdfReader
+
+    text = ""
+    for page in PdfReader(io.BytesIO(pdf_bytes)).pages:
+        page_text = page.extract_text()
+        if page_text:
+            text += page_text + "\n"
+    if not text.strip():
+        text += _legacy_ocr(pdf_bytes)
+    return text.strip()
+
+
+def unified(pdf_bytes):
+    return extract_document(pdf_bytes)["text"]
+
+
+EXTRACTORS = {
+    "convert_pdf_to_text (pdfplumber)": legacy_convert_pdf_to_text,
+    "input_pdf_setup (pypdf)": legacy_input_pdf_setup,
+    "convert_pdf_to (pypdf + OCR)": legacy_convert_pdf_to,
+    "extract_document (unified)": unified,
+}
+
+
+def time_extractor(extract, corpus, repeat):
+    """
+    Returns per-run wall-clock seconds for extracting the whole corpus.
+    """
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for pdf_bytes in corpus:
+            try:
+                extract(pdf_bytes)
+            except Exception:
+                pass  # Missing OCR tooling etc. counts as time spent, not a crash
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("corpus", help="Directory of PDF resumes")
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args(argv)
+
+    paths = sorted(os.path.join(args.corpus, name) for name in os.listdir(args.corpus) if name.lower().endswith(".pdf"))
+    corpus = []
+    for path in paths:
+        with open(path, "rb") as f:
+            corpus.append(f.read())
+    if not corpus:
+        parser.error(f"no PDFs found in {args.corpus}")
+
+    backends = {}
+    for pdf_bytes in corpus:
+        for page in extract_document(pdf_bytes)["pages"]:
+            backends[page["backend"]] = backends.get(page["backend"], 0) + 1
+    print(f"{len(corpus)} PDFs, pages by backend: {backends}\n")
+
+    print(f"{'extractor':<36} {'median s':>10} {'min s':>10}")
+    for name, extract in EXTRACTORS.items():
+        runs = time_extractor(extract, corpus, args.repeat)
+        print(f"{name:<36} {statistics.median(runs):>10.3f} {min(runs):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmarks cold-start import time of the app shell and of each page.
+
+Usage:
+    python benchmarks/bench_imports.py --repeat 5
+
+Every measurement runs in a fresh interpreter, as a newly started container
+would. "monolithic app.py" imports what ``app.py`` imported eagerly before it
+was split into ``rezumex.ui`` pages; the other rows import the app shell plus
+one page module, which is what a first request to that page now costs.
+Modules that are not installed (e.g. matplotlib, which the app no longer
+needs) are skipped and listed after the row, so that row is then a lower
+bound.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SHELL = ["streamlit", "dotenv", "rezumex.ui", "rezumex.ui.common", "rezumex.jobs"]
+MONOLITHIC = [
+    "streamlit", "dotenv", "PIL.Image", "pandas", "matplotlib.pyplot", "pdfplumber", "fitz", "pdf2image",
+    "pypdf", "google.generativeai", "numpy", "scipy.sparse", "rezumex.extraction", "rezumex.llm",
+]
+TARGETS = {
+    "monolithic app.py": MONOLITHIC,
+    "shell + welcome": SHELL + ["rezumex.ui.welcome"],
+    "shell + cover letter": SHELL + ["rezumex.ui.cover_letter"],
+    "shell + linkedin": SHELL + ["rezumex.ui.linkedin"],
+    "shell + career explorer": SHELL + ["rezumex.ui.career"],
+    "shell + job role": SHELL + ["rezumex.ui.job_role"],
+    "shell + hr": SHELL + ["rezumex.ui.hr"],
+}
+
+# Prints the modules that could not be imported, then the import time in seconds;
+# the pages' lazy dependencies load on first use, not here
+_PROBE = """
+import importlib, sys, time, warnings
+warnings.simplefilter("ignore")
+missing = []
+start = time.perf_counter()
+for module in sys.argv[1:]:
+    try:
+        importlib.import_module(module)
+    except ImportError:
+        missing.append(module)
+print(" ".join(missing))
+print(time.perf_counter() - start)
+"""
+
+
+def time_imports(modules, repeat):
+    """
+    Returns ``(runs, missing)``: seconds per fresh-interpreter import, and the modules that are not installed.
+    """
+    runs, missing = [], []
+    for _ in range(repeat):
+        result = subprocess.run([sys.executable, "-c", _PROBE, *modules], cwd=ROOT, capture_output=True, text=True,
+                                check=True)
+        lines = result.stdout.splitlines()  # Modules may print while importing; the probe's lines come last
+        missing = lines[-2].split()
+        runs.append(float(lines[-1]))
+    return runs, missing
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    print(f"{'target':<28} {'median s':>10} {'min s':>10}")
+    for name, modules in TARGETS.items():
+        runs, missing = time_imports(modules, args.repeat)
+        note = f"  (not installed: {', '.join(missing)})" if missing else ""
+        print(f"{name:<28} {statistics.median(runs):>10.3f} {min(runs):>10.3f}{note}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+"""
+Times the hot paths on a synthetic resume corpus and stores the results as JSON.
+
+Usage:
+    python benchmarks/bench_suite.py --per-kind 5 --repeat 5 --out results.json
+    python benchmarks/bench_suite.py --out after.json --compare before.json
+
+The corpus comes from ``corpus.py`` (same seed, same PDFs), so result files
+from different versions of the code are comparable. Gemini is replaced by
+the offline stand-in model (``rezumex.local_llm``), answering after
+``--llm-latency`` seconds under a limiter too generous to throttle, so the HR
+batch measures the app's own overhead (parsing, scheduling, response
+handling) rather than the network.
+
+With ``--compare``, each benchmark's median is compared against the baseline
+file and the exit code is 1 if any got slower than ``--threshold``.
+"""
+import argparse
+import datetime
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from bench_extraction import EXTRACTORS  # noqa: E402
+from corpus import generate_corpus  # noqa: E402
+
+from rezumex.analysis import JSON_GENERATION_CONFIG, extract_information, parse_analysis  # noqa: E402
+from rezumex.batch import analyze_batch  # noqa: E402
+from rezumex.compaction import compact_resume  # noqa: E402
+from rezumex.dedup import Deduplicator  # noqa: E402
+from rezumex.knowledge import load_knowledge_base  # noqa: E402
+from rezumex.llm import LocalClient  # noqa: E402
+from rezumex.ratelimit import RateLimiter  # noqa: E402
+from rezumex.screening import analyze_resume, resume_contents  # noqa: E402
+from rezumex.scoring import score_resumes  # noqa: E402
+
+JOB_DESCRIPTION = """
+Senior Python developer to build data-heavy web services. Must have Python, Django, SQL and AWS; Docker,
+Kubernetes and machine learning experience is a plus. You will design APIs, mentor engineers and own
+production reliability.
+"""
+
+
+def free_text_response(resume_text):
+    # What an unstructured Gemini answer looks like to the regex fallback
+    return (
+        f"1. **ATS Score (Percentage Match):** ATS Score: {len(resume_text) % 101}%\n\n"
+        f"2. **Experience:** {resume_text[:800]}\n\n3. **Strengths:** {resume_text[800:1100]}\n\n"
+        "4. **Weaknesses:** Limited Kubernetes exposure.\n\n"
+        f"5. **Projects:** {resume_text[-500:]}\n\n6. **General Information:** Open to relocation.\n\n"
+        f"7. **Academic Details:** {resume_text[-150:]}\n"
+    )
+
+
+def build_benchmarks(corpus, llm_latency, max_in_flight):
+    """
+    Returns ``{name: (callable, items)}``; each callable processes ``items`` inputs once.
+    """
+    # Imported here: the page modules pull in Streamlit
+    from rezumex.ui.career import extract_skills_from, suggest_job_roles
+    from rezumex.ui.linkedin import analyze_linkedin_text
+
+    knowledge_base = load_knowledge_base()
+    pdfs = [resume["pdf"] for resume in corpus]
+    texts = [resume["text"] for resume in corpus]
+    skills = [extract_skills_from(text) for text in texts]
+    target_skills = knowledge_base.role_skills[next(iter(knowledge_base.role_skills))]
+    free_text = [free_text_response(text) for text in texts]
+    documents = [(resume["name"], resume["pdf"]) for resume in corpus]
+    llm = LocalClient(latency=llm_latency, jitter=0, limiter=RateLimiter(rpm=10 ** 9, tpm=10 ** 12))
+    structured = [llm.model.respond(resume_contents("", JOB_DESCRIPTION, text), JSON_GENERATION_CONFIG)
+                  for text in texts]
+
+    def each(function, inputs):
+        return lambda: [function(value) for value in inputs]
+
+    def extractor(extract):
+        def run():
+            for pdf_bytes in pdfs:
+                try:
+                    extract(pdf_bytes)
+                except Exception:
+                    pass  # Missing OCR tooling etc. counts as time spent, not a crash
+        return run
+
+    def hr_batch():
+        analyze = lambda text: analyze_resume(llm, None, text, JOB_DESCRIPTION)  # noqa: E731
+        return list(analyze_batch(documents, analyze, max_in_flight=max_in_flight))
+
+    benchmarks = {f"extract: {name}": (extractor(extract), len(pdfs)) for name, extract in EXTRACTORS.items()}
+    benchmarks.update({
+        "compact_resume": (each(compact_resume, texts), len(texts)),
+        "extract_skills_from": (each(extract_skills_from, texts), len(texts)),
+        "suggest_job_roles": (each(suggest_job_roles, skills), len(skills)),
+        "analyze_linkedin_text": (each(lambda text: analyze_linkedin_text(text, target_skills), texts), len(texts)),
+        "extract_information (free text)": (each(extract_information, free_text), len(free_text)),
+        "parse_analysis (JSON)": (each(parse_analysis, structured), len(structured)),
+        "score_resumes (pre-screen)": (lambda: score_resumes(JOB_DESCRIPTION, texts), len(texts)),
+        "dedup (text)": (lambda: Deduplicator().unique_texts(list(zip(map(str, range(len(texts))), texts))),
+                         len(texts)),
+        "HR batch (stub Gemini)": (hr_batch, len(documents)),
+    })
+    return benchmarks
+
+
+def run_benchmark(function, repeat):
+    """
+    Returns wall-clock seconds of ``repeat`` calls, after one untimed warm-up call.
+    """
+    function()
+    runs = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        runs.append(time.perf_counter() - start)
+    return runs
+
+
+def _git_revision():
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results, baseline, threshold):
+    """
+    Prints the change of every median against ``baseline``; returns the names that got slower than ``threshold``.
+    """
+    regressions = []
+    print(f"\n{'benchmark':<44} {'baseline s':>11} {'current s':>11} {'change':>9}")
+    for name, result in results["benchmarks"].items():
+        before = baseline["benchmarks"].get(name)
+        if before is None:
+            print(f"{name:<44} {'-':>11} {result['median_s']:>11.4f} {'new':>9}")
+            continue
+        change = result["median_s"] / before["median_s"] - 1 if before["median_s"] else 0.0
+        flag = "  <-- slower" if change > threshold else ""
+        print(f"{name:<44} {before['median_s']:>11.4f} {result['median_s']:>11.4f} {change:>+8.1%}{flag}")
+        if flag:
+            regressions.append(name)
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--per-kind", type=int, default=5, help="Synthetic resumes of each kind")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Seconds the stub model takes per call")
+    parser.add_argument("--max-in-flight", type=int, default=8)
+    parser.add_argument("--only", action="append", help="Run benchmarks whose name contains this (repeatable)")
+    parser.add_argument("--out", help="Write the results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file from an earlier run")
+    parser.add_argument("--threshold", type=float, default=0.10, help="Slowdown counted as a regression (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    corpus = generate_corpus(args.per_kind, args.seed)
+    benchmarks = build_benchmarks(corpus, args.llm_latency, args.max_in_flight)
+    if args.only:
+        benchmarks = {name: bench for name, bench in benchmarks.items() if any(part in name for part in args.only)}
+
+    results = {
+        "meta": {
+            "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "git_revision": _git_revision(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "corpus": {"per_kind": args.per_kind, "seed": args.seed, "resumes": len(corpus)},
+            "repeat": args.repeat,
+            "llm_latency": args.llm_latency,
+            "max_in_flight": args.max_in_flight,
+        },
+        "benchmarks": {},
+    }
+
+    print(f"{'benchmark':<44} {'items':>6} {'median s':>10} {'min s':>10} {'ms/item':>9}")
+    for name, (function, items) in benchmarks.items():
+        runs = run_benchmark(function, args.repeat)
+        median = statistics.median(runs)
+        results["benchmarks"][name] = {
+            "items": items, "runs_s": runs, "median_s": median, "min_s": min(runs),
+            "per_item_ms": median / items * 1000 if items else None,
+        }
+        print(f"{name:<44} {items:>6} {median:>10.4f} {min(runs):>10.4f} {median / items * 1000:>9.3f}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"\nResults written to {args.out}")
+
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as f:
+            baseline = json.load(f)
+        if compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,149 @@
+"""
+Generates a reproducible corpus of synthetic resumes for the benchmarks.
+
+Usage:
+    python benchmarks/corpus.py path/to/corpus/ --per-kind 10 --seed 0
+
+Four kinds of PDF are produced, ``--per-kind`` of each:
+
+- ``text``: one page with a text layer.
+- ``multipage``: three pages with running headers and "Page i of n" footers.
+- ``scanned``: the multi-page layout rasterised into image-only pages (needs OCR).
+- ``large``: a long text resume of about ten pages.
+
+Resumes are built from the skills and job titles of the knowledge base, so
+skill matching and role ranking see realistic hits. The same seed always
+yields the same PDFs.
+"""
+import argparse
+import os
+import random
+import sys
+
+import fitz  # PyMuPDF
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from rezumex.knowledge import load_knowledge_base  # noqa: E402
+
+KINDS = {"text": 1, "multipage": 3, "scanned": 3, "large": 12}
+LINES_PER_PAGE = 48
+SCAN_DPI = 100
+
+FIRST_NAMES = ["Aarav", "Priya", "Liam", "Sofia", "Chen", "Fatima", "Noah", "Amara", "Mateo", "Yuki", "Olga", "Kwame"]
+LAST_NAMES = ["Sharma", "Nguyen", "Smith", "Garcia", "Okafor", "Kowalski", "Tanaka", "Haddad", "Silva", "Müller"]
+COMPANIES = ["Acme Corp", "Globex", "Initech", "Umbrella Labs", "Stark Industries", "Wayne Analytics", "Hooli", "Vandelay"]
+UNIVERSITIES = ["IIT Bombay", "MIT", "University of Toronto", "TU Munich", "NUS", "University of Lagos", "UC Berkeley"]
+DEGREES = ["B.Tech in Computer Science", "Master of Science in Data Science", "Bachelor of Engineering in IT",
+           "MBA in Technology Management", "PhD in Machine Learning"]
+VERBS = ["Built", "Designed", "Led", "Migrated", "Automated", "Optimised", "Shipped", "Maintained", "Scaled"]
+OBJECTS = ["a payments API", "the data pipeline", "an internal dashboard", "the recommendation service",
+           "CI/CD for 40 repositories", "a customer churn model", "the search backend", "a mobile onboarding flow"]
+OUTCOMES = ["cutting latency by {n}%", "serving {n}k requests per second", "saving ${n}k per year",
+            "raising conversion by {n}%", "for {n} enterprise customers", "with {n}% test coverage"]
+HOBBIES = ["Chess", "Trail running", "Photography", "Open-source contributions", "Cooking", "Robotics club mentor"]
+
+
+def resume_lines(rng, pages, skills, titles):
+    """
+    Returns the lines of one synthetic resume sized to fill about ``pages`` pages.
+    """
+    name = f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}"
+    lines = [name, f"{name.split()[0].lower()}@example.com | +1 555 {rng.randint(1000, 9999)} | linkedin.com/in/demo",
+             "Summary", f"{rng.choice(titles)} with {rng.randint(1, 15)} years of experience in "
+                        f"{', '.join(rng.sample(skills, 3))}.",
+             "Skills", ", ".join(rng.sample(skills, rng.randint(8, 16))), "Experience"]
+    budget = pages * LINES_PER_PAGE - 30
+    year = 2024
+    while budget > 0:
+        start = year - rng.randint(1, 4)
+        lines.append(f"{rng.choice(titles)}, {rng.choice(COMPANIES)} ({start}-{year})")
+        for _ in range(rng.randint(3, 6)):
+            outcome = rng.choice(OUTCOMES).format(n=rng.randint(5, 90))
+            lines.append(f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} using {rng.choice(skills)}, {outcome}")
+        budget -= 7
+        year = start
+    lines.append("Projects")
+    for _ in range(rng.randint(2, 4)):
+        lines.append(f"• {rng.choice(VERBS)} {rng.choice(OBJECTS)} with {' and '.join(rng.sample(skills, 2))}")
+    lines.append("Education")
+    lines.append(f"{rng.choice(DEGREES)}, {rng.choice(UNIVERSITIES)} ({year - 4}-{year})")
+    lines += ["Certifications", f"{rng.choice(skills)} Professional Certificate", "Hobbies", ", ".join(rng.sample(HOBBIES, 3))]
+    return lines
+
+
+def text_pdf(lines, header=None):
+    """
+    Lays ``lines`` out on as many A4 pages as needed; ``header`` adds running headers and page footers.
+    """
+    doc = fitz.open()
+    chunks = [lines[i:i + LINES_PER_PAGE] for i in range(0, len(lines), LINES_PER_PAGE)]
+    for number, chunk in enumerate(chunks, start=1):
+        page = doc.new_page()
+        if header:
+            page.insert_text((40, 30), header, fontsize=8)
+            page.insert_text((270, 820), f"Page {number} of {len(chunks)}", fontsize=8)
+        page.insert_textbox(fitz.Rect(40, 40, 555, 810), "\n".join(chunk), fontsize=9)
+    data = doc.tobytes(garbage=3, deflate=True, no_new_id=True)
+    doc.close()
+    return data
+
+
+def scanned_pdf(pdf_bytes, dpi=SCAN_DPI):
+    """
+    Rasterises every page of ``pdf_bytes`` into an image-only PDF, like a scanner would.
+    """
+    out = fitz.open()
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        for page in doc:
+            pixmap = page.get_pixmap(dpi=dpi, colorspace=fitz.csGRAY)
+            image_page = out.new_page(width=page.rect.width, height=page.rect.height)
+            image_page.insert_image(image_page.rect, pixmap=pixmap)
+    data = out.tobytes(garbage=3, deflate=True, no_new_id=True)
+    out.close()
+    return data
+
+
+def generate_corpus(per_kind=5, seed=0, kinds=tuple(KINDS)):
+    """
+    Builds the corpus in memory.
+
+    Args:
+        per_kind (int, optional): Resumes of each kind.
+        seed (int, optional): Seed of the text generator.
+        kinds (tuple, optional): Subset of ``KINDS`` to generate.
+
+    Returns:
+        list: One dict per resume with ``name``, ``kind``, ``text`` (the generated
+        text, i.e. the ground truth) and ``pdf`` (bytes).
+    """
+    rng = random.Random(seed)
+    knowledge_base = load_knowledge_base()
+    corpus = []
+    for kind in kinds:
+        for i in range(per_kind):
+            lines = resume_lines(rng, KINDS[kind], knowledge_base.skills, knowledge_base.job_titles)
+            pdf_bytes = text_pdf(lines, header=f"{lines[0]} — Resume" if KINDS[kind] > 1 else None)
+            if kind == "scanned":
+                pdf_bytes = scanned_pdf(pdf_bytes)
+            corpus.append({"name": f"{kind}_{i:03d}.pdf", "kind": kind, "text": "\n".join(lines), "pdf": pdf_bytes})
+    return corpus
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("out", help="Directory to write the PDFs into")
+    parser.add_argument("--per-kind", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    os.makedirs(args.out, exist_ok=True)
+    corpus = generate_corpus(args.per_kind, args.seed)
+    for resume in corpus:
+        with open(os.path.join(args.out, resume["name"]), "wb") as f:
+            f.write(resume["pdf"])
+    print(f"Wrote {len(corpus)} resumes to {args.out}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,6 @@
+"""
+Streamlit-free building blocks for RezumeX.
+
+``app.py`` is the Streamlit entry point; everything in this package can be
+imported without Streamlit so it can run in worker processes and batch jobs.
+"""
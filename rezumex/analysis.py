@@ -0,0 +1,148 @@
+"""
+Parsing of Gemini's resume analyses.
+
+In structured mode Gemini is asked for JSON matching ``ANALYSIS_SCHEMA`` (via
+``JSON_GENERATION_CONFIG``), which is parsed with one ``json.loads`` and
+validated into a ``ResumeAnalysis``. Free-text responses still go through the
+section regexes of ``extract_information``, which are now compiled once.
+"""
+import json
+import re
+from dataclasses import dataclass
+
+from rezumex.metrics import METRICS
+
+ANALYSIS_SECTIONS = ["ATS Score", "Experience", "Strengths", "Weaknesses", "Projects", "General Information", "Academic Details"]
+
+ANALYSIS_SCHEMA = {
+    "type": "object",
+    "properties": {
+        "ats_score": {"type": "integer", "description": "Percentage match of the resume against the job description, 0-100"},
+        "experience": {"type": "string"},
+        "strengths": {"type": "string"},
+        "weaknesses": {"type": "string"},
+        "projects": {"type": "string"},
+        "general_information": {"type": "string"},
+        "academic_details": {"type": "string"},
+    },
+    "required": ["ats_score", "experience", "strengths", "weaknesses", "projects", "general_information", "academic_details"],
+}
+
+JSON_GENERATION_CONFIG = {"response_mime_type": "application/json", "response_schema": ANALYSIS_SCHEMA}
+
+_PERCENT = re.compile(r"(\d+(?:\.\d+)?)\s*%?")
+_ATS_SCORE = re.compile(r"(?:ATS Score|Percentage Match)[^:\n]*:[\s*_]*(\d+(?:\.\d+)?)\s*%", re.IGNORECASE)
+_SECTION_PATTERNS = [
+    (
+        section,
+        re.compile(rf"\b{section}\s*:\s*(.*?)(?=\b(?:{'|'.join(ANALYSIS_SECTIONS[i + 1:] or ['END'])})\b|$)", re.DOTALL | re.IGNORECASE),
+        re.compile(rf"\b{section}\s*:\s*(.*)", re.DOTALL | re.IGNORECASE),
+    )
+    for i, section in enumerate(ANALYSIS_SECTIONS)
+]
+
+
+@dataclass
+class ResumeAnalysis:
+    """
+    Validated analysis of one resume.
+    """
+
+    ats_score: int
+    experience: str
+    strengths: str
+    weaknesses: str
+    projects: str
+    general_information: str
+    academic_details: str
+
+    @classmethod
+    def from_dict(cls, data):
+        """
+        Validates a decoded JSON object, coercing the score into 0-100.
+
+        Raises:
+            ValueError: If ``data`` is not an object or has no usable score.
+        """
+        if not isinstance(data, dict):
+            raise ValueError(f"expected a JSON object, got {type(data).__name__}")
+        score = data.get("ats_score")
+        if isinstance(score, str):
+            match = _PERCENT.search(score)
+            score = match.group(1) if match else None
+        if score is None:
+            raise ValueError("missing ats_score")
+
+        def text(key):
+            value = data.get(key)
+            if isinstance(value, list):
+                value = "\n".join(f"- {item}" for item in value)
+            return str(value).strip() if value else "Not Found"
+
+        return cls(
+            ats_score=max(0, min(100, int(round(float(score))))),
+            experience=text("experience"),
+            strengths=text("strengths"),
+            weaknesses=text("weaknesses"),
+            projects=text("projects"),
+            general_information=text("general_information"),
+            academic_details=text("academic_details"),
+        )
+
+    @classmethod
+    def from_json(cls, text):
+        """
+        Parses and validates a JSON response.
+        """
+        return cls.from_dict(json.loads(text))
+
+    def to_row(self):
+        """
+        Returns the analysis keyed by the section names used in the HR results table.
+        """
+        return dict(zip(ANALYSIS_SECTIONS, (
+            self.ats_score, self.experience, self.strengths, self.weaknesses,
+            self.projects, self.general_information, self.academic_details,
+        )))
+
+
+def extract_information(response):
+    """
+    Scrapes the analysis sections out of a free-text response (regex fallback).
+    """
+    extracted_data = {}
+    for section, pattern, fallback in _SECTION_PATTERNS:
+        match = pattern.search(response) or fallback.search(response)
+        extracted_data[section] = match.group(1).strip() if match else "Not Found"
+
+    match = re.search(r"(\d+)%", extracted_data["ATS Score"])
+    extracted_data["ATS Score"] = int(match.group(1)) if match else 0
+    return extracted_data
+
+
+def extract_ats_score(response):
+    """
+    Finds the "ATS Score: 85%" (or "Percentage Match: 85%") figure in a free-text analysis.
+
+    Returns:
+        float: The score, or 0.0 if none was found.
+    """
+    match = _ATS_SCORE.search(response or "")
+    return float(match.group(1)) if match else 0.0
+
+
+def parse_analysis(response):
+    """
+    Turns a Gemini response into a results-table row, preferring the JSON schema.
+
+    Args:
+        response (str): JSON produced with ``JSON_GENERATION_CONFIG``, or free text.
+
+    Returns:
+        dict: Section name to value, with "ATS Score" as an int.
+    """
+    try:
+        return ResumeAnalysis.from_json(response).to_row()
+    except (ValueError, TypeError):
+        METRICS.inc("rezumex_analysis_fallbacks_total")
+        return extract_information(response)
@@ -0,0 +1,220 @@
+"""
+Concurrent resume analysis for the HR dashboard.
+
+PDF parsing is CPU-bound and runs on a process pool; the Gemini calls are
+network-bound and run on a thread pool whose size caps how many requests are
+in flight at once. Results are yielded in completion order so the page can
+update its progress bar and results table as each resume lands.
+
+``analyze_batch`` pipelines both stages. When every resume has to be parsed
+before deciding which ones to analyse (keyword pre-screening), use
+``parse_batch`` followed by ``analyze_texts`` instead.
+
+``analyze_batch`` can also skip resumes whose text duplicates one already in
+the batch (see ``rezumex.dedup``); they are yielded with a copy of the
+original's result once it is available. With an ``ExtractionCache`` (see
+``rezumex.cache``), PDFs extracted before are not sent to the parsing pool.
+
+An analysis that still fails with a quota or overload error after the
+client's own retries goes back to the end of the queue (up to
+``MAX_REQUEUES`` times) instead of being dropped from the batch.
+"""
+import copy
+import multiprocessing
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+
+from rezumex.extraction import extract_document, pdf_to_text
+from rezumex.metrics import METRICS, STAGE_SECONDS
+from rezumex.ratelimit import is_retryable
+
+DEFAULT_MAX_IN_FLIGHT = int(os.getenv("REZUMEX_MAX_IN_FLIGHT", "8"))
+NO_TEXT_ERROR = "No text extracted"
+MAX_REQUEUES = int(os.getenv("REZUMEX_MAX_REQUEUES", "3"))
+
+
+def _parser_pool(documents, parse_workers):
+    parse_workers = parse_workers or min(len(documents), os.cpu_count() or 1)
+    # The Streamlit server is multi-threaded, so spawn fresh workers rather than forking it.
+    return ProcessPoolExecutor(max_workers=parse_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def _extract_timed(pdf_bytes):
+    # Runs in a parser process, whose metrics the caller never sees, so the timing travels back with the document
+    start = time.perf_counter()
+    document = extract_document(pdf_bytes)
+    return document, time.perf_counter() - start
+
+
+def _submit_parse(parsers, pdf_bytes, parse, extraction_cache):
+    # Returns a future resolving to the text; with a cache, hits resolve at once and misses extract whole documents
+    if extraction_cache is None:
+        return parsers.submit(parse, pdf_bytes)
+
+    text = Future()
+    document = extraction_cache.get(pdf_bytes)
+    if document is not None:
+        text.set_result(document["text"] or None)
+        return text
+
+    def store(extracted):
+        try:
+            document, seconds = extracted.result()
+        except BaseException as e:
+            text.set_exception(e)
+            return
+        METRICS.observe(STAGE_SECONDS, seconds, stage="extract")
+        METRICS.record_document(document)
+        extraction_cache.put(pdf_bytes, document)
+        text.set_result(document["text"] or None)
+
+    parsers.submit(_extract_timed, pdf_bytes).add_done_callback(store)
+    return text
+
+
+def _completed(pending):
+    # Yields (tag, future) pairs from ``pending`` as they finish; callers may add more while iterating
+    while pending:
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            yield pending.pop(future), future
+
+
+def analyze_batch(documents, analyze, max_in_flight=DEFAULT_MAX_IN_FLIGHT, parse_workers=None, parse=pdf_to_text,
+                  max_requeues=MAX_REQUEUES, dedupe=None, extraction_cache=None):
+    """
+    Parses and analyses resumes concurrently, yielding each result as it finishes.
+
+    Args:
+        documents (list): ``(filename, pdf_bytes)`` pairs.
+        analyze (callable): Takes the extracted resume text and returns its analysis.
+            It runs on a worker thread, so it must not call Streamlit.
+        max_in_flight (int, optional): Maximum number of concurrent ``analyze`` calls.
+        parse_workers (int, optional): Size of the PDF parsing process pool. Defaults to the CPU count.
+        parse (callable, optional): Picklable function turning PDF bytes into text.
+        max_requeues (int, optional): Times a rate-limited analysis is re-queued.
+        dedupe (callable, optional): ``dedupe(filename, text)`` returning the filename of an
+            earlier resume with the same text, or None. Duplicates are not analysed.
+        extraction_cache (ExtractionCache, optional): Reuses and stores extracted documents;
+            misses are extracted with ``extract_document`` instead of ``parse``.
+
+    Yields:
+        tuple: ``(filename, result, error)``; ``error`` is None on success and
+        ``result`` is None on failure.
+    """
+    if not documents:
+        return
+
+    parsers = _parser_pool(documents, parse_workers)
+    analysts = ThreadPoolExecutor(max_workers=max(1, max_in_flight))
+    try:
+        pending = {_submit_parse(parsers, pdf_bytes, parse, extraction_cache): ("parse", filename, None)
+                   for filename, pdf_bytes in documents}
+        requeues = {}
+        # Duplicates waiting for their original's analysis, and the analyses they can reuse
+        followers, finished = {}, {}
+        for (stage, filename, text), future in _completed(pending):
+            try:
+                value = future.result()
+            except Exception as e:
+                if stage == "analyze" and is_retryable(e) and requeues.get(filename, 0) < max_requeues:
+                    requeues[filename] = requeues.get(filename, 0) + 1
+                    pending[analysts.submit(analyze, text)] = ("analyze", filename, text)
+                    continue
+                result, error = None, str(e)
+            else:
+                if stage == "parse" and value:
+                    original = dedupe(filename, value) if dedupe else None
+                    if original is None:
+                        pending[analysts.submit(analyze, value)] = ("analyze", filename, value)
+                    elif original in finished:
+                        result, error = finished[original]
+                        yield filename, copy.copy(result), error
+                    else:
+                        followers.setdefault(original, []).append(filename)
+                    continue
+                result, error = (value, None) if stage == "analyze" else (None, NO_TEXT_ERROR)
+
+            if error:
+                METRICS.inc("rezumex_failures_total", stage=stage)
+            yield filename, result, error
+            if dedupe and stage == "analyze":
+                finished[filename] = (result, error)
+                for duplicate in followers.pop(filename, ()):
+                    yield duplicate, copy.copy(result), error
+    finally:
+        # Reached early when Streamlit reruns the script mid-batch; drop the queued work.
+        parsers.shutdown(wait=False, cancel_futures=True)
+        analysts.shutdown(wait=False, cancel_futures=True)
+
+
+def parse_batch(documents, parse_workers=None, parse=pdf_to_text, extraction_cache=None):
+    """
+    Extracts the text of many PDFs on a process pool.
+
+    Args:
+        documents (list): ``(filename, pdf_bytes)`` pairs.
+        parse_workers (int, optional): Size of the process pool. Defaults to the CPU count.
+        parse (callable, optional): Picklable function turning PDF bytes into text.
+        extraction_cache (ExtractionCache, optional): Reuses and stores extracted documents;
+            misses are extracted with ``extract_document`` instead of ``parse``.
+
+    Yields:
+        tuple: ``(filename, text, error)`` in completion order.
+    """
+    if not documents:
+        return
+
+    parsers = _parser_pool(documents, parse_workers)
+    try:
+        pending = {_submit_parse(parsers, pdf_bytes, parse, extraction_cache): filename
+                   for filename, pdf_bytes in documents}
+        for filename, future in _completed(pending):
+            try:
+                text = future.result()
+            except Exception as e:
+                METRICS.inc("rezumex_failures_total", stage="parse")
+                yield filename, None, str(e)
+                continue
+            if not text:
+                METRICS.inc("rezumex_failures_total", stage="parse")
+            yield (filename, text, None) if text else (filename, None, NO_TEXT_ERROR)
+    finally:
+        parsers.shutdown(wait=False, cancel_futures=True)
+
+
+def analyze_texts(texts, analyze, max_in_flight=DEFAULT_MAX_IN_FLIGHT, max_requeues=MAX_REQUEUES):
+    """
+    Analyses already-extracted resumes with at most ``max_in_flight`` concurrent calls.
+
+    Args:
+        texts (list): ``(filename, resume_text)`` pairs.
+        analyze (callable): Takes the resume text and returns its analysis (no Streamlit calls).
+        max_in_flight (int, optional): Maximum number of concurrent ``analyze`` calls.
+        max_requeues (int, optional): Times a rate-limited analysis is re-queued.
+
+    Yields:
+        tuple: ``(filename, result, error)`` in completion order.
+    """
+    if not texts:
+        return
+
+    analysts = ThreadPoolExecutor(max_workers=max(1, max_in_flight))
+    try:
+        pending = {analysts.submit(analyze, text): (filename, text) for filename, text in texts}
+        requeues = {}
+        for (filename, text), future in _completed(pending):
+            try:
+                result = future.result()
+            except Exception as e:
+                if is_retryable(e) and requeues.get(filename, 0) < max_requeues:
+                    requeues[filename] = requeues.get(filename, 0) + 1
+                    pending[analysts.submit(analyze, text)] = (filename, text)
+                else:
+                    METRICS.inc("rezumex_failures_total", stage="analyze")
+                    yield filename, None, str(e)
+                continue
+            yield filename, result, None
+    finally:
+        analysts.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,317 @@
+"""
+Persistent cache for LLM responses, and a cache of extracted PDF text.
+
+Responses are stored in SQLite keyed by a SHA-256 of everything that
+determines the answer (model name, prompt template, job description, resume
+text, ...), so re-running the same analysis costs no API quota. Entries expire
+after a TTL and the oldest-used entries are evicted once the cache is full.
+
+Extracted documents are keyed by the SHA-256 of the PDF bytes plus the
+extractor version, so a resume is parsed (and OCRed) once however many
+Streamlit reruns or batches it goes through. Documents with a page whose OCR
+failed are not stored, since the failure may be transient.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+
+from rezumex.metrics import METRICS
+
+DEFAULT_CACHE_PATH = os.getenv("REZUMEX_CACHE_PATH", os.path.join(".rezumex_cache", "llm_responses.sqlite3"))
+DEFAULT_TTL_SECONDS = int(os.getenv("REZUMEX_CACHE_TTL", str(7 * 24 * 3600)))
+DEFAULT_MAX_ENTRIES = int(os.getenv("REZUMEX_CACHE_MAX_ENTRIES", "5000"))
+# Extracted documents kept in memory per process; set the path to also keep them on disk
+EXTRACTION_CACHE_ENTRIES = int(os.getenv("REZUMEX_EXTRACTION_CACHE_ENTRIES", "256"))
+EXTRACTION_CACHE_PATH = os.getenv("REZUMEX_EXTRACTION_CACHE_PATH") or None
+EXTRACTION_CACHE_MAX_DISK_ENTRIES = int(os.getenv("REZUMEX_EXTRACTION_CACHE_MAX_DISK_ENTRIES", "5000"))
+
+
+def cache_key(*parts):
+    """
+    Hashes the inputs of an LLM call into a stable cache key.
+
+    Args:
+        *parts: JSON-serialisable values (model name, prompt, resume text, ...).
+
+    Returns:
+        str: Hex SHA-256 digest.
+    """
+    payload = json.dumps(parts, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """
+    SQLite-backed response store with TTL and size-based eviction.
+
+    A connection is opened per operation so one instance can be shared by the
+    batch engine's worker threads.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, ttl=DEFAULT_TTL_SECONDS, max_entries=DEFAULT_MAX_ENTRIES):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS responses ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " created_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed_at ON responses (accessed_at)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        """
+        Returns the cached value for ``key``, or None if missing or expired.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT value FROM responses WHERE key = ? AND created_at >= ?", (key, now - self.ttl)
+            ).fetchone()
+            if row:
+                conn.execute("UPDATE responses SET accessed_at = ? WHERE key = ?", (now, key))
+        with self._lock:
+            if row:
+                self.hits += 1
+            else:
+                self.misses += 1
+        METRICS.inc("rezumex_cache_lookups_total", cache="response", result="hit" if row else "miss")
+        return row[0] if row else None
+
+    def put(self, key, value):
+        """
+        Stores ``value`` under ``key`` and evicts expired and excess entries.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at, accessed_at) VALUES (?, ?, ?, ?)",
+                (key, value, now, now),
+            )
+            conn.execute("DELETE FROM responses WHERE created_at < ?", (now - self.ttl,))
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                " SELECT key FROM responses ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,),
+            )
+
+    def get_or_compute(self, parts, compute, validate=None):
+        """
+        Returns the cached response for ``parts``, calling ``compute()`` on a miss.
+
+        Args:
+            parts (tuple): Inputs that determine the response; see ``cache_key``.
+            compute (callable): Produces the response text when it is not cached.
+            validate (callable, optional): Takes a fresh response and returns False if it must
+                not be stored (e.g. truncated JSON), so the next call asks again.
+
+        Returns:
+            str: The cached or freshly computed response.
+        """
+        key = cache_key(*parts)
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            if value and (validate is None or validate(value)):
+                self.put(key, value)
+        return value
+
+    def get_or_stream(self, parts, stream):
+        """
+        Streaming counterpart of ``get_or_compute``.
+
+        Yields the cached response as a single chunk on a hit. On a miss it
+        yields the chunks of ``stream()`` as they arrive and stores the joined
+        text once the stream has completed.
+        """
+        key = cache_key(*parts)
+        value = self.get(key)
+        if value is not None:
+            yield value
+            return
+
+        chunks = []
+        for chunk in stream():
+            chunks.append(chunk)
+            yield chunk
+        if chunks:
+            self.put(key, "".join(chunks))
+
+    def stats(self):
+        """
+        Returns hit/miss counters for this process and the number of stored entries.
+        """
+        with self._connect() as conn:
+            entries = conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        with self._lock:
+            hits, misses = self.hits, self.misses
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
+
+    def clear(self):
+        """
+        Removes every stored response.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM responses")
+
+
+class ExtractionCache:
+    """
+    LRU cache of extracted PDF documents (text, per-page metadata, OCR flag).
+
+    Documents live in memory; when ``path`` is set they are also stored in
+    SQLite, so worker processes and restarts reuse them. Safe to share
+    between threads.
+
+    Args:
+        version (str): Extractor version (``rezumex.extraction.EXTRACTOR_VERSION``), part of every key.
+        max_entries (int, optional): Documents kept in memory.
+        path (str, optional): SQLite file for the on-disk copy. None keeps the cache in memory only.
+        max_disk_entries (int, optional): Documents kept on disk.
+    """
+
+    def __init__(self, version, max_entries=EXTRACTION_CACHE_ENTRIES, path=EXTRACTION_CACHE_PATH,
+                 max_disk_entries=EXTRACTION_CACHE_MAX_DISK_ENTRIES):
+        self.version = version
+        self.max_entries = max_entries
+        self.path = path
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.misses = 0
+        self._documents = OrderedDict()
+        self._lock = threading.Lock()
+        if path:
+            if os.path.dirname(path):
+                os.makedirs(os.path.dirname(path), exist_ok=True)
+            with self._connect() as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS documents ("
+                    " key TEXT PRIMARY KEY, value TEXT NOT NULL, accessed_at REAL NOT NULL)"
+                )
+                conn.execute("CREATE INDEX IF NOT EXISTS documents_accessed_at ON documents (accessed_at)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def key(self, pdf_bytes):
+        return cache_key(self.version, hashlib.sha256(pdf_bytes).hexdigest())
+
+    def _remember(self, key, document):
+        with self._lock:
+            self._documents[key] = document
+            self._documents.move_to_end(key)
+            while len(self._documents) > self.max_entries:
+                self._documents.popitem(last=False)
+
+    def get(self, pdf_bytes):
+        """
+        Returns the cached document for ``pdf_bytes``, or None.
+        """
+        key = self.key(pdf_bytes)
+        with self._lock:
+            document = self._documents.get(key)
+            if document is not None:
+                self._documents.move_to_end(key)
+        if document is None and self.path:
+            with self._connect() as conn:
+                row = conn.execute("SELECT value FROM documents WHERE key = ?", (key,)).fetchone()
+                if row:
+                    conn.execute("UPDATE documents SET accessed_at = ? WHERE key = ?", (time.time(), key))
+            if row:
+                document = json.loads(row[0])
+                self._remember(key, document)
+        with self._lock:
+            if document is not None:
+                self.hits += 1
+            else:
+                self.misses += 1
+        METRICS.inc("rezumex_cache_lookups_total", cache="extraction", result="hit" if document is not None else "miss")
+        return document
+
+    def put(self, pdf_bytes, document):
+        """
+        Stores the extracted ``document`` of ``pdf_bytes``.
+
+        Documents with an ``ocr_failed`` page are skipped: Tesseract may have been missing, slow or
+        killed, and caching the result would serve the failure until the entry is evicted.
+        """
+        if any(page["backend"] == "ocr_failed" for page in document["pages"]):
+            return
+        key = self.key(pdf_bytes)
+        self._remember(key, document)
+        if self.path:
+            with self._connect() as conn:
+                conn.execute(
+                    "INSERT OR REPLACE INTO documents (key, value, accessed_at) VALUES (?, ?, ?)",
+                    (key, json.dumps(document, ensure_ascii=False), time.time()),
+                )
+                conn.execute(
+                    "DELETE FROM documents WHERE key IN ("
+                    " SELECT key FROM documents ORDER BY accessed_at DESC LIMIT -1 OFFSET ?)",
+                    (self.max_disk_entries,),
+                )
+
+    def get_or_extract(self, pdf_bytes, extract):
+        """
+        Returns the cached document for ``pdf_bytes``, calling ``extract(pdf_bytes)`` on a miss.
+
+        Args:
+            pdf_bytes (bytes): The raw PDF file.
+            extract (callable): Extracts the document, e.g. ``rezumex.extraction.extract_document``.
+
+        Returns:
+            dict: ``text``, ``pages`` and ``ocr``, as returned by ``extract``.
+        """
+        document = self.get(pdf_bytes)
+        if document is None:
+            document = extract(pdf_bytes)
+            self.put(pdf_bytes, document)
+        return document
+
+    def stats(self):
+        """
+        Returns hit/miss counters for this process and the number of documents held in memory.
+        """
+        with self._lock:
+            hits, misses, entries = self.hits, self.misses, len(self._documents)
+        lookups = hits + misses
+        return {
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "entries": entries,
+        }
@@ -0,0 +1,205 @@
+"""
+Command-line entry point for bulk resume screening, without Streamlit.
+
+    python -m rezumex screen --jd jd.txt --resumes drops/ --out results.parquet --workers 4
+
+Resumes are parsed on a process pool and analysed concurrently exactly as on
+the HR dashboard (same prompt, same response cache). Each result is written
+to the output as soon as it lands, so a run that is interrupted keeps
+everything analysed so far. The exit status is 1 if any resume failed.
+``--backend local`` screens offline with the stand-in model of
+``rezumex.local_llm``.
+"""
+import argparse
+import csv
+import json
+import os
+import sys
+import time
+
+from rezumex.analysis import ANALYSIS_SECTIONS
+from rezumex.batch import DEFAULT_MAX_IN_FLIGHT, analyze_batch
+from rezumex.extraction import pdf_to_text
+from rezumex.llm import BACKENDS, create_client
+
+OUTPUT_COLUMNS = ["Filename"] + ANALYSIS_SECTIONS + ["Tokens Saved", "Error"]
+INTEGER_COLUMNS = ("ATS Score", "Tokens Saved")
+OUTPUT_FORMATS = ("csv", "jsonl", "parquet")
+PARQUET_ROW_GROUP_SIZE = 100
+
+
+class _CsvWriter:
+    def __init__(self, stream):
+        self.stream = stream
+        self.writer = csv.DictWriter(stream, fieldnames=OUTPUT_COLUMNS, extrasaction="ignore")
+        self.writer.writeheader()
+
+    def write(self, record):
+        self.writer.writerow(record)
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class _JsonlWriter:
+    def __init__(self, stream):
+        self.stream = stream
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.stream.flush()
+
+    def close(self):
+        pass
+
+
+class _ParquetWriter:
+    # Buffers records into row groups; rows already flushed survive an interrupted run
+    def __init__(self, path):
+        try:
+            import pyarrow as pa
+            import pyarrow.parquet as pq
+        except ImportError:
+            raise SystemExit("Parquet output needs pyarrow: pip install pyarrow")
+
+        self.pa = pa
+        self.schema = pa.schema(
+            [(column, pa.int64() if column in INTEGER_COLUMNS else pa.string()) for column in OUTPUT_COLUMNS]
+        )
+        self.writer = pq.ParquetWriter(path, self.schema)
+        self.rows = []
+
+    def write(self, record):
+        self.rows.append({column: record.get(column) for column in OUTPUT_COLUMNS})
+        if len(self.rows) >= PARQUET_ROW_GROUP_SIZE:
+            self._flush()
+
+    def _flush(self):
+        if self.rows:
+            self.writer.write_table(self.pa.Table.from_pylist(self.rows, schema=self.schema))
+            self.rows = []
+
+    def close(self):
+        self._flush()
+        self.writer.close()
+
+
+def open_writer(out, output_format=None):
+    """
+    Opens a streaming writer for ``out`` ("-" for stdout).
+
+    Args:
+        out (str): Output path.
+        output_format (str, optional): One of ``OUTPUT_FORMATS``; inferred from the extension by default.
+
+    Returns:
+        tuple: ``(writer, stream)``; close the writer, then the stream (None for Parquet).
+    """
+    if output_format is None:
+        extension = os.path.splitext(out)[1].lower().lstrip(".")
+        output_format = extension if extension in OUTPUT_FORMATS else "jsonl"
+    if output_format == "parquet":
+        if out == "-":
+            raise SystemExit("Parquet output needs a file path")
+        return _ParquetWriter(out), None
+
+    stream = sys.stdout if out == "-" else open(out, "w", newline="", encoding="utf-8")
+    writer = _CsvWriter(stream) if output_format == "csv" else _JsonlWriter(stream)
+    return writer, (None if out == "-" else stream)
+
+
+def find_resumes(paths):
+    """
+    Expands files and directories (non-recursively) into sorted PDF paths.
+    """
+    resumes = []
+    for path in paths:
+        if os.path.isdir(path):
+            resumes.extend(sorted(
+                os.path.join(path, name) for name in os.listdir(path) if name.lower().endswith(".pdf")
+            ))
+        else:
+            resumes.append(path)
+    return resumes
+
+
+def pdf_file_to_text(path):
+    """
+    Reads a PDF from disk and extracts its text; picklable for the parser process pool.
+    """
+    with open(path, "rb") as f:
+        return pdf_to_text(f.read())
+
+
+def screen(args):
+    from dotenv import load_dotenv
+
+    from rezumex.cache import ResponseCache
+    from rezumex.screening import analyze_resume
+
+    load_dotenv()
+    if args.jd == "-":
+        job_description = sys.stdin.read()
+    else:
+        with open(args.jd, encoding="utf-8") as f:
+            job_description = f.read()
+    if not job_description.strip():
+        raise SystemExit("The job description is empty")
+
+    resumes = find_resumes(args.resumes)
+    if not resumes:
+        raise SystemExit("No PDF resumes found")
+
+    llm = create_client(args.backend)
+    cache = None if args.no_cache else ResponseCache()
+
+    def analyze(resume_text):
+        return analyze_resume(llm, cache, resume_text, job_description, structured=not args.free_text)
+
+    started = time.perf_counter()
+    failures = 0
+    writer, stream = open_writer(args.out, args.format)
+    try:
+        # Resumes travel as paths; the parser processes read the files themselves
+        results = analyze_batch([(path, path) for path in resumes], analyze, max_in_flight=args.max_in_flight,
+                                parse_workers=args.workers, parse=pdf_file_to_text)
+        for i, (filename, row, error) in enumerate(results, start=1):
+            writer.write(dict({"Filename": filename}, **(row or {}), Error=error))
+            if error:
+                failures += 1
+            if error or not args.quiet:
+                outcome = f"error: {error}" if error else f"ATS {row.get('ATS Score')}%, {row.get('Tokens Saved')} tokens saved"
+                print(f"[{i}/{len(resumes)}] {filename}: {outcome}", file=sys.stderr)
+    finally:
+        writer.close()
+        if stream:
+            stream.close()
+
+    if not args.quiet:
+        print(f"Screened {len(resumes)} resumes ({failures} failed) in {time.perf_counter() - started:.1f}s",
+              file=sys.stderr)
+    return 1 if failures else 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m rezumex", description="RezumeX command-line tools.")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    screen_parser = commands.add_parser("screen", help="Screen a batch of resumes against a job description")
+    screen_parser.add_argument("--jd", required=True, help="Job description text file ('-' for stdin)")
+    screen_parser.add_argument("--resumes", required=True, nargs="+", help="PDF files and/or directories of PDFs")
+    screen_parser.add_argument("--out", default="-", help="Output file (.csv, .jsonl or .parquet); stdout by default")
+    screen_parser.add_argument("--format", choices=OUTPUT_FORMATS, help="Output format (default: from --out)")
+    screen_parser.add_argument("--workers", type=int, default=None, help="PDF parsing processes (default: CPU count)")
+    screen_parser.add_argument("--max-in-flight", type=int, default=DEFAULT_MAX_IN_FLIGHT,
+                               help="Concurrent Gemini requests")
+    screen_parser.add_argument("--free-text", action="store_true", help="Request free text instead of JSON")
+    screen_parser.add_argument("--no-cache", action="store_true", help="Bypass the response cache")
+    screen_parser.add_argument("--backend", choices=BACKENDS,
+                               help="LLM backend; 'local' answers offline (default: REZUMEX_LLM_BACKEND or gemini)")
+    screen_parser.add_argument("--quiet", action="store_true", help="Only report errors")
+    screen_parser.set_defaults(handler=screen)
+
+    args = parser.parse_args(argv)
+    return args.handler(args)
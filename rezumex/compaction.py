@@ -0,0 +1,204 @@
+"""
+Resume text compaction before it is sent to Gemini.
+
+Extracted text carries a lot that costs tokens without informing the
+analysis: runs of whitespace, page headers and footers repeated on every
+page (pages are separated by form feeds, see ``rezumex.extraction``),
+"Page 2 of 3" markers, bullet glyphs and OCR debris. ``compact_resume``
+normalises the text, removes that boilerplate and, if the resume is still
+over the token budget, trims the least useful sections first. Experience,
+Projects and Academic Details, which the HR analysis reports on, are only
+shortened once everything else has been trimmed.
+
+Compaction is idempotent, so compacting an already compacted resume returns
+it unchanged (and hits the same response-cache entries).
+"""
+import os
+import re
+import unicodedata
+from collections import Counter
+
+from rezumex.metrics import METRICS
+from rezumex.ratelimit import estimate_tokens
+
+RESUME_TOKEN_BUDGET = int(os.getenv("REZUMEX_RESUME_TOKEN_BUDGET", "3000"))
+
+# Section kinds by heading; the first matching pattern wins
+SECTION_HEADINGS = [
+    ("experience", r"(?:work |professional |relevant )?experience|employment(?: history)?|work history|career history"
+                   r"|internships?"),
+    ("projects", r"(?:personal |academic |key |selected )?projects?"),
+    ("academic", r"education(?:al qualifications?)?|academic(?:s| details| background| qualifications?)?"
+                 r"|qualifications?"),
+    ("skills", r"(?:technical |key |core )?skills(?: summary)?|core competencies|technologies|tools"),
+    ("summary", r"(?:professional |career )?(?:summary|profile|objective)|about me"),
+    ("certifications", r"certifications?|courses|trainings?|licen[cs]es"),
+    ("achievements", r"achievements|awards|honou?rs|publications|(?:extra[- ]?curricular )?activities"
+                     r"|volunteer(?:ing)?(?: experience)?|leadership"),
+    ("personal", r"personal (?:details|information)|hobbies|interests|languages|references|declaration"),
+]
+# Trimmed first to last; "header" is whatever precedes the first heading (name, contact details)
+TRIM_ORDER = ["personal", "achievements", "certifications", "summary", "header", "skills"]
+PROTECTED_SECTIONS = ("experience", "projects", "academic")
+
+_HEADING = [(kind, re.compile(rf"^\W*(?:{pattern})\W*$", re.IGNORECASE)) for kind, pattern in SECTION_HEADINGS]
+_PAGE_MARKER = re.compile(r"^(?:page\s*)?\d{1,3}(?:\s*(?:of|/)\s*\d{1,3})?$|^-\s*\d{1,3}\s*-$", re.IGNORECASE)
+# Only glyphs followed by whitespace, so "-5% churn" keeps its sign
+_BULLET = re.compile(r"^[•●▪◦■□‣∙·*–—>\-]+\s+")
+_SPACES = re.compile(r"[ \t\u00a0\u2000-\u200b\u202f\u3000]+")
+_ALNUM = re.compile(r"[^\W_]", re.UNICODE)
+MAX_HEADING_CHARS = 40
+# Lines at the top and at the bottom of a page where running headers and footers sit
+RUNNING_LINE_ZONE = 2
+
+
+def _is_noise(line):
+    # Lines that are mostly symbols: OCR debris, rules drawn with dashes or underscores
+    visible = line.replace(" ", "")
+    alnum = len(_ALNUM.findall(visible))
+    return alnum == 0 or (len(visible) > 3 and alnum / len(visible) < 0.5)
+
+
+def _heading_kind(line):
+    if len(line) > MAX_HEADING_CHARS:
+        return None
+    for kind, pattern in _HEADING:
+        if pattern.match(line):
+            return kind
+    return None
+
+
+def _strip_bullets(line):
+    # Nested markers ("- - item") come off one at a time, so a second pass finds nothing left
+    stripped = _BULLET.sub("", line)
+    while stripped != line:
+        line, stripped = stripped, _BULLET.sub("", stripped)
+    return line
+
+
+def _page_lines(page):
+    lines = []
+    for raw in page.splitlines():
+        line = _strip_bullets(_SPACES.sub(" ", raw).strip())
+        if line and not _PAGE_MARKER.match(line) and not _is_noise(line):
+            lines.append(line)
+    return lines
+
+
+def clean_lines(text):
+    """
+    Normalises ``text`` into its informative lines.
+
+    Unicode is NFKC-normalised (ligatures, full-width characters), whitespace
+    runs are collapsed, bullet glyphs dropped, and page markers, symbol-only
+    OCR debris and blank lines removed. A line found at the top or bottom of
+    two or more pages is a running header or footer and is kept only where it
+    first appears; other repeated lines (the same job title under two
+    employers) are kept.
+
+    Returns:
+        list: The remaining lines, in order.
+    """
+    pages = [_page_lines(page) for page in unicodedata.normalize("NFKC", text or "").split("\f")]
+
+    def at_edge(lines, i):
+        return i < RUNNING_LINE_ZONE or i >= len(lines) - RUNNING_LINE_ZONE
+
+    edges = Counter()
+    for lines in pages:
+        edges.update({line.casefold() for i, line in enumerate(lines) if at_edge(lines, i)})
+    running = {key for key, count in edges.items() if count > 1}
+
+    cleaned, seen = [], set()
+    for lines in pages:
+        for i, line in enumerate(lines):
+            key = line.casefold()
+            if key in running and at_edge(lines, i):
+                if key in seen:
+                    continue
+                seen.add(key)
+            cleaned.append(line)
+    return cleaned
+
+
+def split_sections(lines):
+    """
+    Groups lines under the section heading they follow.
+
+    Returns:
+        list: ``[kind, heading, body_lines]`` lists; the lines before the first
+        heading form a ``"header"`` section with no heading.
+    """
+    sections = [["header", None, []]]
+    for line in lines:
+        kind = _heading_kind(line)
+        if kind:
+            sections.append([kind, line, []])
+        else:
+            sections[-1][2].append(line)
+    return sections
+
+
+def _join(sections):
+    lines = []
+    for _, heading, body in sections:
+        if body:
+            lines.extend(([heading] if heading else []) + body)
+    return "\n".join(lines)
+
+
+def _pop_line(section):
+    # Removes the last line of a section; returns how many characters the joined text loses
+    _, heading, body = section
+    removed = len(body.pop()) + 1
+    if not body and heading:
+        removed += len(heading) + 1
+    return removed
+
+
+def _trim(sections, token_budget):
+    # Drops lines from the end of sections, least useful kinds first, then the longest protected section
+    max_chars = 4 * token_budget + 3  # the largest text estimate_tokens counts as token_budget
+    chars = len(_join(sections))
+    for kind in TRIM_ORDER:
+        for section in reversed([section for section in sections if section[0] == kind]):
+            while section[2] and chars > max_chars:
+                chars -= _pop_line(section)
+    protected = [section for section in sections if section[0] in PROTECTED_SECTIONS and section[2]]
+    while protected and chars > max_chars:
+        longest = max(protected, key=lambda section: sum(len(line) for line in section[2]))
+        chars -= _pop_line(longest)
+        protected = [section for section in protected if section[2]]
+
+
+def compact_resume(resume_text, token_budget=RESUME_TOKEN_BUDGET):
+    """
+    Cleans a resume and trims it to ``token_budget`` estimated tokens.
+
+    Args:
+        resume_text (str): Extracted resume text.
+        token_budget (int, optional): Target size; None only cleans the text.
+
+    Returns:
+        dict: ``text`` (the compacted resume), ``tokens_before``,
+        ``tokens_after``, ``tokens_saved`` and ``trimmed`` (True if whole lines
+        had to be dropped to meet the budget).
+    """
+    with METRICS.timer("compact"):
+        tokens_before = estimate_tokens(resume_text or "")
+        lines = clean_lines(resume_text)
+        text = "\n".join(lines)
+        trimmed = False
+        if token_budget is not None and estimate_tokens(text) > token_budget:
+            sections = split_sections(lines)
+            _trim(sections, token_budget)
+            text, trimmed = _join(sections), True
+
+    tokens_after = estimate_tokens(text)
+    return {
+        "text": text,
+        "tokens_before": tokens_before,
+        "tokens_after": tokens_after,
+        "tokens_saved": max(0, tokens_before - tokens_after),
+        "trimmed": trimmed,
+    }
@@ -0,0 +1,168 @@
+"""
+Duplicate detection for resumes uploaded in one screening batch.
+
+Resumes are compared in two stages. PDF bytes are hashed before anything is
+parsed, which catches the same file uploaded twice under different names.
+Once text has been extracted, the normalised text is hashed (re-exports of the
+same document), and a 64-bit SimHash over word shingles catches
+near-duplicates (a re-exported PDF with slightly different line breaks, a
+fixed typo). SimHashes are indexed by bands, so each lookup only compares
+against the few resumes that share a band instead of the whole batch.
+
+Only the first copy of a resume is analysed; its duplicates reuse the result.
+"""
+import copy
+import hashlib
+import os
+import re
+
+import numpy as np
+
+# Fingerprints at most this many bits apart (out of 64) are near-duplicates: a few edited words
+# typically move a resume 2-6 bits, unrelated resumes sit around 32 bits apart
+SIMHASH_MAX_DISTANCE = int(os.getenv("REZUMEX_DUPLICATE_MAX_DISTANCE", "6"))
+SIMHASH_BITS = 64
+SHINGLE_SIZE = 3
+
+IDENTICAL_FILE = "identical file"
+IDENTICAL_TEXT = "identical text"
+NEAR_DUPLICATE = "near-duplicate"
+
+_WORD = re.compile(r"[a-z0-9]+")
+
+
+def normalize_text(text):
+    """
+    Lower-cases ``text`` and reduces it to its words, so layout, punctuation
+    and whitespace differences between exports do not matter.
+    """
+    return " ".join(_WORD.findall((text or "").lower()))
+
+
+def simhash(text):
+    """
+    Computes the 64-bit SimHash of ``text`` over its word shingles.
+
+    Args:
+        text (str): Normalised text (see ``normalize_text``).
+
+    Returns:
+        int: The fingerprint; similar texts differ in few bits.
+    """
+    words = text.split()
+    shingles = {" ".join(words[i:i + SHINGLE_SIZE]) for i in range(max(1, len(words) - SHINGLE_SIZE + 1))}
+    hashes = np.array([hashlib.blake2b(shingle.encode("utf-8"), digest_size=8).digest() for shingle in shingles])
+    # One row of 64 bits per shingle; each bit of the fingerprint is a majority vote
+    bits = np.unpackbits(np.frombuffer(hashes.tobytes(), dtype=np.uint8).reshape(len(shingles), 8), axis=1,
+                         bitorder="little")
+    votes = bits.sum(axis=0) * 2 > len(shingles)
+    return sum(1 << int(bit) for bit in np.flatnonzero(votes))
+
+
+class Deduplicator:
+    """
+    Remembers the first copy of every resume in a batch and maps later copies to it.
+
+    Args:
+        max_distance (int, optional): Largest SimHash distance still treated as a near-duplicate.
+    """
+
+    def __init__(self, max_distance=SIMHASH_MAX_DISTANCE):
+        self.max_distance = max_distance
+        # Two fingerprints within max_distance bits agree on at least one of max_distance + 1 bands
+        bands = max_distance + 1
+        width = SIMHASH_BITS // bands
+        self._bands = [(i * width, SIMHASH_BITS if i == bands - 1 else (i + 1) * width) for i in range(bands)]
+        self._band_index = [{} for _ in self._bands]
+        self._by_bytes = {}
+        self._by_text = {}
+        # Duplicate filename -> (original filename, reason)
+        self.duplicates = {}
+
+    def _record(self, filename, original, reason):
+        self.duplicates[filename] = (original, reason)
+        return original
+
+    def _band_keys(self, fingerprint):
+        for start, end in self._bands:
+            yield (fingerprint >> start) & ((1 << (end - start)) - 1)
+
+    def check_bytes(self, filename, pdf_bytes):
+        """
+        Returns the filename of an earlier upload with the same bytes, or None
+        (and remembers ``filename`` as an original).
+        """
+        digest = hashlib.sha256(pdf_bytes).hexdigest()
+        original = self._by_bytes.setdefault(digest, filename)
+        return self._record(filename, original, IDENTICAL_FILE) if original != filename else None
+
+    def check_text(self, filename, text):
+        """
+        Returns the filename of an earlier resume with the same or nearly the
+        same text, or None (and remembers ``filename`` as an original).
+        """
+        normalized = normalize_text(text)
+        if not normalized:
+            return None
+
+        digest = hashlib.sha256(normalized.encode("utf-8")).hexdigest()
+        original = self._by_text.setdefault(digest, filename)
+        if original != filename:
+            return self._record(filename, original, IDENTICAL_TEXT)
+
+        fingerprint = simhash(normalized)
+        keys = list(self._band_keys(fingerprint))
+        for index, key in zip(self._band_index, keys):
+            for other, other_fingerprint in index.get(key, ()):
+                if bin(fingerprint ^ other_fingerprint).count("1") <= self.max_distance:
+                    return self._record(filename, other, NEAR_DUPLICATE)
+        for index, key in zip(self._band_index, keys):
+            index.setdefault(key, []).append((filename, fingerprint))
+        return None
+
+    def unique_documents(self, documents):
+        """
+        Filters ``(filename, pdf_bytes)`` pairs down to the first copy of each file.
+        """
+        return [(filename, pdf_bytes) for filename, pdf_bytes in documents if not self.check_bytes(filename, pdf_bytes)]
+
+    def unique_texts(self, texts):
+        """
+        Filters ``(filename, text)`` pairs down to the first copy of each (near-)identical text.
+        """
+        return [(filename, text) for filename, text in texts if not self.check_text(filename, text)]
+
+    def original(self, filename):
+        """
+        Returns the filename whose analysis ``filename`` reuses (itself if it is not a duplicate).
+        """
+        while filename in self.duplicates:
+            filename = self.duplicates[filename][0]
+        return filename
+
+    def copies(self):
+        """
+        Returns ``{original filename: [duplicate filenames]}`` for the duplicates found so far.
+        """
+        copies = {}
+        for filename in self.duplicates:
+            copies.setdefault(self.original(filename), []).append(filename)
+        return copies
+
+
+def with_duplicates(results, copies):
+    """
+    Passes ``(filename, result, error)`` tuples through, followed by one copy
+    for each duplicate of that file.
+
+    Args:
+        results (iterable): Results of the unique resumes.
+        copies (dict): Original filename to duplicate filenames (``Deduplicator.copies()``).
+
+    Yields:
+        tuple: ``(filename, result, error)``; duplicates get their own copy of the result dict.
+    """
+    for filename, result, error in results:
+        yield filename, result, error
+        for duplicate in copies.get(filename, ()):
+            yield duplicate, copy.copy(result), error
@@ -0,0 +1,118 @@
+"""
+PDF text extraction shared by the Streamlit pages and the batch engine.
+
+Every page goes through the fastest backend first (PyMuPDF's text layer) and
+only pages that come back (nearly) empty while carrying images are sent to
+OCR (see ``rezumex.ocr``), so one scanned page no longer forces OCR of the
+whole document. pypdf is kept as a fallback for files PyMuPDF refuses to open.
+
+Nothing in here calls Streamlit, so these functions can run in worker processes.
+"""
+import io
+
+import fitz  # PyMuPDF
+from pypdf import PdfReader
+
+from rezumex.ocr import OCR_DPI, ocr_image, ocr_pages
+
+# Bump whenever a change could alter the extracted text (cache keys include it)
+EXTRACTOR_VERSION = "4"
+
+# Pages with fewer characters than this in their text layer are treated as scanned
+MIN_PAGE_CHARS = 20
+
+
+def _needs_ocr(text, min_chars):
+    return len(text.strip()) < min_chars
+
+
+def _extract_pages_pymupdf(pdf_bytes, ocr, min_chars):
+    with fitz.open(stream=pdf_bytes, filetype="pdf") as doc:
+        pages = [{"page": page.number + 1, "backend": "pymupdf", "text": page.get_text()} for page in doc]
+        if not ocr:
+            return pages
+
+        # Blank pages have no images either; only scans are worth OCRing
+        scanned = [i for i, page in enumerate(pages) if _needs_ocr(page["text"], min_chars) and doc[i].get_images()]
+        if scanned:
+            recognised = ocr_pages(doc, scanned)
+            for i in scanned:
+                if i not in recognised:
+                    pages[i]["backend"] = "ocr_skipped"
+                elif recognised[i] is None:
+                    pages[i]["backend"] = "ocr_failed"
+                else:
+                    pages[i].update(backend="ocr", text=recognised[i])
+    return pages
+
+
+def _extract_pages_pypdf(pdf_bytes, ocr, min_chars):
+    pages = []
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    for number, page in enumerate(reader.pages, start=1):
+        try:
+            text = page.extract_text() or ""
+        except Exception:
+            text = ""
+        backend = "pypdf"
+        if ocr and _needs_ocr(text, min_chars):
+            try:
+                from pdf2image import convert_from_bytes
+
+                image = convert_from_bytes(pdf_bytes, dpi=OCR_DPI, first_page=number, last_page=number)[0]
+                text = ocr_image(image)
+                backend = "ocr"
+            except Exception:
+                backend = "ocr_failed"
+        pages.append({"page": number, "backend": backend, "text": text})
+    return pages
+
+
+def extract_pages(pdf_bytes, ocr=True, min_chars=MIN_PAGE_CHARS):
+    """
+    Extracts text page by page, choosing the backend for each page.
+
+    Args:
+        pdf_bytes (bytes): The raw PDF file.
+        ocr (bool, optional): Whether scanned pages may be OCRed. Defaults to True.
+        min_chars (int, optional): Text-layer length below which a page counts as scanned.
+
+    Returns:
+        list: One dict per page with ``page`` (1-based), ``backend`` (``pymupdf``,
+        ``pypdf``, ``ocr``, ``ocr_failed`` or ``ocr_skipped`` once enough text
+        was recovered) and ``text``.
+    """
+    try:
+        return _extract_pages_pymupdf(pdf_bytes, ocr, min_chars)
+    except RuntimeError:  # includes fitz.FileDataError for files PyMuPDF cannot open
+        return _extract_pages_pypdf(pdf_bytes, ocr, min_chars)
+
+
+def extract_document(pdf_bytes, ocr=True):
+    """
+    Extracts the text of a PDF along with per-page metadata.
+
+    Returns:
+        dict: ``text`` (all pages, separated by form feeds), ``pages`` (``page``, ``backend`` and
+        ``chars`` for each page) and ``ocr`` (True if any page was OCRed).
+    """
+    pages = extract_pages(pdf_bytes, ocr=ocr)
+    return {
+        # "\f" marks page breaks (as in pdftotext) and is a line break to splitlines() and \s
+        "text": "\f".join(page["text"] for page in pages).strip(),
+        "pages": [{"page": page["page"], "backend": page["backend"], "chars": len(page["text"])} for page in pages],
+        "ocr": any(page["backend"] == "ocr" for page in pages),
+    }
+
+
+def pdf_to_text(pdf_bytes):
+    """
+    Extracts the text of a PDF, OCRing scanned pages.
+
+    Args:
+        pdf_bytes (bytes): The raw PDF file.
+
+    Returns:
+        str: The extracted text, or None if nothing could be recovered.
+    """
+    return extract_document(pdf_bytes)["text"] or None
@@ -0,0 +1,411 @@
+"""
+Durable background screening jobs.
+
+A job (job description, prompt and a batch of PDFs) is written to a SQLite
+queue with one task per resume. Worker processes claim tasks under a lease,
+parse and analyse them, and checkpoint each result as it completes, so a run
+keeps going when the browser tab closes and picks up where it left off after
+a restart: a task whose worker died is claimed again once its lease expires.
+Workers renew the lease while a task runs, and a result is only recorded by
+the worker that still holds it. Each worker publishes its metrics to the
+shared file that the app merges (see ``rezumex.metrics``).
+
+Workers are started by the Streamlit app (``REZUMEX_JOB_WORKERS``) or run on
+their own::
+
+    python -m rezumex.jobs --workers 2 --threads 8
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from rezumex.cache import ExtractionCache, ResponseCache
+from rezumex.metrics import METRICS, SharedMetrics, start_publisher
+from rezumex.ratelimit import GEMINI_RPM, RateLimiter, is_retryable
+from rezumex.screening import analyze_resume
+
+DEFAULT_JOBS_PATH = os.getenv("REZUMEX_JOBS_PATH", os.path.join(".rezumex_cache", "jobs.sqlite3"))
+DEFAULT_WORKERS = int(os.getenv("REZUMEX_JOB_WORKERS", "1"))
+DEFAULT_WORKER_THREADS = int(os.getenv("REZUMEX_JOB_THREADS", "8"))
+LEASE_SECONDS = float(os.getenv("REZUMEX_JOB_LEASE", "300"))
+MAX_ATTEMPTS = int(os.getenv("REZUMEX_JOB_MAX_ATTEMPTS", "3"))
+POLL_INTERVAL_SECONDS = 1.0
+
+TASK_STATES = ("pending", "running", "done", "failed", "cancelled")
+
+
+class JobQueue:
+    """
+    SQLite-backed queue of screening jobs and their per-resume tasks.
+
+    Like ``ResponseCache``, a connection is opened per operation so one
+    instance can be shared by threads, and any number of processes may use the
+    same database file.
+    """
+
+    def __init__(self, path=DEFAULT_JOBS_PATH, lease_seconds=LEASE_SECONDS, max_attempts=MAX_ATTEMPTS):
+        self.path = path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY, created_at REAL NOT NULL, name TEXT,"
+                " job_description TEXT NOT NULL, prompt TEXT NOT NULL, generation_config TEXT NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS tasks ("
+                " id INTEGER PRIMARY KEY AUTOINCREMENT, job_id TEXT NOT NULL, filename TEXT NOT NULL,"
+                " pdf BLOB, status TEXT NOT NULL DEFAULT 'pending', attempts INTEGER NOT NULL DEFAULT 0,"
+                " lease_expires_at REAL, result TEXT, error TEXT, updated_at REAL NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS tasks_status ON tasks (status, id)")
+            conn.execute("CREATE INDEX IF NOT EXISTS tasks_job ON tasks (job_id)")
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def submit(self, job_description, documents, prompt, generation_config=None, name=None):
+        """
+        Queues a screening job.
+
+        Args:
+            job_description (str): The job posting.
+            documents (list): ``(filename, pdf_bytes)`` pairs.
+            prompt (str): Analysis instructions (e.g. ``input_prompt3``).
+            generation_config (dict, optional): Passed to every Gemini call.
+            name (str, optional): Label shown in the dashboard.
+
+        Returns:
+            str: The job id.
+        """
+        job_id = uuid.uuid4().hex[:12]
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute(
+                "INSERT INTO jobs (id, created_at, name, job_description, prompt, generation_config)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (job_id, now, name, job_description, prompt, json.dumps(generation_config or {})),
+            )
+            conn.executemany(
+                "INSERT INTO tasks (job_id, filename, pdf, updated_at) VALUES (?, ?, ?, ?)",
+                [(job_id, filename, pdf_bytes, now) for filename, pdf_bytes in documents],
+            )
+        return job_id
+
+    def get_job(self, job_id):
+        """
+        Returns the job's settings as a dict, or None if it does not exist.
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT id, created_at, name, job_description, prompt, generation_config FROM jobs WHERE id = ?",
+                (job_id,),
+            ).fetchone()
+        if not row:
+            return None
+        return {
+            "id": row[0],
+            "created_at": row[1],
+            "name": row[2],
+            "job_description": row[3],
+            "prompt": row[4],
+            "generation_config": json.loads(row[5]),
+        }
+
+    def claim(self):
+        """
+        Leases the oldest runnable task: a pending one, or a running one whose worker let the lease expire.
+
+        Tasks that have already been claimed ``max_attempts`` times are marked failed instead
+        of being handed out again, so a resume that crashes its worker cannot stall the queue.
+
+        Returns:
+            dict: ``{"id", "job_id", "filename", "pdf", "attempts"}``, or None if nothing is runnable.
+            ``attempts`` identifies this lease in ``renew``, ``complete`` and ``fail``.
+        """
+        now = time.time()
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            while True:
+                row = conn.execute(
+                    "SELECT id, job_id, filename, pdf, attempts FROM tasks"
+                    " WHERE status = 'pending' OR (status = 'running' AND lease_expires_at < ?)"
+                    " ORDER BY id LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if not row:
+                    return None
+                if row[4] >= self.max_attempts:
+                    conn.execute(
+                        "UPDATE tasks SET status = 'failed', error = ?, pdf = NULL, updated_at = ? WHERE id = ?",
+                        (f"Gave up after {row[4]} attempts", now, row[0]),
+                    )
+                    continue
+                conn.execute(
+                    "UPDATE tasks SET status = 'running', attempts = attempts + 1, lease_expires_at = ?, updated_at = ?"
+                    " WHERE id = ?",
+                    (now + self.lease_seconds, now, row[0]),
+                )
+                return {"id": row[0], "job_id": row[1], "filename": row[2], "pdf": row[3], "attempts": row[4] + 1}
+
+    def renew(self, task_id, attempt):
+        """
+        Extends the lease of a running task by ``lease_seconds``.
+
+        Returns:
+            bool: False if the lease is no longer held (it expired and the task was claimed again, or
+            the job was deleted).
+        """
+        now = time.time()
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET lease_expires_at = ?, updated_at = ? WHERE id = ? AND status = 'running' AND attempts = ?",
+                (now + self.lease_seconds, now, task_id, attempt),
+            )
+        return cursor.rowcount == 1
+
+    def complete(self, task_id, attempt, result):
+        """
+        Checkpoints a task's analysis and drops its PDF from the queue.
+
+        Returns:
+            bool: False if the caller no longer holds the lease; the result is then discarded.
+        """
+        with self._connect() as conn:
+            cursor = conn.execute(
+                "UPDATE tasks SET status = 'done', result = ?, error = NULL, pdf = NULL, updated_at = ?"
+                " WHERE id = ? AND status = 'running' AND attempts = ?",
+                (json.dumps(result), time.time(), task_id, attempt),
+            )
+        return cursor.rowcount == 1
+
+    def fail(self, task_id, attempt, error, retry=False):
+        """
+        Records a failed task; with ``retry`` it goes back to the queue until ``max_attempts`` is reached.
+
+        Like ``complete``, this is ignored if the caller no longer holds the lease.
+        """
+        with self._connect() as conn:
+            if retry:
+                conn.execute(
+                    "UPDATE tasks SET status = 'pending', error = ?, updated_at = ?"
+                    " WHERE id = ? AND status = 'running' AND attempts = ? AND attempts < ?",
+                    (error, time.time(), task_id, attempt, self.max_attempts),
+                )
+            conn.execute(
+                "UPDATE tasks SET status = 'failed', error = ?, pdf = NULL, updated_at = ?"
+                " WHERE id = ? AND status = 'running' AND attempts = ?",
+                (error, time.time(), task_id, attempt),
+            )
+
+    def cancel(self, job_id):
+        """
+        Cancels a job's tasks that have not started; running ones finish normally.
+        """
+        with self._connect() as conn:
+            conn.execute(
+                "UPDATE tasks SET status = 'cancelled', pdf = NULL, updated_at = ? WHERE job_id = ? AND status = 'pending'",
+                (time.time(), job_id),
+            )
+
+    def delete(self, job_id):
+        """
+        Removes a job and all of its tasks.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM tasks WHERE job_id = ?", (job_id,))
+            conn.execute("DELETE FROM jobs WHERE id = ?", (job_id,))
+
+    def status(self, job_id):
+        """
+        Returns task counts for a job: one entry per state plus ``total`` and ``finished``.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT status, COUNT(*) FROM tasks WHERE job_id = ? GROUP BY status", (job_id,)).fetchall()
+        counts = dict.fromkeys(TASK_STATES, 0)
+        counts.update(rows)
+        counts["total"] = sum(counts[state] for state in TASK_STATES)
+        counts["finished"] = not counts["pending"] and not counts["running"]
+        return counts
+
+    def list_jobs(self, limit=20):
+        """
+        Returns the most recent jobs, newest first, each with its ``status`` counts.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT id, created_at, name FROM jobs ORDER BY created_at DESC LIMIT ?", (limit,)).fetchall()
+        return [{"id": job_id, "created_at": created_at, "name": name, "status": self.status(job_id)}
+                for job_id, created_at, name in rows]
+
+    def results(self, job_id):
+        """
+        Returns the job's checkpointed results.
+
+        Returns:
+            tuple: ``(rows, failures)``; each row is an analysis dict with its "Filename",
+            each failure a ``(filename, error)`` pair.
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT filename, status, result, error FROM tasks WHERE job_id = ? AND status IN ('done', 'failed')"
+                " ORDER BY id",
+                (job_id,),
+            ).fetchall()
+        results, failures = [], []
+        for filename, status, result, error in rows:
+            if status == "done":
+                results.append(dict(json.loads(result), Filename=filename))
+            else:
+                failures.append((filename, error))
+        return results, failures
+
+
+def _analyze_task(task, job, llm, cache, extraction_cache):
+    # The PDF stack is only needed in the workers, not by the app that enqueues jobs
+    from rezumex.batch import NO_TEXT_ERROR
+    from rezumex.extraction import extract_document
+
+    def extract(pdf_bytes):
+        with METRICS.timer("extract"):
+            document = extract_document(pdf_bytes)
+        METRICS.record_document(document)
+        return document
+
+    # Retried tasks (rate limits, expired leases) do not parse their PDF again
+    resume_text = extraction_cache.get_or_extract(task["pdf"], extract)["text"]
+    if not resume_text:
+        raise ValueError(NO_TEXT_ERROR)
+    return analyze_resume(llm, cache, resume_text, job["job_description"], prompt=job["prompt"],
+                          generation_config=job["generation_config"])
+
+
+@contextmanager
+def _lease_heartbeat(queue, task):
+    # Renews the task's lease while it runs, so slow tasks (OCR, retry backoff) are not claimed twice
+    done = threading.Event()
+
+    def beat():
+        while not done.wait(queue.lease_seconds / 3):
+            if not queue.renew(task["id"], task["attempts"]):
+                break  # Lost the lease; complete() and fail() will ignore this worker
+
+    thread = threading.Thread(target=beat, name=f"rezumex-lease-{task['id']}", daemon=True)
+    thread.start()
+    try:
+        yield
+    finally:
+        done.set()
+        thread.join()
+
+
+def _work_loop(queue, llm, cache, extraction_cache, stop, poll_interval):
+    jobs = {}
+    while not stop.is_set():
+        task = queue.claim()
+        if task is None:
+            stop.wait(poll_interval)
+            continue
+
+        if task["job_id"] not in jobs:
+            jobs[task["job_id"]] = queue.get_job(task["job_id"])
+        try:
+            with _lease_heartbeat(queue, task):
+                result = _analyze_task(task, jobs[task["job_id"]], llm, cache, extraction_cache)
+            queue.complete(task["id"], task["attempts"], result)
+        except Exception as e:
+            queue.fail(task["id"], task["attempts"], str(e), retry=is_retryable(e))
+
+
+def run_worker(path=DEFAULT_JOBS_PATH, threads=DEFAULT_WORKER_THREADS, rpm=GEMINI_RPM, stop=None,
+               poll_interval=POLL_INTERVAL_SECONDS):
+    """
+    Processes queued tasks until ``stop`` is set (or forever).
+
+    Args:
+        path (str, optional): Queue database.
+        threads (int, optional): Concurrent tasks; Gemini calls are network-bound.
+        rpm (int, optional): Requests per minute this worker may send.
+        stop (Event, optional): Set to shut the worker down after its current tasks.
+        poll_interval (float, optional): Seconds to wait when the queue is empty.
+    """
+    from rezumex.extraction import EXTRACTOR_VERSION
+    from rezumex.llm import create_client  # Imported here so the queue itself does not need the Gemini SDK
+
+    queue = JobQueue(path)
+    llm = create_client(limiter=RateLimiter(rpm=rpm))
+    cache = ResponseCache()
+    extraction_cache = ExtractionCache(EXTRACTOR_VERSION)
+    stop = stop or threading.Event()
+    # This process's registry is invisible to the app; publish it where the sidebar and exporters merge it
+    shared_metrics = SharedMetrics()
+    source = f"worker-{os.getpid()}"
+    publishing = start_publisher(shared_metrics, source)
+    try:
+        with ThreadPoolExecutor(max_workers=threads) as pool:
+            for _ in range(threads):
+                pool.submit(_work_loop, queue, llm, cache, extraction_cache, stop, poll_interval)
+    finally:
+        publishing.set()
+        shared_metrics.publish(source)
+
+
+def start_workers(workers=DEFAULT_WORKERS, path=DEFAULT_JOBS_PATH, threads=DEFAULT_WORKER_THREADS):
+    """
+    Starts background worker processes sharing the Gemini RPM budget.
+
+    Returns:
+        tuple: ``(processes, stop_event)``.
+    """
+    context = multiprocessing.get_context("spawn")
+    stop = context.Event()
+    processes = []
+    for _ in range(workers):
+        process = context.Process(
+            target=run_worker,
+            kwargs={"path": path, "threads": threads, "rpm": max(1, GEMINI_RPM // workers), "stop": stop},
+            daemon=True,
+        )
+        process.start()
+        processes.append(process)
+    return processes, stop
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run RezumeX background screening workers.")
+    parser.add_argument("--workers", type=int, default=DEFAULT_WORKERS, help="Worker processes")
+    parser.add_argument("--threads", type=int, default=DEFAULT_WORKER_THREADS, help="Concurrent tasks per worker")
+    parser.add_argument("--queue", default=DEFAULT_JOBS_PATH, help="Queue database path")
+    args = parser.parse_args(argv)
+
+    from dotenv import load_dotenv
+    load_dotenv()
+
+    processes, stop = start_workers(max(1, args.workers), args.queue, args.threads)
+    try:
+        for process in processes:
+            process.join()
+    except KeyboardInterrupt:
+        stop.set()
+        for process in processes:
+            process.join()
+
+
+if __name__ == "__main__":
+    main()
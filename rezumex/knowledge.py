@@ -0,0 +1,116 @@
+"""
+Skill, role, course and salary knowledge base.
+
+The tables live in ``data/knowledge_base.json`` (versioned with the file's
+``version`` field) and are loaded once into indexed lookups: skill -> roles,
+role -> required skills, role -> courses and role -> salary range.
+
+A role's required skills are names, or ``{"skill": name, "weight": w}``
+objects for skills that count more (or less) than the default weight of 1.
+"""
+import heapq
+import json
+import os
+
+from rezumex.skills import SkillMatcher
+
+KNOWLEDGE_BASE_PATH = os.getenv(
+    "REZUMEX_KNOWLEDGE_BASE", os.path.join(os.path.dirname(__file__), "data", "knowledge_base.json")
+)
+
+
+class KnowledgeBase:
+    """
+    In-memory, indexed view of a knowledge base file.
+
+    Args:
+        data (dict): The parsed JSON document.
+    """
+
+    def __init__(self, data):
+        self.version = data["version"]
+        self.skills = data["skills"]
+        self.job_titles = data.get("job_titles", [])
+        self.trending_technologies = data.get("trending_technologies", [])
+
+        roles = data["roles"]
+        self.courses = {role: info["courses"] for role, info in roles.items() if info.get("courses")}
+        self.salaries = {role: info["salary"] for role, info in roles.items() if info.get("salary")}
+
+        self.role_weights = {}
+        for role, info in roles.items():
+            weights = {}
+            for entry in info.get("skills", []):
+                if isinstance(entry, str):
+                    weights[entry] = 1.0
+                else:
+                    weights[entry["skill"]] = float(entry.get("weight", 1.0))
+            if weights:
+                self.role_weights[role] = weights
+        self.role_skills = {role: list(weights) for role, weights in self.role_weights.items()}
+        self._role_totals = {role: sum(weights.values()) for role, weights in self.role_weights.items()}
+        self._role_order = {role: i for i, role in enumerate(self.role_weights)}
+
+        # Inverted index: skill -> [(role, weight), ...]
+        self.skill_roles = {}
+        for role, weights in self.role_weights.items():
+            for skill, weight in weights.items():
+                self.skill_roles.setdefault(skill, []).append((role, weight))
+
+        self.skill_matcher = SkillMatcher(self.skills)
+
+    def roles_for_skill(self, skill):
+        """
+        Returns the roles that list ``skill`` as a requirement.
+        """
+        return [role for role, _ in self.skill_roles.get(skill, [])]
+
+    def rank_roles(self, skills, top_k=None):
+        """
+        Ranks the roles that share at least one skill with ``skills``.
+
+        Only roles reached through the skill -> roles index are scored, and the
+        best ``top_k`` are selected with a heap rather than a full sort.
+
+        Args:
+            skills (iterable): Skills found in the resume.
+            top_k (int, optional): Number of roles to return. Defaults to all matching roles.
+
+        Returns:
+            list: Dicts with ``role``, ``score`` (matched weight over the role's
+            total weight, 0-1) and ``matched`` skills, best first. Ties keep the
+            knowledge base's role order.
+        """
+        matched = {}
+        for skill in set(skills):
+            for role, weight in self.skill_roles.get(skill, ()):
+                matched.setdefault(role, []).append((skill, weight))
+
+        def sort_key(role):
+            weight = sum(w for _, w in matched[role])
+            return (weight / (self._role_totals[role] or 1.0), weight, -self._role_order[role])
+
+        best = heapq.nlargest(top_k if top_k is not None else len(matched), matched, key=sort_key)
+        return [
+            {
+                "role": role,
+                "score": sort_key(role)[0],
+                "matched": sorted((skill for skill, _ in matched[role]), key=self.role_skills[role].index),
+            }
+            for role in best
+        ]
+
+
+def load_knowledge_base(path=KNOWLEDGE_BASE_PATH):
+    """
+    Reads and indexes a knowledge base file.
+
+    Args:
+        path (str, optional): JSON file to load. Defaults to the bundled one
+            (overridable with ``REZUMEX_KNOWLEDGE_BASE``).
+
+    Returns:
+        KnowledgeBase: The indexed knowledge base.
+    """
+    with open(path, encoding="utf-8") as f:
+        return KnowledgeBase(json.load(f))
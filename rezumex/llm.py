@@ -0,0 +1,176 @@
+"""
+Shared LLM clients.
+
+One client is created per process (``app.py`` holds it in
+``st.cache_resource``); ``create_client`` picks the backend from
+``REZUMEX_LLM_BACKEND``:
+
+- ``gemini`` (default): ``GeminiClient`` configures the API key once and
+  reuses a single ``GenerativeModel``, whose underlying gRPC channel stays
+  open between calls, instead of building a new model (and a cold
+  connection) for every request.
+- ``local``: ``LocalClient`` answers with the deterministic offline stand-in
+  of ``rezumex.local_llm``, for development and load tests without network
+  access or quota.
+
+Both share ``LLMClient``: every call goes through the client's
+``RateLimiter`` (see ``rezumex.ratelimit``), so concurrent callers share one
+RPM/TPM budget and transient quota errors are retried with backoff rather
+than surfacing as failed analyses. Latency, token usage and outcomes of every
+call are recorded in ``rezumex.metrics``.
+"""
+import os
+
+from rezumex.metrics import METRICS
+from rezumex.ratelimit import RateLimiter, call_with_retries, call_with_retries_async, estimate_tokens
+
+LLM_BACKEND = os.getenv("REZUMEX_LLM_BACKEND", "gemini")
+GEMINI_MODEL = os.getenv("REZUMEX_GEMINI_MODEL", "gemini-1.5-flash")
+
+# Applied to every call unless overridden per request
+DEFAULT_GENERATION_CONFIG = {}
+
+
+class LLMClient:
+    """
+    Rate-limited, instrumented calls to a model with the ``genai.GenerativeModel`` interface.
+
+    Subclasses set ``model_name`` (part of every response-cache key),
+    ``generation_config``, ``model`` and ``limiter``.
+    """
+
+    def _record_usage(self, response, estimated_tokens):
+        usage = getattr(response, "usage_metadata", None)
+        self.limiter.record_usage(estimated_tokens, getattr(usage, "total_token_count", 0))
+        METRICS.inc("rezumex_llm_requests_total", outcome="ok")
+        METRICS.inc("rezumex_llm_tokens_total", getattr(usage, "prompt_token_count", 0) or estimated_tokens, kind="prompt")
+        METRICS.inc("rezumex_llm_tokens_total", getattr(usage, "candidates_token_count", 0) or 0, kind="output")
+
+    @staticmethod
+    def _record_error():
+        METRICS.inc("rezumex_llm_requests_total", outcome="error")
+
+    def generate(self, contents, **generation_config):
+        """
+        Generates a response and returns its text.
+
+        Args:
+            contents (str | list): Prompt, or prompt parts.
+            **generation_config: Per-call overrides such as ``temperature`` or ``max_output_tokens``.
+
+        Returns:
+            str: The response text.
+        """
+        tokens = estimate_tokens(contents)
+        with METRICS.timer("llm"):
+            try:
+                response = call_with_retries(
+                    lambda: self.model.generate_content(contents, generation_config=generation_config or None),
+                    self.limiter, tokens
+                )
+            except Exception:
+                self._record_error()
+                raise
+        self._record_usage(response, tokens)
+        return response.text
+
+    def generate_stream(self, contents, **generation_config):
+        """
+        Generates a response incrementally, yielding text chunks as they arrive.
+
+        Only opening the stream is retried; an error mid-stream is raised to the caller.
+        """
+        tokens = estimate_tokens(contents)
+        # Timed until the last chunk, so this includes how fast the caller consumes the stream
+        with METRICS.timer("llm_stream"):
+            try:
+                response = call_with_retries(
+                    lambda: self.model.generate_content(contents, generation_config=generation_config or None,
+                                                        stream=True),
+                    self.limiter, tokens
+                )
+                for chunk in response:
+                    if chunk.parts:
+                        yield chunk.text
+            except Exception:
+                self._record_error()
+                raise
+        self._record_usage(response, tokens)
+
+    async def generate_async(self, contents, **generation_config):
+        """
+        Async counterpart of ``generate`` for callers running an event loop.
+        """
+        tokens = estimate_tokens(contents)
+        with METRICS.timer("llm"):
+            try:
+                response = await call_with_retries_async(
+                    lambda: self.model.generate_content_async(contents, generation_config=generation_config or None),
+                    self.limiter, tokens
+                )
+            except Exception:
+                self._record_error()
+                raise
+        self._record_usage(response, tokens)
+        return response.text
+
+
+class GeminiClient(LLMClient):
+    """
+    Process-wide wrapper around a configured ``GenerativeModel``.
+
+    Args:
+        api_key (str, optional): Defaults to the ``GOOGLE_API_KEY`` environment variable.
+        model_name (str, optional): Defaults to ``GEMINI_MODEL``.
+        generation_config (dict, optional): Defaults applied to every call.
+        limiter (RateLimiter, optional): Defaults to one sized from ``REZUMEX_GEMINI_RPM``/``_TPM``.
+    """
+
+    def __init__(self, api_key=None, model_name=GEMINI_MODEL, generation_config=None, limiter=None):
+        import google.generativeai as genai  # Imported here so the local backend runs without the Gemini SDK
+
+        genai.configure(api_key=api_key or os.getenv("GOOGLE_API_KEY"))
+        self.model_name = model_name
+        self.generation_config = dict(DEFAULT_GENERATION_CONFIG, **(generation_config or {}))
+        self.model = genai.GenerativeModel(model_name, generation_config=self.generation_config)
+        self.limiter = limiter or RateLimiter()
+
+
+class LocalClient(LLMClient):
+    """
+    Client for the offline stand-in model (``rezumex.local_llm.LocalModel``).
+
+    Args:
+        generation_config (dict, optional): Defaults applied to every call.
+        limiter (RateLimiter, optional): Defaults to the same limits as Gemini, so load tests exercise them.
+        canned_path (str, optional): JSON list of analyses to answer with; defaults to ``REZUMEX_LOCAL_LLM_CANNED``.
+        **model_options: ``latency``, ``jitter``, ``error_rate``, ``error_code`` and ``seed`` of the model.
+    """
+
+    def __init__(self, generation_config=None, limiter=None, canned_path=None, **model_options):
+        from rezumex.local_llm import LOCAL_LLM_CANNED_PATH, LOCAL_MODEL_NAME, LocalModel, load_canned
+
+        canned_path = canned_path or LOCAL_LLM_CANNED_PATH
+        canned = load_canned(canned_path) if canned_path else None
+        # Canned answers differ from templated ones, so they get their own cache entries
+        self.model_name = f"{LOCAL_MODEL_NAME}:{os.path.basename(canned_path)}" if canned_path else LOCAL_MODEL_NAME
+        self.generation_config = dict(DEFAULT_GENERATION_CONFIG, **(generation_config or {}))
+        self.model = LocalModel(canned=canned, generation_config=self.generation_config, **model_options)
+        self.limiter = limiter or RateLimiter()
+
+
+BACKENDS = {"gemini": GeminiClient, "local": LocalClient}
+
+
+def create_client(backend=None, **options):
+    """
+    Creates the client of ``backend`` (``"gemini"`` or ``"local"``; defaults to ``REZUMEX_LLM_BACKEND``).
+
+    Args:
+        backend (str, optional): Name in ``BACKENDS``.
+        **options: Passed to the client, e.g. ``limiter``.
+    """
+    backend = backend or LLM_BACKEND
+    if backend not in BACKENDS:
+        raise ValueError(f"Unknown LLM backend {backend!r}; expected one of {', '.join(BACKENDS)}")
+    return BACKENDS[backend](**options)
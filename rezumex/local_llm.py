@@ -0,0 +1,321 @@
+"""
+Offline stand-in for the Gemini model.
+
+``LocalModel`` answers the same ``generate_content`` calls as
+``genai.GenerativeModel`` without a network connection or API key, so the
+analysis paths, the response cache, the rate limiter and the batch engine can
+be run and load-tested on air-gapped machines. Use it through
+``rezumex.llm.LocalClient``, or set ``REZUMEX_LLM_BACKEND=local``.
+
+Answers are deterministic: the same request always gets the same text.
+JSON requests get an instance of their ``response_schema`` (one analysis, or
+one per "Candidate ID" of a packed request). Free-text requests get the
+numbered sections the HR and job-role prompts ask for, except the cover
+letter and LinkedIn prompts (recognised by their opening instruction), which
+get a templated letter and a list of "- " suggestions. The ATS score is the
+share of the job description's keywords found in the resume. Canned analyses
+can be loaded from a JSON file instead, and the latency and rate of injected
+API errors are configurable. Which calls fail depends only on the seed, the
+request and how often it was retried, not on thread scheduling.
+"""
+import asyncio
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from types import SimpleNamespace
+
+from rezumex.ratelimit import estimate_tokens
+
+LOCAL_MODEL_NAME = "local-stand-in"
+LOCAL_LLM_LATENCY = float(os.getenv("REZUMEX_LOCAL_LLM_LATENCY", "0.5"))
+# Latency varies by up to this fraction either way, deterministically per request
+LOCAL_LLM_JITTER = float(os.getenv("REZUMEX_LOCAL_LLM_JITTER", "0.5"))
+LOCAL_LLM_ERROR_RATE = float(os.getenv("REZUMEX_LOCAL_LLM_ERROR_RATE", "0"))
+LOCAL_LLM_ERROR_CODE = int(os.getenv("REZUMEX_LOCAL_LLM_ERROR_CODE", "429"))
+# JSON file with a list of analyses (ANALYSIS_SCHEMA objects) to answer with instead of templated ones
+LOCAL_LLM_CANNED_PATH = os.getenv("REZUMEX_LOCAL_LLM_CANNED") or None
+STREAM_CHUNK_CHARS = 80
+
+STOPWORDS = frozenset("""
+    about above after also an and are as at based be been being both but by can candidate candidates could each
+    experience for from good has have having in including into is it job looking must of on or our over plus
+    preferred required responsibilities role should skills strong such team than that the their them then there
+    these they this those through to we will with within work working would years you your
+""".split())
+_WORD = re.compile(r"[a-z][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+_CANDIDATE = re.compile(r"^Candidate ID:\s*(\S+)\s*\nResume:\n")
+_FENCED = re.compile(r"```[^\n]*\n(.*?)```", re.DOTALL)
+_DEGREE = re.compile(r"\b(?:b\.?tech|b\.?e\.?|b\.?sc|bachelor|master|m\.?tech|m\.?sc|mba|ph\.?d|degree|university|college)\b",
+                     re.IGNORECASE)
+
+
+class LocalModelError(Exception):
+    """
+    Injected API error. ``code`` is an HTTP status, so ``is_retryable`` treats 429 and 5xx like Gemini's errors.
+    """
+
+    def __init__(self, code):
+        super().__init__(f"{code} Error injected by the local stand-in model")
+        self.code = code
+
+
+class LocalResponse:
+    """
+    Mimics a ``GenerateContentResponse``: ``text``, ``parts`` and ``usage_metadata``; streamed ones iterate in chunks.
+    """
+
+    def __init__(self, text, prompt_tokens, chunk_chars=None):
+        self.text = text
+        self.parts = [text] if text else []
+        output_tokens = estimate_tokens(text) if text else 0
+        self.usage_metadata = SimpleNamespace(prompt_token_count=prompt_tokens, candidates_token_count=output_tokens,
+                                              total_token_count=prompt_tokens + output_tokens)
+        self._chunk_chars = chunk_chars or max(1, len(text))
+
+    def __iter__(self):
+        for start in range(0, len(self.text), self._chunk_chars):
+            chunk = self.text[start:start + self._chunk_chars]
+            yield SimpleNamespace(text=chunk, parts=[chunk])
+
+
+def keywords(text):
+    """
+    Returns the distinct lower-case words of ``text`` that are not stopwords, in order of appearance.
+    """
+    return list(dict.fromkeys(word for word in _WORD.findall(text.lower()) if len(word) > 1 and word not in STOPWORDS))
+
+
+def _lines(text):
+    return [line.strip() for line in text.splitlines() if line.strip()]
+
+
+def _digest(*parts):
+    return hashlib.blake2b(json.dumps(parts, ensure_ascii=False, default=str).encode("utf-8"), digest_size=8).digest()
+
+
+def template_analysis(resume_text, job_description):
+    """
+    Builds a plausible analysis of a resume from keyword overlap with the job description.
+
+    Returns:
+        dict: The fields of ``ANALYSIS_SCHEMA``.
+    """
+    wanted = keywords(job_description)[:40]
+    found = set(keywords(resume_text))
+    matched = [word for word in wanted if word in found]
+    missing = [word for word in wanted if word not in found]
+    lines = _lines(resume_text)
+    # Keyword share plus a small, stable offset so equal overlaps don't tie
+    ats_score = round(100 * len(matched) / len(wanted)) if wanted else 50
+    ats_score = max(0, min(100, ats_score + _digest(resume_text)[0] % 7 - 3))
+    academic = [line for line in lines if _DEGREE.search(line)]
+    projects = [line for line in lines if "project" in line.lower()]
+    return {
+        "ats_score": ats_score,
+        "experience": (f"The resume covers {len(matched)} of the {len(wanted)} key terms of the job description. "
+                       + " ".join(lines[1:4]))[:600],
+        "strengths": ", ".join(matched[:10]) or "No clear overlap with the job description.",
+        "weaknesses": ("Not evidenced: " + ", ".join(missing[:10])) if missing else "No notable gaps.",
+        "projects": " ".join(projects[:3])[:400] or "No projects listed.",
+        "general_information": lines[0][:200] if lines else "",
+        "academic_details": " ".join(academic[:2])[:300] or "Not stated.",
+    }
+
+
+def instance_of(schema, analysis, candidate_id=None):
+    """
+    Fills a JSON ``schema`` (object or array of objects) from ``analysis``.
+
+    Properties the analysis lacks get a placeholder of the right type, so any
+    response schema yields a valid instance.
+    """
+    kind = schema.get("type")
+    if kind == "array":
+        return [instance_of(schema["items"], analysis, candidate_id)]
+    if kind == "object":
+        values = dict(analysis, candidate_id=candidate_id or "1")
+        return {name: values[name] if name in values else instance_of(prop, {}, candidate_id)
+                for name, prop in schema.get("properties", {}).items()}
+    return {"integer": 0, "number": 0.0, "boolean": False}.get(kind, "")
+
+
+def free_text_analysis(analysis):
+    """
+    Renders an analysis as the numbered sections the free-text HR prompt asks for.
+    """
+    return (
+        f"1. **ATS Score (Percentage Match):** ATS Score: {analysis['ats_score']}%\n\n"
+        f"2. **Experience:** {analysis['experience']}\n\n"
+        f"3. **Strengths:** {analysis['strengths']}\n\n"
+        f"4. **Weaknesses:** {analysis['weaknesses']}\n\n"
+        f"5. **Projects:** {analysis['projects']}\n\n"
+        f"6. **General Information:** {analysis['general_information']}\n\n"
+        f"7. **Academic Details:** {analysis['academic_details']}\n"
+    )
+
+
+def _field(text, label):
+    match = re.search(rf"^\s*{label}\s*:\s*(.*)$", text, re.IGNORECASE | re.MULTILINE)
+    return match.group(1).strip() if match else ""
+
+
+def prompt_kind(prompt):
+    """
+    Returns ``"cover_letter"``, ``"linkedin"`` or ``"analysis"`` from the prompt's first instruction line.
+    """
+    first_line = next((line for line in prompt.splitlines() if line.strip()), "").casefold()
+    if "cover letter" in first_line:
+        return "cover_letter"
+    if "linkedin" in first_line:
+        return "linkedin"
+    return "analysis"
+
+
+def template_cover_letter(prompt):
+    """
+    Builds a short letter from the fields of the cover-letter prompt (``rezumex.ui.cover_letter``).
+    """
+    job_description = _field(prompt, "Job Description")
+    skills = keywords(_field(prompt, "Skills"))
+    relevant = [skill for skill in skills if skill in set(keywords(job_description))] or skills
+    job, company = _field(prompt, "Job") or "advertised", _field(prompt, "Company Name") or "your company"
+    return (
+        "Dear Hiring Manager,\n\n"
+        f"I am writing to apply for the {job} position at {company}. My experience with "
+        f"{', '.join(relevant[:5]) or 'the areas your posting lists'} matches what the role asks for.\n\n"
+        "I would welcome the chance to discuss how I can contribute to your team.\n\n"
+        f"Sincerely,\n{_field(prompt, 'Applicant Name') or 'The Applicant'}\n"
+    )
+
+
+def template_linkedin_suggestions(prompt):
+    """
+    Builds "- " suggestions from the fenced profile, job description and skills of the LinkedIn prompt.
+    """
+    blocks = _FENCED.findall(prompt) + ["", "", ""]
+    profile, job_description, target_skills = blocks[:3]
+    found = set(keywords(profile))
+    missing = [skill.strip() for skill in target_skills.split(",") if skill.strip()
+               and not set(keywords(skill)) <= found]
+    wanted = [word for word in keywords(job_description)[:20] if word not in found]
+    suggestions = [
+        f"- Add the missing target skills: {', '.join(missing[:8])}" if missing else "- Keep every target skill visible.",
+        f"- Mention these job description terms where they apply: {', '.join(wanted[:8])}" if wanted
+        else "- The profile already covers the job description's key terms.",
+        "- Quantify achievements in the Experience section (percentages, volumes, savings).",
+        "- Describe one or two projects that show the required skills end to end.",
+        "- Rewrite the headline around the target role and its top skills.",
+    ]
+    return "\n".join(suggestions)
+
+
+def load_canned(path):
+    """
+    Loads canned analyses from a JSON file holding a list of ``ANALYSIS_SCHEMA`` objects.
+    """
+    with open(path, encoding="utf-8") as f:
+        canned = json.load(f)
+    if not isinstance(canned, list) or not canned:
+        raise ValueError(f"{path} must contain a non-empty JSON list of analyses")
+    return canned
+
+
+class LocalModel:
+    """
+    Deterministic stand-in for ``genai.GenerativeModel``.
+
+    Args:
+        latency (float, optional): Mean seconds per call.
+        jitter (float, optional): Fraction by which the latency varies per request.
+        error_rate (float, optional): Share of calls failing with ``LocalModelError``.
+        error_code (int, optional): Status of the injected errors (429 and 5xx are retried by the client).
+        seed (int, optional): Seed of the error injection. A call fails based on the seed, the request and
+            its attempt number only, so a concurrent load test fails the same calls every run.
+        canned (list, optional): Analyses to answer with, chosen by a hash of the resume.
+        generation_config (dict, optional): Defaults merged under the per-call config.
+    """
+
+    def __init__(self, latency=LOCAL_LLM_LATENCY, jitter=LOCAL_LLM_JITTER, error_rate=LOCAL_LLM_ERROR_RATE,
+                 error_code=LOCAL_LLM_ERROR_CODE, seed=0, canned=None, generation_config=None):
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_code = error_code
+        self.canned = canned
+        self.generation_config = dict(generation_config or {})
+        self.seed = seed
+        self.calls = 0
+        self.errors = 0
+        # Attempts so far per request digest, so retries of a failed request get fresh draws
+        self._attempts = {}
+        self._lock = threading.Lock()
+
+    def _analysis(self, resume_text, job_description):
+        if self.canned:
+            return dict(self.canned[int.from_bytes(_digest(resume_text), "big") % len(self.canned)])
+        return template_analysis(resume_text, job_description)
+
+    def respond(self, contents, generation_config=None):
+        """
+        Returns the response text for ``contents``, without latency or errors.
+        """
+        config = dict(self.generation_config, **(generation_config or {}))
+        parts = [contents] if isinstance(contents, str) else [str(part) for part in contents]
+        job_description = next((part.split("\n", 1)[1] for part in parts if part.startswith("Job Description:\n")),
+                               None)
+        candidates = [(match.group(1), part[match.end():]) for part in parts for match in [_CANDIDATE.match(part)]
+                      if match]
+        resume = next((part.split("\n", 1)[1] for part in parts if part.startswith("Resume:\n")), None)
+        if not candidates and len(parts) == 1 and not config.get("response_schema"):
+            kind = prompt_kind(parts[0])
+            if kind == "cover_letter":
+                return template_cover_letter(parts[0])
+            if kind == "linkedin":
+                return template_linkedin_suggestions(parts[0])
+        if resume is None and not candidates:
+            # Single-prompt pages: the whole prompt stands for both the resume and the job description
+            resume = max(parts[1:] or parts, key=len)
+        if job_description is None:
+            job_description = "\n".join(part for part in parts if part is not resume)
+
+        schema = config.get("response_schema")
+        if config.get("response_mime_type") == "application/json" and schema:
+            if schema.get("type") == "array" and candidates:
+                item = schema["items"]
+                return json.dumps([instance_of(item, self._analysis(text, job_description), candidate_id)
+                                   for candidate_id, text in candidates])
+            return json.dumps(instance_of(schema, self._analysis(resume or "", job_description)))
+        if candidates:
+            return "\n\n".join(f"Candidate ID: {candidate_id}\n"
+                               + free_text_analysis(self._analysis(text, job_description))
+                               for candidate_id, text in candidates)
+        return free_text_analysis(self._analysis(resume, job_description))
+
+    def _prepare(self, contents, generation_config):
+        # Returns (response text, seconds to wait), or raises an injected error
+        request = _digest(contents, generation_config)
+        with self._lock:
+            self.calls += 1
+            attempt = self._attempts.get(request, 0)
+            self._attempts[request] = attempt + 1
+        draw = int.from_bytes(_digest(self.seed, request.hex(), attempt), "big") / 2 ** 64
+        if draw < self.error_rate:
+            with self._lock:
+                self.errors += 1
+            raise LocalModelError(self.error_code)
+        text = self.respond(contents, generation_config)
+        spread = request[1] / 255 * 2 - 1
+        return text, max(0.0, self.latency * (1 + self.jitter * spread))
+
+    def generate_content(self, contents, generation_config=None, stream=False):
+        text, delay = self._prepare(contents, generation_config)
+        time.sleep(delay)
+        return LocalResponse(text, estimate_tokens(contents), STREAM_CHUNK_CHARS if stream else None)
+
+    async def generate_content_async(self, contents, generation_config=None):
+        text, delay = self._prepare(contents, generation_config)
+        await asyncio.sleep(delay)
+        return LocalResponse(text, estimate_tokens(contents))
@@ -0,0 +1,352 @@
+"""
+In-process metrics for the analysis pipeline.
+
+One registry per process counts events (LLM calls and tokens, cache lookups,
+extracted pages by backend, failures) and keeps latency histograms per
+pipeline stage (``extract``, ``compact``, ``llm``, ``parse_response``,
+``analyze``, ``render``). The app shows them in the sidebar and exports them
+in the Prometheus text format, over HTTP (``REZUMEX_METRICS_PORT``) and/or
+as a file for the node-exporter textfile collector (``REZUMEX_METRICS_PATH``).
+
+Recording is a dict update under a lock, cheap enough for every call. Each
+process has its own registry. Background job workers (``rezumex.jobs``)
+publish a snapshot of theirs to a shared SQLite file
+(``REZUMEX_METRICS_SHARED_PATH``) every flush, and the app merges those
+snapshots into its sidebar and exports. PDF parser processes record nothing
+themselves; the batch engine records their timings when documents come back.
+"""
+import json
+import math
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+METRICS_PORT = int(os.getenv("REZUMEX_METRICS_PORT", "0"))
+METRICS_PATH = os.getenv("REZUMEX_METRICS_PATH") or None
+METRICS_FLUSH_SECONDS = float(os.getenv("REZUMEX_METRICS_FLUSH_SECONDS", "15"))
+METRICS_SHARED_PATH = os.getenv("REZUMEX_METRICS_SHARED_PATH", os.path.join(".rezumex_cache", "metrics.sqlite3"))
+
+# Upper bounds (seconds) of the latency histogram buckets; +Inf is implied
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+STAGE_SECONDS = "rezumex_stage_seconds"
+HELP = {
+    STAGE_SECONDS: "Latency of a pipeline stage.",
+    "rezumex_llm_requests_total": "Gemini requests by outcome.",
+    "rezumex_llm_tokens_total": "Gemini tokens by kind (prompt, output; estimated when usage is missing).",
+    "rezumex_cache_lookups_total": "Cache lookups by cache and result.",
+    "rezumex_pages_total": "Extracted PDF pages by backend (pymupdf, pypdf, ocr, ocr_failed, ocr_skipped).",
+    "rezumex_failures_total": "Resumes that failed, by stage.",
+    "rezumex_analysis_fallbacks_total": "Responses parsed with the free-text fallback instead of JSON.",
+}
+
+
+def _label_key(labels):
+    return tuple(sorted(labels.items()))
+
+
+class Metrics:
+    """
+    Thread-safe registry of counters and latency histograms.
+    """
+
+    def __init__(self, buckets=LATENCY_BUCKETS):
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters = {}
+        # (name, labels) -> [bucket counts..., +Inf count], sum
+        self._histograms = {}
+
+    def inc(self, name, value=1, **labels):
+        """
+        Adds ``value`` to the counter ``name`` with the given labels.
+        """
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name, seconds, **labels):
+        """
+        Records one duration in the histogram ``name``.
+        """
+        key = (name, _label_key(labels))
+        index = next((i for i, bound in enumerate(self.buckets) if seconds <= bound), len(self.buckets))
+        with self._lock:
+            counts, total = self._histograms.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+            counts[index] += 1
+            self._histograms[key] = (counts, total + seconds)
+
+    @contextmanager
+    def timer(self, stage):
+        """
+        Times the ``with`` block as one observation of ``stage``; exceptions are timed too.
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(STAGE_SECONDS, time.perf_counter() - start, stage=stage)
+
+    def record_document(self, document):
+        """
+        Counts the pages of an extracted document (``rezumex.extraction.extract_document``) by backend.
+        """
+        for page in document["pages"]:
+            self.inc("rezumex_pages_total", backend=page["backend"])
+
+    def counter(self, name, **labels):
+        """
+        Returns the current value of a counter (0 if never incremented).
+        """
+        with self._lock:
+            return self._counters.get((name, _label_key(labels)), 0)
+
+    def counters(self, name):
+        """
+        Returns ``{((label, value), ...): count}`` for every label set of the counter ``name``.
+        """
+        with self._lock:
+            return {labels: value for (counter, labels), value in self._counters.items() if counter == name}
+
+    def stages(self):
+        """
+        Summarises the stage histograms for display.
+
+        Returns:
+            list: One dict per stage with ``stage``, ``count``, ``mean``, ``p50`` and
+            ``p95`` (seconds; percentiles are bucket upper bounds).
+        """
+        with self._lock:
+            histograms = {dict(labels).get("stage"): (list(counts), total)
+                          for (name, labels), (counts, total) in self._histograms.items() if name == STAGE_SECONDS}
+        summary = []
+        for stage, (counts, total) in sorted(histograms.items()):
+            count = sum(counts)
+            summary.append({
+                "stage": stage, "count": count, "mean": total / count if count else 0.0,
+                "p50": self._percentile(counts, 0.5), "p95": self._percentile(counts, 0.95),
+            })
+        return summary
+
+    def _percentile(self, counts, q):
+        target, seen = q * sum(counts), 0
+        for bound, count in zip(self.buckets + (math.inf,), counts):
+            seen += count
+            if count and seen >= target:
+                return bound
+        return 0.0
+
+    def to_prometheus(self):
+        """
+        Renders every metric in the Prometheus text exposition format.
+        """
+        with self._lock:
+            counters = dict(self._counters)
+            histograms = {key: (list(counts), total) for key, (counts, total) in self._histograms.items()}
+
+        def labels_text(labels, extra=()):
+            pairs = list(labels) + list(extra)
+            if not pairs:
+                return ""
+            escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for _, value in pairs)
+            return "{" + ",".join(f'{name}="{value}"' for (name, _), value in zip(pairs, escaped)) + "}"
+
+        lines = []
+        for name in sorted({name for name, _ in counters}):
+            lines += [f"# HELP {name} {HELP.get(name, name)}", f"# TYPE {name} counter"]
+            lines += [f"{name}{labels_text(labels)} {value}" for (counter, labels), value in sorted(counters.items())
+                      if counter == name]
+        for name in sorted({name for name, _ in histograms}):
+            lines += [f"# HELP {name} {HELP.get(name, name)}", f"# TYPE {name} histogram"]
+            for (histogram, labels), (counts, total) in sorted(histograms.items()):
+                if histogram != name:
+                    continue
+                cumulative = 0
+                for bound, count in zip(self.buckets + (math.inf,), counts):
+                    cumulative += count
+                    le = "+Inf" if bound == math.inf else repr(bound)
+                    lines.append(f"{name}_bucket{labels_text(labels, [('le', le)])} {cumulative}")
+                lines.append(f"{name}_sum{labels_text(labels)} {total}")
+                lines.append(f"{name}_count{labels_text(labels)} {cumulative}")
+        return "\n".join(lines) + "\n"
+
+    def write_textfile(self, path):
+        """
+        Writes ``to_prometheus()`` to ``path`` atomically (write, then rename).
+        """
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        temporary = f"{path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as f:
+            f.write(self.to_prometheus())
+        os.replace(temporary, path)
+
+    def snapshot(self):
+        """
+        Returns the registry's contents as JSON-serialisable lists, for ``merge`` in another process.
+        """
+        with self._lock:
+            return {
+                "counters": [[name, labels, value] for (name, labels), value in self._counters.items()],
+                "histograms": [[name, labels, list(counts), total]
+                               for (name, labels), (counts, total) in self._histograms.items()],
+            }
+
+    def merge(self, snapshot):
+        """
+        Adds a ``snapshot()`` of another registry with the same buckets to this one.
+        """
+        with self._lock:
+            for name, labels, value in snapshot["counters"]:
+                key = (name, tuple(map(tuple, labels)))
+                self._counters[key] = self._counters.get(key, 0) + value
+            for name, labels, counts, total in snapshot["histograms"]:
+                key = (name, tuple(map(tuple, labels)))
+                current, current_total = self._histograms.get(key) or ([0] * (len(self.buckets) + 1), 0.0)
+                self._histograms[key] = ([a + b for a, b in zip(current, counts)], current_total + total)
+
+    def reset(self):
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+# The registry of this process
+METRICS = Metrics()
+
+
+class SharedMetrics:
+    """
+    Registry snapshots of other processes, one row per process, in SQLite.
+
+    A connection is opened per operation, as in ``rezumex.cache``. Snapshots are
+    cumulative, so a worker that has exited keeps contributing what it did.
+
+    Args:
+        path (str, optional): SQLite file shared by the app and the job workers.
+    """
+
+    def __init__(self, path=METRICS_SHARED_PATH):
+        self.path = path
+        self._published = set()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS snapshots ("
+                " source TEXT PRIMARY KEY, value TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def publish(self, source, metrics=METRICS):
+        """
+        Stores the current snapshot of ``metrics`` under ``source`` (e.g. ``worker-<pid>``).
+
+        If the snapshot was removed by ``clear`` since the last publish, ``metrics`` is reset
+        first, so a reset from the admin panel also restarts the workers' counts.
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if source in self._published and not conn.execute(
+                    "SELECT 1 FROM snapshots WHERE source = ?", (source,)).fetchone():
+                metrics.reset()
+            conn.execute(
+                "INSERT OR REPLACE INTO snapshots (source, value, updated_at) VALUES (?, ?, ?)",
+                (source, json.dumps(metrics.snapshot()), time.time()),
+            )
+        self._published.add(source)
+
+    def combined(self, metrics=METRICS):
+        """
+        Returns a new registry holding ``metrics`` plus every published snapshot.
+        """
+        with self._connect() as conn:
+            rows = conn.execute("SELECT value FROM snapshots").fetchall()
+        combined = Metrics(metrics.buckets)
+        combined.merge(metrics.snapshot())
+        for (value,) in rows:
+            combined.merge(json.loads(value))
+        return combined
+
+    def clear(self):
+        """
+        Removes every published snapshot.
+        """
+        with self._connect() as conn:
+            conn.execute("DELETE FROM snapshots")
+
+
+def start_publisher(shared, source, flush_seconds=METRICS_FLUSH_SECONDS, metrics=METRICS):
+    """
+    Publishes ``metrics`` to ``shared`` every ``flush_seconds`` on a daemon thread.
+
+    Returns:
+        Event: Stops the publisher; publish once more after setting it to record the final counts.
+    """
+    stop = threading.Event()
+
+    def flush():
+        while not stop.wait(flush_seconds):
+            shared.publish(source, metrics)
+
+    threading.Thread(target=flush, name="rezumex-metrics-publisher", daemon=True).start()
+    return stop
+
+
+def start_exporter(port=METRICS_PORT, path=METRICS_PATH, flush_seconds=METRICS_FLUSH_SECONDS, metrics=METRICS,
+                   shared=None):
+    """
+    Starts the configured exporters on daemon threads: an HTTP ``/metrics``
+    endpoint on ``port`` and/or a textfile rewritten every ``flush_seconds``.
+
+    Args:
+        shared (SharedMetrics, optional): Also exports the snapshots published by other processes.
+
+    Returns:
+        tuple: ``(server, stop)``; the HTTP server (or None) and an Event that stops the textfile writer.
+    """
+    stop = threading.Event()
+    server = None
+
+    def registry():
+        return shared.combined(metrics) if shared is not None else metrics
+
+    if port:
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = registry().to_prometheus().encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, *args):
+                pass
+
+        server = ThreadingHTTPServer(("", port), Handler)
+        threading.Thread(target=server.serve_forever, name="rezumex-metrics-http", daemon=True).start()
+
+    if path:
+        def flush():
+            while not stop.wait(flush_seconds):
+                registry().write_textfile(path)
+
+        threading.Thread(target=flush, name="rezumex-metrics-textfile", daemon=True).start()
+    return server, stop
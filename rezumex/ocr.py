@@ -0,0 +1,164 @@
+"""
+Page-level OCR for scanned resumes.
+
+Pages are rendered one at a time with PyMuPDF (greyscale, with the DPI lowered
+for oversized pages so no raster exceeds ``MAX_PAGE_PIXELS``) and handed to a
+process pool sized to the machine, so only a few rasters are ever held in
+memory. Once ``OCR_TEXT_TARGET`` characters have been recovered no further
+pages are rendered. If a worker dies (e.g. OOM-killed on a huge raster) the
+pages it was holding fail and the pool is rebuilt for the next ones.
+"""
+import math
+import multiprocessing
+import os
+import threading
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+
+import fitz  # PyMuPDF
+
+OCR_DPI = int(os.getenv("REZUMEX_OCR_DPI", "300"))
+# ~12 MB per greyscale raster; a Letter page at 300 DPI is about 8.4 MP
+MAX_PAGE_PIXELS = int(os.getenv("REZUMEX_OCR_MAX_PIXELS", str(12_000_000)))
+# Roughly two dense resume pages; 0 disables the early stop
+OCR_TEXT_TARGET = int(os.getenv("REZUMEX_OCR_TEXT_TARGET", "8000"))
+OCR_WORKERS = int(os.getenv("REZUMEX_OCR_WORKERS", str(os.cpu_count() or 1)))
+
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool():
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=OCR_WORKERS, mp_context=multiprocessing.get_context("spawn"))
+        return _pool
+
+
+def _discard_pool(pool):
+    # A broken executor never recovers; drop it so the next submission builds a fresh one
+    global _pool
+    with _pool_lock:
+        if _pool is pool:
+            _pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _submit(raster):
+    # Returns ``(pool, future)``, retrying once on a fresh pool if the current one is broken
+    pool = _get_pool()
+    try:
+        return pool, pool.submit(_ocr_raster, raster)
+    except BrokenProcessPool:
+        _discard_pool(pool)
+    pool = _get_pool()
+    return pool, pool.submit(_ocr_raster, raster)
+
+
+def ocr_image(image):
+    """
+    Runs Tesseract over a PIL image and returns the recognised text.
+    """
+    import pytesseract
+
+    return pytesseract.image_to_string(image)
+
+
+def render_page(page, dpi=OCR_DPI, max_pixels=MAX_PAGE_PIXELS):
+    """
+    Renders a PyMuPDF page to a greyscale raster, capping its pixel count.
+
+    Returns:
+        tuple: ``(width, height, samples)``, cheap to send to a worker process.
+    """
+    scale = dpi / 72
+    pixels = page.rect.width * page.rect.height * scale * scale
+    if pixels > max_pixels:
+        scale *= math.sqrt(max_pixels / pixels)
+    pix = page.get_pixmap(matrix=fitz.Matrix(scale, scale), colorspace=fitz.csGRAY)
+    return pix.width, pix.height, pix.samples
+
+
+def _ocr_raster(raster):
+    from PIL import Image
+
+    width, height, samples = raster
+    return ocr_image(Image.frombytes("L", (width, height), samples))
+
+
+def ocr_pages(doc, page_indices, workers=None, text_target=OCR_TEXT_TARGET, dpi=OCR_DPI, max_pixels=MAX_PAGE_PIXELS):
+    """
+    OCRs the given pages of an open PyMuPDF document.
+
+    Args:
+        doc (fitz.Document): The open document.
+        page_indices (list): 0-based indices of the pages to OCR, in reading order.
+        workers (int, optional): Pages OCRed in parallel. Defaults to ``OCR_WORKERS``;
+            inside a worker process (e.g. the batch engine's parsers) OCR runs inline.
+        text_target (int, optional): Stop rendering new pages once this many
+            characters have been recovered. 0 OCRs every page.
+        dpi (int, optional): Render resolution before the pixel cap is applied.
+        max_pixels (int, optional): Upper bound on a page raster's pixel count.
+
+    Returns:
+        dict: Page index to recognised text, or None if OCR failed on that page.
+        Pages skipped by the early stop are absent.
+    """
+    workers = workers or OCR_WORKERS
+    if multiprocessing.parent_process() is not None:
+        workers = 1  # Already parallel across documents; don't nest pools
+
+    results = {}
+    recovered = 0
+
+    def enough():
+        return text_target and recovered >= text_target
+
+    if workers <= 1 or len(page_indices) == 1:
+        for index in page_indices:
+            if enough():
+                break
+            try:
+                results[index] = _ocr_raster(render_page(doc[index], dpi, max_pixels))
+                recovered += len(results[index].strip())
+            except Exception:
+                results[index] = None
+        return results
+
+    remaining = iter(page_indices)
+    pending = {}
+    while True:
+        # Keep at most two rasters per worker alive at once
+        while len(pending) < 2 * workers and not enough():
+            index = next(remaining, None)
+            if index is None:
+                break
+            try:
+                raster = render_page(doc[index], dpi, max_pixels)
+            except Exception:
+                # A page that cannot be rendered fails alone, as in the inline branch
+                results[index] = None
+                continue
+            try:
+                pool, future = _submit(raster)
+            except BrokenProcessPool:
+                results[index] = None
+                continue
+            pending[future] = index, pool
+        if not pending:
+            break
+
+        done, _ = wait(pending, return_when=FIRST_COMPLETED)
+        for future in done:
+            index, pool = pending.pop(future)
+            try:
+                results[index] = future.result()
+                recovered += len(results[index].strip())
+            except BrokenProcessPool:
+                # Only the pages in flight on the dead pool are lost
+                results[index] = None
+                _discard_pool(pool)
+            except Exception:
+                results[index] = None
+    return results
@@ -0,0 +1,183 @@
+"""
+Multi-resume prompts for the HR dashboard.
+
+Several extracted resumes are packed into one Gemini request that returns a
+JSON array with one analysis per candidate, so the instructions and job
+description are sent once per group instead of once per resume. Groups are
+bounded by an input-token budget and by how many analyses fit in the model's
+output limit. A group whose response is unusable or missing candidates is
+split in half and retried, down to single-resume calls; a resume that also
+fails on its own fails alone.
+"""
+import json
+import os
+
+from rezumex.analysis import ANALYSIS_SCHEMA, ResumeAnalysis
+from rezumex.batch import DEFAULT_MAX_IN_FLIGHT, analyze_texts
+from rezumex.metrics import METRICS
+from rezumex.ratelimit import estimate_tokens, is_retryable
+
+MAX_INPUT_TOKENS = int(os.getenv("REZUMEX_PACK_MAX_INPUT_TOKENS", "200000"))
+MAX_OUTPUT_TOKENS = 8192
+# A detailed seven-section analysis is typically 500-800 tokens
+OUTPUT_TOKENS_PER_CANDIDATE = 900
+MAX_CANDIDATES_PER_REQUEST = MAX_OUTPUT_TOKENS // OUTPUT_TOKENS_PER_CANDIDATE
+
+BATCH_ANALYSIS_SCHEMA = {
+    "type": "array",
+    "items": {
+        "type": "object",
+        "properties": dict(candidate_id={"type": "string"}, **ANALYSIS_SCHEMA["properties"]),
+        "required": ["candidate_id"] + ANALYSIS_SCHEMA["required"],
+    },
+}
+
+BATCH_GENERATION_CONFIG = {
+    "response_mime_type": "application/json",
+    "response_schema": BATCH_ANALYSIS_SCHEMA,
+    "max_output_tokens": MAX_OUTPUT_TOKENS,
+}
+
+BATCH_INSTRUCTIONS = """
+You are given several candidates' resumes, each introduced by "Candidate ID: <id>".
+Analyse every candidate independently against the same job description and return a JSON array
+with exactly one object per candidate, echoing its candidate_id.
+"""
+
+
+def pack_resumes(texts, fixed_tokens=0, max_input_tokens=MAX_INPUT_TOKENS, max_candidates=MAX_CANDIDATES_PER_REQUEST):
+    """
+    Greedily groups resumes so each request stays within the token and output budgets.
+
+    Args:
+        texts (list): ``(filename, resume_text)`` pairs.
+        fixed_tokens (int, optional): Tokens sent with every request (prompt, job description).
+        max_input_tokens (int, optional): Input budget per request.
+        max_candidates (int, optional): Maximum resumes per request.
+
+    Returns:
+        list: Groups (lists) of ``(filename, resume_text)`` pairs, in input order.
+    """
+    groups, group, used = [], [], fixed_tokens
+    for filename, text in texts:
+        tokens = estimate_tokens(text)
+        if group and (len(group) >= max_candidates or used + tokens > max_input_tokens):
+            groups.append(group)
+            group, used = [], fixed_tokens
+        group.append((filename, text))
+        used += tokens
+    if group:
+        groups.append(group)
+    return groups
+
+
+def build_batch_contents(prompt, job_description, group):
+    """
+    Builds the request for one group; candidates are numbered from 1.
+    """
+    contents = [prompt + BATCH_INSTRUCTIONS, f"Job Description:\n{job_description}"]
+    for candidate_id, (_, text) in enumerate(group, start=1):
+        contents.append(f"Candidate ID: {candidate_id}\nResume:\n{text}")
+    return contents
+
+
+def parse_batch_response(response, size):
+    """
+    Parses a JSON array of analyses, keeping the valid entries.
+
+    Returns:
+        dict: 0-based position in the group to its results-table row.
+    """
+    rows = {}
+    with METRICS.timer("parse_response"):
+        for item in json.loads(response):
+            try:
+                position = int(str(item["candidate_id"]).strip()) - 1
+                if 0 <= position < size and position not in rows:
+                    rows[position] = ResumeAnalysis.from_dict(item).to_row()
+            except (KeyError, TypeError, ValueError):
+                continue
+    return rows
+
+
+def is_complete_response(response, size):
+    """
+    Returns True if ``response`` holds a valid analysis for each of the ``size`` candidates.
+    """
+    try:
+        return len(parse_batch_response(response, size)) == size
+    except (TypeError, ValueError):
+        return False
+
+
+def analyze_group(group, generate, prompt, job_description, analyze_one):
+    """
+    Analyses one group of resumes with as few requests as possible.
+
+    Args:
+        group (list): ``(filename, resume_text)`` pairs.
+        generate (callable): Sends request contents with ``BATCH_GENERATION_CONFIG`` and returns the text.
+        prompt (str): The analysis instructions (e.g. ``input_prompt3``).
+        job_description (str): The job posting.
+        analyze_one (callable): Single-resume analysis used once a group is split down to one.
+
+    Returns:
+        dict: Filename to ``(row, error)``; ``error`` is None on success and ``row`` is None on failure.
+
+    Raises:
+        Exception: A retryable (quota or overload) error, so the whole group can be re-queued.
+    """
+    if len(group) == 1:
+        filename, text = group[0]
+        try:
+            return {filename: (analyze_one(text), None)}
+        except Exception as e:
+            if is_retryable(e):
+                raise
+            return {filename: (None, str(e))}
+
+    try:
+        rows = parse_batch_response(generate(build_batch_contents(prompt, job_description, group)), len(group))
+    except Exception as e:
+        if is_retryable(e):
+            raise  # Let the batch engine re-queue the whole group
+        rows = {}
+
+    results = {group[position][0]: (row, None) for position, row in rows.items()}
+    missing = [candidate for position, candidate in enumerate(group) if position not in rows]
+    if missing:
+        middle = (len(missing) + 1) // 2
+        for half in (missing[:middle], missing[middle:]):
+            if half:
+                results.update(analyze_group(half, generate, prompt, job_description, analyze_one))
+    return results
+
+
+def analyze_packed(texts, generate, prompt, job_description, analyze_one, max_candidates=MAX_CANDIDATES_PER_REQUEST,
+                   max_in_flight=DEFAULT_MAX_IN_FLIGHT):
+    """
+    Analyses resumes in packed groups, concurrently, yielding per-resume results.
+
+    Args:
+        texts (list): ``(filename, resume_text)`` pairs.
+        generate, prompt, job_description, analyze_one: See ``analyze_group``.
+        max_candidates (int, optional): Maximum resumes per request.
+        max_in_flight (int, optional): Maximum concurrent requests.
+
+    Yields:
+        tuple: ``(filename, result, error)`` as each group completes.
+    """
+    fixed_tokens = estimate_tokens(build_batch_contents(prompt, job_description, []))
+    groups = {str(i): group for i, group in enumerate(pack_resumes(texts, fixed_tokens, max_candidates=max_candidates))}
+
+    def analyze(label):
+        return analyze_group(groups[label], generate, prompt, job_description, analyze_one)
+
+    for label, results, error in analyze_texts([(label, label) for label in groups], analyze, max_in_flight=max_in_flight):
+        for filename, _ in groups[label]:
+            if error:
+                yield filename, None, error
+            elif filename in results:
+                yield (filename, *results[filename])
+            else:
+                yield filename, None, "Missing from batched response"
@@ -0,0 +1,148 @@
+"""
+Client-side rate limiting and retries for Gemini calls.
+
+Every call reserves one request from a requests-per-minute bucket and its
+estimated prompt tokens from a tokens-per-minute bucket. Buckets may go into
+debt: a reservation returns how long the caller must wait before sending, so
+bursts are spread out at the sustainable rate (FIFO, for threads and asyncio
+alike) instead of tripping the API's quota. Calls that still fail with a
+transient error (429, 5xx, timeouts) are retried with jittered exponential
+backoff.
+"""
+import asyncio
+import os
+import random
+import threading
+import time
+
+GEMINI_RPM = int(os.getenv("REZUMEX_GEMINI_RPM", "15"))
+GEMINI_TPM = int(os.getenv("REZUMEX_GEMINI_TPM", "1000000"))
+MAX_RETRIES = int(os.getenv("REZUMEX_GEMINI_MAX_RETRIES", "5"))
+BACKOFF_BASE_SECONDS = 1.0
+BACKOFF_MAX_SECONDS = 60.0
+
+RETRYABLE_STATUS_CODES = frozenset([408, 429, 500, 502, 503, 504])
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at ``per_minute`` tokens a minute.
+    """
+
+    def __init__(self, per_minute):
+        self.capacity = float(per_minute)
+        self.rate = per_minute / 60.0
+        self.level = self.capacity
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self):
+        now = time.monotonic()
+        self.level = min(self.capacity, self.level + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def reserve(self, amount=1.0):
+        """
+        Takes ``amount`` tokens, going into debt if needed.
+
+        Returns:
+            float: Seconds to wait before the reserved tokens are actually available.
+        """
+        with self._lock:
+            self._refill()
+            self.level -= min(amount, self.capacity)
+            return 0.0 if self.level >= 0 else -self.level / self.rate
+
+    def adjust(self, amount):
+        """
+        Charges (or refunds, if negative) tokens after the fact, e.g. once real usage is known.
+        """
+        with self._lock:
+            self._refill()
+            self.level = min(self.capacity, self.level - amount)
+
+
+class RateLimiter:
+    """
+    Combined requests-per-minute and tokens-per-minute limiter.
+    """
+
+    def __init__(self, rpm=GEMINI_RPM, tpm=GEMINI_TPM):
+        self.requests = TokenBucket(rpm)
+        self.tokens = TokenBucket(tpm)
+
+    def reserve(self, tokens):
+        """
+        Reserves one request and ``tokens`` tokens; returns the seconds to wait.
+        """
+        return max(self.requests.reserve(1), self.tokens.reserve(tokens))
+
+    def record_usage(self, estimated_tokens, actual_tokens):
+        """
+        Corrects the token bucket once the response reports its real token count.
+        """
+        if actual_tokens:
+            self.tokens.adjust(actual_tokens - estimated_tokens)
+
+
+def estimate_tokens(contents):
+    """
+    Rough token count of a prompt (about four characters per token).
+    """
+    if isinstance(contents, str):
+        return max(1, len(contents) // 4)
+    return sum(estimate_tokens(part) if isinstance(part, (str, list, tuple)) else 1 for part in contents)
+
+
+def is_retryable(error):
+    """
+    Returns True for quota, overload and timeout errors worth retrying.
+    """
+    code = getattr(error, "code", None)
+    if isinstance(code, int) and code in RETRYABLE_STATUS_CODES:
+        return True
+    return isinstance(error, (TimeoutError, ConnectionError))
+
+
+def backoff_delay(attempt, base=BACKOFF_BASE_SECONDS, cap=BACKOFF_MAX_SECONDS):
+    """
+    Full-jitter exponential backoff: a random delay in ``[0, min(cap, base * 2**attempt)]``.
+    """
+    return random.uniform(0, min(cap, base * 2 ** attempt))
+
+
+def call_with_retries(call, limiter, tokens, max_retries=MAX_RETRIES):
+    """
+    Runs ``call()`` under ``limiter``, retrying transient failures with backoff.
+
+    Args:
+        call (callable): Sends the request and returns the response.
+        limiter (RateLimiter): Shared limiter for the model.
+        tokens (int): Estimated prompt tokens.
+        max_retries (int, optional): Retries after the first attempt.
+
+    Returns:
+        The response returned by ``call``.
+    """
+    for attempt in range(max_retries + 1):
+        time.sleep(limiter.reserve(tokens))
+        try:
+            return call()
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            time.sleep(backoff_delay(attempt))
+
+
+async def call_with_retries_async(call, limiter, tokens, max_retries=MAX_RETRIES):
+    """
+    Async counterpart of ``call_with_retries``; ``call`` returns an awaitable.
+    """
+    for attempt in range(max_retries + 1):
+        await asyncio.sleep(limiter.reserve(tokens))
+        try:
+            return await call()
+        except Exception as e:
+            if attempt == max_retries or not is_retryable(e):
+                raise
+            await asyncio.sleep(backoff_delay(attempt))
@@ -0,0 +1,87 @@
+"""
+Local keyword pre-scoring of resumes against a job description.
+
+All resumes and the job description are turned into one sparse TF-IDF matrix
+and scored with a single sparse matrix-vector product, so a whole batch costs
+milliseconds. The scores are a cheap first-pass filter: only the best
+resumes need to be sent to Gemini.
+"""
+import re
+from collections import Counter
+
+import numpy as np
+from scipy import sparse
+
+# Keeps tokens such as c++, c#, node.js and .net intact
+TOKEN_PATTERN = re.compile(r"\.net|[a-z0-9][a-z0-9+#]*(?:\.[a-z0-9]+)*")
+
+STOP_WORDS = frozenset("""
+a about above after all also an and any are as at be been being both but by can could did do does
+doing during each few for from further had has have having he her here hers him his how i if in into
+is it its itself just me more most my no nor not now of off on once only or other our ours out over
+own same she should so some such than that the their theirs them then there these they this those
+through to too under until up very was we were what when where which while who whom why will with
+would you your yours etc work working experience years year using used use strong ability skills
+""".split())
+
+
+def tokenize(text):
+    """
+    Lower-cases ``text`` and splits it into terms, dropping stop words.
+    """
+    return [token for token in TOKEN_PATTERN.findall(text.lower()) if token not in STOP_WORDS]
+
+
+def tfidf_matrix(documents):
+    """
+    Builds an L2-normalised TF-IDF matrix (sublinear term frequency, smoothed IDF).
+
+    Args:
+        documents (list): Texts to vectorise.
+
+    Returns:
+        scipy.sparse.csr_matrix: One row per document.
+    """
+    vocabulary = {}
+    rows, cols, counts = [], [], []
+    for row, document in enumerate(documents):
+        for term, count in Counter(tokenize(document or "")).items():
+            rows.append(row)
+            cols.append(vocabulary.setdefault(term, len(vocabulary)))
+            counts.append(count)
+
+    shape = (len(documents), max(len(vocabulary), 1))
+    tf = sparse.csr_matrix((np.asarray(counts, dtype=np.float64), (rows, cols)), shape=shape)
+    tf.data = 1.0 + np.log(tf.data)
+
+    document_frequency = np.bincount(tf.indices, minlength=shape[1])
+    idf = np.log((1.0 + shape[0]) / (1.0 + document_frequency)) + 1.0
+    weighted = tf @ sparse.diags(idf)
+
+    norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+    norms[norms == 0] = 1.0
+    return sparse.diags(1.0 / norms) @ weighted
+
+
+def score_resumes(job_description, resume_texts):
+    """
+    Scores every resume against the job description in one vectorised pass.
+
+    Args:
+        job_description (str): The job posting.
+        resume_texts (list): Extracted resume texts.
+
+    Returns:
+        numpy.ndarray: Cosine similarity (0-1) of each resume to the job description.
+    """
+    if not resume_texts:
+        return np.zeros(0)
+    matrix = tfidf_matrix([job_description] + list(resume_texts)).tocsr()
+    return (matrix[1:] @ matrix[0].T).toarray().ravel()
+
+
+def shortlist(scores, top_n):
+    """
+    Returns the indices of the ``top_n`` highest scores, best first (ties keep input order).
+    """
+    return [int(i) for i in np.argsort(-np.asarray(scores), kind="stable")[:top_n]]
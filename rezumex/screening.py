@@ -0,0 +1,62 @@
+"""
+Resume screening against a job description, without Streamlit.
+
+This is the request the HR dashboard, the background workers and the CLI
+all send: the same contents and cache key, so a resume screened in one of
+them is a cache hit in the others. Resumes are compacted (see
+``rezumex.compaction``) before they are sent.
+"""
+from rezumex.analysis import JSON_GENERATION_CONFIG, parse_analysis
+from rezumex.compaction import RESUME_TOKEN_BUDGET, compact_resume
+from rezumex.metrics import METRICS
+from rezumex.prompts import HR_ANALYSIS_PROMPT
+
+
+def resume_contents(prompt, job_description, resume_text):
+    """
+    Builds the request contents for one resume.
+    """
+    return [prompt, f"Job Description:\n{job_description}", f"Resume:\n{resume_text}"]
+
+
+def get_gemini_response(llm, cache, prompt, resume_text, job_description, **generation_config):
+    """
+    Sends one resume to Gemini, going through the response cache.
+
+    Args:
+        llm (LLMClient): Shared client.
+        cache (ResponseCache): Response cache, or None to always call Gemini.
+        prompt (str): Analysis instructions.
+        resume_text (str): Extracted resume text.
+        job_description (str): The job posting.
+        **generation_config: Per-call overrides (e.g. ``JSON_GENERATION_CONFIG``).
+
+    Returns:
+        str: The response text.
+    """
+    contents = resume_contents(prompt, job_description, resume_text)
+    if cache is None:
+        return llm.generate(contents, **generation_config)
+    return cache.get_or_compute(
+        (llm.model_name, contents, generation_config),
+        lambda: llm.generate(contents, **generation_config)
+    )
+
+
+def analyze_resume(llm, cache, resume_text, job_description, structured=True, prompt=HR_ANALYSIS_PROMPT,
+                   token_budget=RESUME_TOKEN_BUDGET, generation_config=None):
+    """
+    Screens one resume and returns its results-table row (see ``parse_analysis``)
+    plus "Tokens Saved" by compacting the resume to ``token_budget``.
+
+    ``generation_config``, when given, replaces the one chosen by ``structured``.
+    """
+    if generation_config is None:
+        generation_config = JSON_GENERATION_CONFIG if structured else {}
+    with METRICS.timer("analyze"):
+        compacted = compact_resume(resume_text, token_budget)
+        response = get_gemini_response(llm, cache, prompt, compacted["text"], job_description, **generation_config)
+        with METRICS.timer("parse_response"):
+            row = parse_analysis(response)
+    row["Tokens Saved"] = compacted["tokens_saved"]
+    return row
@@ -0,0 +1,109 @@
+"""
+Single-pass skill matching.
+
+The whole vocabulary is compiled once into one trie-shaped regular expression,
+so finding every skill in a resume is a single scan of the text instead of one
+``re.search`` per skill. Matches are case-insensitive and bounded by non-word
+characters, which (unlike ``\\b``) also works for skills such as ``C++``.
+The pattern sits in a lookahead, so it is tried at every word start and
+overlapping skills ("Machine Learning", "Learning Management") are all found.
+"""
+import re
+from functools import lru_cache
+
+
+def _trie_pattern(words):
+    trie = {}
+    for word in words:
+        node = trie
+        for char in word:
+            node = node.setdefault(char, {})
+        node[""] = {}
+
+    def emit(node):
+        branches = [re.escape(char) + emit(child) for char, child in sorted(node.items()) if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        # Optional tail: the regex prefers the longest skill but can stop at a shorter one
+        return "(?:" + body + ")?" if "" in node else body
+
+    return emit(trie)
+
+
+def _is_word_char(char):
+    return char.isalnum() or char == "_"
+
+
+class SkillMatcher:
+    """
+    Finds every occurrence of a fixed skill vocabulary in one pass over the text.
+
+    Args:
+        skills (list): Skill names, in the order results should be reported.
+    """
+
+    def __init__(self, skills):
+        self.skills = []
+        self._canonical = {}
+        for skill in skills:
+            key = skill.strip().lower()
+            if key and key not in self._canonical:
+                self._canonical[key] = skill
+                self.skills.append(skill)
+        self._order = {key: i for i, key in enumerate(self._canonical)}
+
+        if self._canonical:
+            # Zero-width, so a match does not consume the text later skills start in
+            self._pattern = re.compile(
+                r"(?<!\w)(?=(" + _trie_pattern(self._canonical) + r")(?!\w))", re.IGNORECASE
+            )
+        else:
+            self._pattern = None
+
+        # Each start yields only its longest skill, so "SEO Writing" would hide
+        # "SEO"; record which vocabulary entries occur inside each longer one up front.
+        self._nested = {}
+        for key in self._canonical:
+            nested = [
+                (start, end, key[start:end])
+                for start in range(len(key)) if start == 0 or not _is_word_char(key[start - 1])
+                for end in range(start + 1, len(key) + 1) if end == len(key) or not _is_word_char(key[end])
+                if (start, end) != (0, len(key)) and key[start:end] in self._canonical
+            ]
+            if nested:
+                self._nested[key] = nested
+
+    def find(self, text):
+        """
+        Returns every skill occurrence in ``text``.
+
+        Returns:
+            list: ``(skill, start, end)`` tuples in text order, where ``skill``
+            is the vocabulary spelling and ``start``/``end`` index into ``text``.
+        """
+        if self._pattern is None or not text:
+            return []
+        occurrences = {}
+        for match in self._pattern.finditer(text):
+            key = match.group(1).lower()
+            occurrences[match.start(1), match.end(1)] = self._canonical[key]
+            for start, end, nested in self._nested.get(key, ()):
+                # Nested skills starting later in the match are also found at their own start
+                occurrences[match.start(1) + start, match.start(1) + end] = self._canonical[nested]
+        return [(skill, start, end) for (start, end), skill in sorted(occurrences.items())]
+
+    def match(self, text):
+        """
+        Returns the distinct skills present in ``text``, in vocabulary order.
+        """
+        found = {skill.lower() for skill, _, _ in self.find(text)}
+        return sorted((self._canonical[key] for key in found), key=lambda skill: self._order[skill.lower()])
+
+
+@lru_cache(maxsize=128)
+def get_skill_matcher(skills):
+    """
+    Returns a compiled matcher for a tuple of skills, reusing previous compilations.
+    """
+    return SkillMatcher(skills)
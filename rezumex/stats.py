@@ -0,0 +1,94 @@
+"""
+Summary statistics of ATS scores for the HR dashboard charts.
+
+``ScoreStats`` keeps a fixed-bin histogram, a running sum and the sorted
+scores, so each ``add`` is cheap and the histogram, mean and box-plot
+quartiles are read off directly instead of being recomputed (or re-plotted)
+from the whole results table on every rerun.
+"""
+import bisect
+
+
+class ScoreStats:
+    """
+    Running statistics over scores in ``[low, high]``.
+
+    Args:
+        bins (int, optional): Number of equal-width histogram bins.
+        low (float, optional): Lower edge of the first bin.
+        high (float, optional): Upper edge of the last bin (inclusive).
+    """
+
+    def __init__(self, bins=10, low=0, high=100):
+        self.bins = bins
+        self.low = low
+        self.high = high
+        self.counts = [0] * bins
+        self.scores = []
+        self.total = 0.0
+
+    @classmethod
+    def from_scores(cls, scores, **kwargs):
+        stats = cls(**kwargs)
+        for score in scores:
+            stats.add(score)
+        return stats
+
+    def add(self, score):
+        """
+        Adds one score; out-of-range scores are counted in the first or last bin.
+        """
+        score = float(score)
+        bisect.insort(self.scores, score)
+        self.total += score
+        width = (self.high - self.low) / self.bins
+        self.counts[min(self.bins - 1, max(0, int((score - self.low) // width)))] += 1
+
+    @property
+    def count(self):
+        return len(self.scores)
+
+    @property
+    def mean(self):
+        return self.total / len(self.scores) if self.scores else None
+
+    @property
+    def min(self):
+        return self.scores[0] if self.scores else None
+
+    @property
+    def max(self):
+        return self.scores[-1] if self.scores else None
+
+    def quantile(self, q):
+        """
+        Returns the ``q`` quantile (0-1), linearly interpolated like ``pandas.Series.quantile``.
+        """
+        if not self.scores:
+            return None
+        position = q * (len(self.scores) - 1)
+        lower = int(position)
+        upper = min(lower + 1, len(self.scores) - 1)
+        return self.scores[lower] + (self.scores[upper] - self.scores[lower]) * (position - lower)
+
+    def histogram(self):
+        """
+        Returns one ``{"bin_start", "bin_end", "count"}`` dict per bin.
+        """
+        width = (self.high - self.low) / self.bins
+        return [
+            {"bin_start": self.low + i * width, "bin_end": self.low + (i + 1) * width, "count": count}
+            for i, count in enumerate(self.counts)
+        ]
+
+    def box(self):
+        """
+        Returns the five-number summary (``min``, ``q1``, ``median``, ``q3``, ``max``) for a box plot.
+        """
+        return {
+            "min": self.min,
+            "q1": self.quantile(0.25),
+            "median": self.quantile(0.5),
+            "q3": self.quantile(0.75),
+            "max": self.max,
+        }
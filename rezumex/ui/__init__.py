@@ -0,0 +1,25 @@
+"""
+Streamlit pages of the RezumeX app.
+
+``app.py`` imports only the module of the page being shown (see ``PAGES``),
+so heavy dependencies such as pandas and the PDF stack are loaded
+on first use of a page that needs them rather than on every cold start.
+"""
+import importlib
+
+# session_state.user_type -> module exposing render()
+PAGES = {
+    "welcome": "rezumex.ui.welcome",
+    "hr": "rezumex.ui.hr",
+    "user_with_job_role": "rezumex.ui.job_role",
+    "linkedin": "rezumex.ui.linkedin",
+    "general_user": "rezumex.ui.career",
+    "cover_letter_generator": "rezumex.ui.cover_letter",
+}
+
+
+def render_page(user_type):
+    """
+    Imports the page for ``user_type`` (the welcome page if unknown) and renders it.
+    """
+    importlib.import_module(PAGES.get(user_type, PAGES["welcome"])).render()
@@ -0,0 +1,70 @@
+"""
+Sidebar panel with the pipeline metrics of this server process and the
+background job workers (see ``rezumex.metrics``).
+
+Shown unless ``REZUMEX_ADMIN_PANEL`` is set to 0.
+"""
+import os
+
+import streamlit as st
+
+from rezumex.metrics import METRICS
+from rezumex.ui.common import get_shared_metrics
+
+ADMIN_PANEL = os.getenv("REZUMEX_ADMIN_PANEL", "1") != "0"
+
+
+def _by_label(metrics, name, label):
+    # Counter values of ``name`` keyed by one of its labels
+    return {dict(labels).get(label): value for labels, value in metrics.counters(name).items()}
+
+
+def _hit_rate(metrics, cache):
+    lookups = {dict(labels)["result"]: value for labels, value in metrics.counters("rezumex_cache_lookups_total").items()
+               if dict(labels).get("cache") == cache}
+    total = sum(lookups.values())
+    return f"{lookups.get('hit', 0) / total:.0%} of {total:,}" if total else "–"
+
+
+def show_metrics_panel():
+    """
+    Renders stage latencies, Gemini usage, cache hit rates, OCR pages and failures in a sidebar expander.
+    """
+    if not ADMIN_PANEL:
+        return
+
+    with st.sidebar.expander("🛠️ Pipeline Metrics"):
+        shared = get_shared_metrics()
+        metrics = shared.combined(METRICS)
+        stages = metrics.stages()
+        if stages:
+            rows = ["| Stage | Calls | Mean | p50 | p95 |", "|---|---:|---:|---:|---:|"]
+            rows += [f"| {s['stage']} | {s['count']:,} | {s['mean']:.3f}s | ≤{s['p50']:g}s | ≤{s['p95']:g}s |"
+                     for s in stages]
+            st.markdown("\n".join(rows))
+        else:
+            st.caption("No resumes processed yet")
+
+        requests = _by_label(metrics, "rezumex_llm_requests_total", "outcome")
+        tokens = _by_label(metrics, "rezumex_llm_tokens_total", "kind")
+        col1, col2 = st.columns(2)
+        col1.metric("Gemini Calls", f"{requests.get('ok', 0):,}", delta=f"{requests.get('error', 0)} failed",
+                    delta_color="inverse")
+        col2.metric("Tokens", f"{tokens.get('prompt', 0) + tokens.get('output', 0):,}",
+                    delta=f"{tokens.get('output', 0):,} output", delta_color="off")
+
+        pages = _by_label(metrics, "rezumex_pages_total", "backend")
+        ocr_pages = sum(count for backend, count in pages.items() if backend.startswith("ocr"))
+        failures = _by_label(metrics, "rezumex_failures_total", "stage")
+        st.caption(
+            f"Cache hits: responses {_hit_rate(metrics, 'response')}, PDFs {_hit_rate(metrics, 'extraction')}  \n"
+            f"Pages: {sum(pages.values()):,} extracted, {ocr_pages:,} needed OCR  \n"
+            f"Failures: {failures.get('parse', 0)} parsing, {failures.get('analyze', 0)} analysis, "
+            f"{metrics.counter('rezumex_analysis_fallbacks_total')} free-text fallbacks"
+        )
+
+        st.download_button("Download Prometheus metrics", metrics.to_prometheus(), file_name="rezumex_metrics.prom",
+                           mime="text/plain")
+        if st.button("Reset metrics"):
+            METRICS.reset()
+            shared.clear()  # Workers reset their own registries on their next publish
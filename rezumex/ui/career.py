@@ -0,0 +1,245 @@
+"""
+Career Path Explorer: suggests roles, learning and salaries from a resume's skills.
+"""
+import re
+
+import streamlit as st
+
+from rezumex.ui.common import extract_pdf, get_knowledge_base, input_pdf_setup, set_user_type
+
+
+def extract_industries_from_resume(resume_text):
+    """
+    Extracts relevant industries from the resume text.
+
+    Args:
+        resume_text (str): The text content of the resume.
+
+    Returns:
+        list: A list of industries mentioned in the resume.
+    """
+
+    # Placeholder - Replace with your industry extraction logic
+    industries = re.findall(r"\b(Software|Data Science|Web Development|Finance|Healthcare|Education)\b", resume_text, re.IGNORECASE)  # Example industries
+    return list(set(industries))
+# =============================================================================================================================================
+
+
+def get_job_postings(skills, industries=None, num_jobs=10):  # Replace with your actual data source
+    """
+    Retrieves job postings based on skills and industries.
+
+    Args:
+        skills (list): A list of skills to search for.
+        industries (list, optional): A list of industries to filter by. Defaults to None.
+        num_jobs (int, optional): The maximum number of jobs to retrieve. Defaults to 10.
+
+    Returns:
+        list: A list of dictionaries, where each dictionary represents a job posting.
+              Each job posting should at least have 'title', 'company', 'description', 'link', 'industry' (if available).
+    """
+
+    # Placeholder - Replace with your actual job data retrieval logic (API, dataset, etc.)
+    # Example using a dummy dataset:
+    dummy_jobs = [
+        {"title": "Software Engineer", "company": "Tech Co.", "description": "...", "link": "...", "industry": "Software"},
+        {"title": "Data Scientist", "company": "Data Inc.", "description": "...", "link": "...", "industry": "Data Science"},
+        {"title": "Web Developer", "company": "Web Solutions", "description": "...", "link": "...", "industry": "Web Development"},
+        # ... more dummy jobs
+    ]
+
+    # Filter by industry if provided
+    filtered_jobs = dummy_jobs if industries is None else [
+        job for job in dummy_jobs if job["industry"] in industries
+    ]
+
+    # Filter by skills (simple keyword matching for now)
+    skill_matched_jobs = []
+    for job in filtered_jobs:
+        for skill in skills:
+            if skill.lower() in job["description"].lower(): # Simple keyword matching
+                skill_matched_jobs.append(job)
+                break # only add job once if it matches multiple skills.
+
+    return skill_matched_jobs[:num_jobs]  # Return up to num_jobs
+
+# =============================================================================================================================================
+
+def extract_skills_from_resume(resume_text):
+    """
+    Extracts skills from the resume text using Gemini or other methods.
+    (Adapt this to use your existing resume parsing logic or Gemini if needed)
+
+    Args:
+        resume_text (str): The text content of the resume.
+
+    Returns:
+        list: A list of skills extracted from the resume.
+    """
+    # Placeholder - Replace with your resume parsing logic
+    # Example (using regex - improve as needed):
+    skills = re.findall(r"\b(Python|Java|C++|SQL|Machine Learning|Deep Learning|Data Analysis|Communication|Project Management)\b", resume_text, re.IGNORECASE)
+    return list(set(skills))  # Remove duplicates
+
+# =============================================================================================================================================
+
+# Function to extract text from PDF
+def convert_pdf_to(pdf_content):
+    try:
+        document = extract_pdf(pdf_content)
+        if document["ocr"]:
+            st.warning("The PDF appears to be scanned or image-based. Text was extracted using OCR.")
+        return document["text"] or None
+
+    except Exception as e:
+        st.error(f"Error reading or processing PDF: {e}. Please check if the file is valid and not encrypted.")
+        return None
+
+
+# Function to extract skills from resume text
+def extract_skills_from(resume_text):
+    # One pass over the text for the whole vocabulary (compiled once per process)
+    return get_knowledge_base().skill_matcher.match(resume_text)
+
+# Function to rank job roles by how well the skills cover their requirements
+def rank_job_roles(skills, top_k=None):
+    """
+    Returns dicts with 'role', 'score' (0-1 share of the role's skills found) and 'matched' skills, best first.
+    Only roles sharing at least one skill are included.
+    """
+    return get_knowledge_base().rank_roles(skills, top_k=top_k)
+
+# Function to suggest job roles based on skills
+def suggest_job_roles(skills, top_k=None):
+    return [match["role"] for match in rank_job_roles(skills, top_k=top_k)]
+
+# Function to suggest trending technologies
+def suggest_trending_technologies():
+    """
+    Returns a list of trending technologies.
+    """
+    return get_knowledge_base().trending_technologies
+
+
+# Function to suggest online courses
+def suggest_online_courses(job_role):
+    """
+    Suggests online courses based on the job role.
+    """
+    return get_knowledge_base().courses.get(job_role, ["No specific courses found for this role."])
+
+
+def suggest_salary_expectations(job_role):
+    """
+    Suggests salary expectations based on the job role.
+    """
+    return get_knowledge_base().salaries.get(job_role, "Salary data not available for this role.")
+
+
+def render():
+    st.title("🎯 Career Path Explorer")
+    st.subheader("Discover your best-fit roles based on your resume")
+    
+    if st.button("🏠 Back to Home"):
+        set_user_type("welcome")
+    
+    with st.container():
+        uploaded_file = st.file_uploader("📄 Upload Your Resume (PDF)", 
+                                       type=["pdf"],
+                                       help="We'll analyze your skills and suggest matching careers")
+    
+    if uploaded_file:
+        with st.spinner("🔍 Analyzing your resume..."):
+            try:
+                # Extract text from PDF
+                resume_text = input_pdf_setup(uploaded_file)
+                
+                if not resume_text:
+                    st.error("❌ Could not extract text. Please upload a searchable PDF.")
+                    st.info("💡 Tip: If your resume is scanned, try converting it to a text-based PDF first")
+                   
+                
+                # Extract skills
+                skills = extract_skills_from(resume_text)
+                
+                if not skills:
+                    st.warning("⚠️ No skills detected. Please check if your resume contains technical/professional skills")
+                   
+                
+                # Display results in tabs
+                tab1, tab2, tab3, tab4 = st.tabs(["💼 Job Matches", "🚀 Skills", "📚 Learning", "💰 Salaries"])
+                
+                with tab1:
+                    st.subheader("Your Best Career Matches")
+                    role_matches = rank_job_roles(skills, top_k=9)  # Show top 9
+                    job_roles = [match["role"] for match in role_matches]
+                    
+                    if not role_matches:
+                        st.info("No matching roles found for the detected skills")
+                    cols = st.columns(3)
+                    for i, match in enumerate(role_matches):
+                        with cols[i%3]:
+                            with st.container(border=True):
+                                st.markdown(f"**{i+1}. {match['role']}**")
+                                st.progress(match["score"], text=f"{match['score']:.0%} skill match")
+                                st.caption(", ".join(match["matched"]))
+                
+                with tab2:
+                    st.subheader("Your Skills Analysis")
+                    
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        st.markdown("#### 🛠️ Technical Skills")
+                        tech_skills = [s for s in skills if s in [
+                            "Python", "Java", "SQL", "Machine Learning", "AWS"]]
+                        for skill in tech_skills:
+                            st.markdown(f"- ✅ {skill}")
+                    
+                    with col2:
+                        st.markdown("#### 🤝 Professional Skills")
+                        soft_skills = [s for s in skills if s in [
+                            "Communication", "Project Management", "Leadership"]]
+                        for skill in soft_skills or ["None detected"]:
+                            st.markdown(f"- ✨ {skill}")
+                    
+                    st.markdown("---")
+                    st.subheader("🔥 Trending Technologies")
+                    trending = suggest_trending_technologies()
+                    st.write("Consider adding these to your skillset:")
+                    for tech in trending:
+                        st.markdown(f"- 🌟 {tech}")
+                
+                with tab3:
+                    if job_roles:
+                        primary_role = job_roles[0]
+                        st.subheader(f"📖 Recommended Learning for {primary_role}")
+                        
+                        courses = suggest_online_courses(primary_role)
+                        for course in courses[:5]:  # Limit to top 5
+                            st.markdown(f"""
+                            <div style="padding:10px;border-radius:5px;background:#f0f2f6;margin:5px">
+                            🎓 **{course}**  
+                            <small>[Find on Google](https://www.google.com/search?q={course.replace(' ','+')})</small>
+                            </div>
+                            """, unsafe_allow_html=True)
+                
+                with tab4:
+                    if job_roles:
+                        st.subheader("💵 Expected Salary Ranges")
+                        
+                        cols = st.columns(3)
+                        for i, role in enumerate(job_roles[:3]):  # Top 3 roles
+                            salary = suggest_salary_expectations(role)
+                            with cols[i]:
+                                with st.container(border=True):
+                                    st.markdown(f"**{role}**")
+                                    st.markdown(f"`{salary}`")
+                                    st.markdown("*Median range*")
+                
+                # Success message
+                st.balloons()
+                st.success("🎉 Analysis complete! Explore the tabs above for personalized recommendations")
+            
+            except Exception as e:
+                st.error(f"❌ Analysis failed: {str(e)}")
+                st.exception(e) if st.toggle("Show technical details") else None
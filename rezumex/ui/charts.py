@@ -0,0 +1,55 @@
+"""
+Vega-Lite specs for the HR summary charts.
+
+The specs carry precomputed bins and quartiles from ``ScoreStats`` rather
+than the raw scores; the browser draws them, so no figure objects are
+created (or leaked) on the server.
+"""
+
+
+def histogram_spec(stats):
+    """
+    Bar chart of the precomputed ATS score histogram.
+    """
+    return {
+        "data": {"values": stats.histogram()},
+        "mark": {"type": "bar", "color": "skyblue", "stroke": "black"},
+        "encoding": {
+            "x": {
+                "field": "bin_start", "type": "quantitative", "bin": {"binned": True},
+                "scale": {"domain": [stats.low, stats.high]}, "title": "ATS Score (%)",
+            },
+            "x2": {"field": "bin_end"},
+            "y": {"field": "count", "type": "quantitative", "title": "Number of Candidates"},
+        },
+    }
+
+
+def box_spec(stats):
+    """
+    Horizontal box plot (min/max whiskers) of the precomputed five-number summary.
+    """
+    return {
+        "data": {"values": [stats.box()]},
+        "height": 120,
+        "layer": [
+            {
+                "mark": {"type": "rule"},
+                "encoding": {
+                    "x": {
+                        "field": "min", "type": "quantitative",
+                        "scale": {"domain": [stats.low, stats.high]}, "title": "ATS Score Distribution",
+                    },
+                    "x2": {"field": "max"},
+                },
+            },
+            {
+                "mark": {"type": "bar", "size": 40, "color": "skyblue", "stroke": "black"},
+                "encoding": {"x": {"field": "q1", "type": "quantitative"}, "x2": {"field": "q3"}},
+            },
+            {
+                "mark": {"type": "tick", "size": 40, "color": "black", "thickness": 2},
+                "encoding": {"x": {"field": "median", "type": "quantitative"}},
+            },
+        ],
+    }
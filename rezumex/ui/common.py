@@ -0,0 +1,126 @@
+"""
+Process-wide resources and helpers shared by the pages.
+
+Heavy dependencies (the Gemini SDK, the PDF stack) are imported inside the
+functions that need them, so a page only pays for what it uses.
+"""
+import streamlit as st
+
+from rezumex import screening
+from rezumex.cache import ExtractionCache, ResponseCache
+from rezumex.knowledge import load_knowledge_base
+from rezumex.metrics import METRICS
+
+
+@st.cache_resource(show_spinner=False)
+def get_llm_client():
+    # One configured LLM client (and warm connection) per server process; REZUMEX_LLM_BACKEND picks the backend
+    from rezumex.llm import create_client
+    return create_client()
+
+
+@st.cache_resource(show_spinner=False)
+def get_response_cache():
+    # One cache (and one set of hit/miss counters) per server process
+    return ResponseCache()
+
+
+@st.cache_resource(show_spinner=False)
+def get_extraction_cache():
+    # Extracted PDFs shared by every session, so reruns and re-uploads skip parsing and OCR
+    from rezumex.extraction import EXTRACTOR_VERSION
+    return ExtractionCache(EXTRACTOR_VERSION)
+
+
+# Skills, roles, courses and salaries (rezumex/data/knowledge_base.json), loaded once per process
+@st.cache_resource(show_spinner=False)
+def get_knowledge_base():
+    return load_knowledge_base()
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_queue():
+    from rezumex.jobs import JobQueue
+    return JobQueue()
+
+
+@st.cache_resource(show_spinner=False)
+def get_job_workers():
+    # Background screening workers outlive browser sessions; set REZUMEX_JOB_WORKERS=0 to run them separately
+    from rezumex.jobs import DEFAULT_WORKERS, start_workers
+    return start_workers(DEFAULT_WORKERS) if DEFAULT_WORKERS > 0 else None
+
+
+@st.cache_resource(show_spinner=False)
+def get_shared_metrics():
+    # Snapshots published by the background job workers, merged into the sidebar and the exports
+    from rezumex.metrics import SharedMetrics
+    return SharedMetrics()
+
+
+@st.cache_resource(show_spinner=False)
+def get_metrics_exporter():
+    # Prometheus endpoint and/or textfile, if REZUMEX_METRICS_PORT / REZUMEX_METRICS_PATH are set
+    from rezumex.metrics import METRICS_PATH, METRICS_PORT, start_exporter
+    return start_exporter(shared=get_shared_metrics()) if METRICS_PORT or METRICS_PATH else None
+
+
+def set_user_type(user_type):
+    st.session_state.user_type = user_type
+
+
+def get_gemini_response(prompt, text_data, input_text, **generation_config):
+    return screening.get_gemini_response(get_llm_client(), get_response_cache(), prompt, text_data, input_text,
+                                         **generation_config)
+
+
+def extract_pdf(pdf_bytes):
+    """
+    Returns the extracted document (``text``, ``pages``, ``ocr``) of a PDF, parsing it only on a cache miss.
+    """
+    from rezumex.extraction import extract_document
+
+    def extract(pdf_bytes):
+        with METRICS.timer("extract"):
+            document = extract_document(pdf_bytes)
+        METRICS.record_document(document)
+        return document
+
+    return get_extraction_cache().get_or_extract(pdf_bytes, extract)
+
+
+def input_pdf_setup(uploaded_file):
+    if uploaded_file is not None:
+        try:
+            # Read PDF bytes
+            pdf_bytes = uploaded_file.getvalue()
+
+            # PyMuPDF text layer per page, OCR only for the scanned pages
+            document = extract_pdf(pdf_bytes)
+            ocr_pages = [page["page"] for page in document["pages"] if page["backend"] == "ocr"]
+            if ocr_pages:
+                st.info(f"Scanned page(s) {', '.join(map(str, ocr_pages))} were read with OCR.")
+
+            if not document["text"]:
+                if any(page["backend"] == "ocr_failed" for page in document["pages"]):
+                    st.error("OCR failed. Please upload a searchable PDF.")
+                return None
+
+            return document["text"]
+        except Exception as e:
+            st.error(f"Error reading PDF: {e}")
+            return None
+    return None
+
+
+def convert_pdf_to_text(pdf_content):
+    """Handle both text-based and image-based PDFs (scanned pages are OCRed)"""
+    try:
+        document = extract_pdf(pdf_content)
+        if document["ocr"]:
+            st.warning("The PDF appears to be scanned or image-based. Text was extracted using OCR.")
+        return document["text"] or None
+
+    except Exception as e:
+        st.error(f"PDF processing error: {e}")
+        return None
@@ -0,0 +1,86 @@
+"""
+Cover letter generator.
+"""
+import streamlit as st
+
+from rezumex.ui.common import get_llm_client, get_response_cache, set_user_type
+
+
+def generate_cover_letter(resume_data, job_data, preferences=None, stream=False):
+    """
+    Generate a cover letter using Gemini API.
+    With stream=True, returns an iterator of text chunks (for st.write_stream) instead of the full text.
+    """
+    prompt = f"""
+    Write a compelling cover letter for a candidate with the following resume information:
+
+    Applicant Name: {resume_data['name']}
+    Contact Information: {resume_data.get('contact', {})}
+    Skills: {resume_data['skills']}
+    Experience: {resume_data.get('experience', [])} 
+    Education: {resume_data.get('education', [])}   
+    Summary/Objective: {resume_data.get('summary', '')} 
+
+    They are applying for the following job:
+
+    Job : {job_data['job_title']}
+    Company Name: {job_data['company_name']}
+    Job Description: {job_data['job_description']}
+    Key Requirements/Keywords: {job_data.get('key_requirements', [])}
+
+    Preferences: {preferences or {}}
+
+    Consider the applicant's skills and experience and tailor the cover letter to the specific job description. The cover letter should be professional and persuasive.
+    and give only a applicant name not give 'Your name'"""
+
+    llm = get_llm_client()
+    response_cache = get_response_cache()
+    if stream:
+        return response_cache.get_or_stream((llm.model_name, prompt), lambda: llm.generate_stream(prompt))
+    return response_cache.get_or_compute((llm.model_name, prompt), lambda: llm.generate(prompt))
+
+
+def render():
+    st.title("Cover Letter Generator")
+    if st.button("Back to Home"):
+        set_user_type("welcome") 
+    # Initialize resume and job data
+    resume_data = {}  
+    job_data = {  
+        "job_title": "",
+        "company_name": "",
+        "job_description": "",
+        "key_requirements": ""
+    }
+
+    # Form for user input
+    with st.form("cover_letter_form"):
+        resume_data['name'] = st.text_input("Your Name", placeholder="Enter Your Name")
+        resume_data['contact'] = {
+            'email': st.text_input("Your Email", placeholder="Enter Your Email"), 
+            'phone': st.text_input("Your Phone", placeholder="Enter Your Phone"), 
+            'linkedin': st.text_input("Your LinkedIn Profile (Optional)", placeholder="Enter Your LinkedIn Profile")
+        }
+        resume_data['skills'] = st.text_area("Your Skills (comma-separated)", placeholder="Enter your skills, separated by commas")
+        job_data["job_title"] = st.text_input("Job Title", placeholder="Enter Job Title")
+        job_data["company_name"] = st.text_input("Company Name", placeholder="Enter Company Name")
+        job_data["job_description"] = st.text_area("Job Description", placeholder="Enter Job Description", height=200)
+        job_data["key_requirements"] = st.text_area("Key Requirements", placeholder="Enter Key Requirements", height=100)
+        submitted = st.form_submit_button("Generate Cover Letter")
+
+    # Generate cover letter on form submission
+    if submitted:
+        # Convert skills text to a list
+        resume_data['skills'] = [skill.strip() for skill in resume_data['skills'].split(',')]
+
+        # Generate cover letter using Gemini API, rendering it as it streams in
+        st.subheader("Generated Cover Letter")
+        cover_letter = st.write_stream(generate_cover_letter(resume_data, job_data, stream=True))
+
+        # Option to download the cover letter
+        st.download_button(
+            label="Download Cover Letter",
+            data=cover_letter,
+            file_name="cover_letter.txt",
+            mime="text/plain"
+        )            
@@ -0,0 +1,360 @@
+"""
+HR dashboard: screens a batch of resumes against one job description.
+"""
+import hashlib
+import time
+
+import pandas as pd
+import streamlit as st
+
+from rezumex import screening
+from rezumex.analysis import JSON_GENERATION_CONFIG
+from rezumex.batch import DEFAULT_MAX_IN_FLIGHT, NO_TEXT_ERROR, analyze_batch, analyze_texts, parse_batch
+from rezumex.cache import cache_key
+from rezumex.compaction import compact_resume
+from rezumex.dedup import Deduplicator, with_duplicates
+from rezumex.metrics import METRICS, STAGE_SECONDS
+from rezumex.packing import BATCH_GENERATION_CONFIG, MAX_CANDIDATES_PER_REQUEST, analyze_packed, is_complete_response
+from rezumex.prompts import HR_ANALYSIS_PROMPT
+from rezumex.scoring import score_resumes, shortlist
+from rezumex.stats import ScoreStats
+from rezumex.ui.charts import box_spec, histogram_spec
+from rezumex.ui.common import get_extraction_cache, get_job_queue, get_llm_client, get_response_cache, set_user_type
+
+# HR analyses kept in the session (one per job description + set of resumes)
+HR_RESULTS_TO_KEEP = 5
+# How often the HR page refreshes the status of unfinished background jobs
+JOB_POLL_SECONDS = 5
+# Minimum time between redraws of the live results while a batch is being analysed
+LIVE_REFRESH_SECONDS = 0.5
+
+
+def show_live_results(placeholder, results, stats, total):
+    """
+    Redraws the partial results of a running batch: running score statistics
+    and the candidates analysed so far, best first.
+
+    Args:
+        placeholder: ``st.empty()`` slot the live view is drawn into.
+        results (list): Analysed candidates so far (one dict per resume).
+        stats (ScoreStats): Running statistics over their ATS scores.
+        total (int): Number of resumes in the batch.
+    """
+    live_df = pd.DataFrame(results)
+    if stats.count:
+        live_df = live_df.sort_values('ATS Score', ascending=False)
+    with placeholder.container():
+        col1, col2 = st.columns(2)
+        with col1:
+            if stats.count:
+                st.metric("Top Score So Far", f"{stats.max:g}%", delta=f"{stats.mean:.1f}% avg")
+            st.metric("Candidates Analyzed", f"{len(results)}/{total}")
+        with col2:
+            if stats.count:
+                st.vega_lite_chart(histogram_spec(stats), use_container_width=True)
+        st.dataframe(live_df, use_container_width=True)
+
+
+def render():
+    llm = get_llm_client()
+    response_cache = get_response_cache()
+    extraction_cache = get_extraction_cache()
+    job_queue = get_job_queue()
+
+    st.title("📊 HR Dashboard")
+    st.markdown("---")
+    
+    # Input Section
+    col1, col2 = st.columns(2)
+    with col1:
+        input_text = st.text_area("✍️ Enter Job Description:", height=250)
+    with col2:
+        uploaded_files = st.file_uploader("📤 Upload Resumes (PDFs)", 
+                                        type=["pdf"], 
+                                        accept_multiple_files=True)
+    
+    if st.button("🏠 Back to Home"):
+        set_user_type("welcome")
+
+    background_jobs = job_queue.list_jobs()
+
+    @st.fragment(run_every=JOB_POLL_SECONDS if any(not job["status"]["finished"] for job in background_jobs) else None)
+    def show_background_jobs():
+        jobs = job_queue.list_jobs()
+        if not jobs:
+            return
+        st.subheader("🌙 Background Jobs")
+        for job in jobs:
+            status = job["status"]
+            processed = status["done"] + status["failed"] + status["cancelled"]
+            label = f"{job['name']} — {processed}/{status['total']} processed, {status['failed']} failed"
+            st.progress(processed / status["total"] if status["total"] else 1.0,
+                        text=label if status["finished"] else f"⏳ {label}")
+
+        jobs_by_id = {job["id"]: job for job in jobs}
+        if "hr_queued_job" in st.session_state:
+            st.session_state.hr_selected_job = st.session_state.pop("hr_queued_job")
+        if st.session_state.get("hr_selected_job") not in jobs_by_id:
+            st.session_state.pop("hr_selected_job", None)
+        selected_id = st.selectbox("View results of job:", list(jobs_by_id), key="hr_selected_job",
+                                   format_func=lambda job_id: f"{jobs_by_id[job_id]['name']} ({job_id})")
+        selected_job = jobs_by_id[selected_id]
+        job_rows, job_failures = job_queue.results(selected_job["id"])
+        if job_rows:
+            job_df = pd.DataFrame(job_rows)
+            if 'ATS Score' in job_df.columns:
+                job_df.sort_values('ATS Score', ascending=False, inplace=True)
+            st.dataframe(job_df, use_container_width=True)
+            st.download_button("📥 Download results (CSV)", job_df.to_csv(index=False),
+                               file_name=f"rezumex_job_{selected_job['id']}.csv", mime="text/csv")
+        for filename, error in job_failures:
+            st.warning(f"{filename}: {error}")
+
+        col1, col2 = st.columns(2)
+        with col1:
+            if not selected_job["status"]["finished"] and st.button("⏹️ Cancel job"):
+                job_queue.cancel(selected_job["id"])
+                st.rerun()
+        with col2:
+            if selected_job["status"]["finished"] and st.button("🗑️ Delete job"):
+                job_queue.delete(selected_job["id"])
+                st.rerun()
+
+    show_background_jobs()
+
+    if uploaded_files and input_text:
+        st.success(f"✅ {len(uploaded_files)} resumes uploaded for analysis")
+        
+        max_in_flight = st.number_input("⚡ Concurrent analyses", min_value=1, max_value=32,
+                                        value=DEFAULT_MAX_IN_FLIGHT,
+                                        help="How many resumes are sent to Gemini at the same time")
+
+        prescreen = st.checkbox("🎯 Pre-screen by keyword match", value=len(uploaded_files) > 20,
+                                help="Score every resume locally against the job description and only send the best matches to Gemini")
+        if prescreen:
+            top_n = st.number_input("Send top N resumes to Gemini", min_value=1, max_value=len(uploaded_files),
+                                    value=min(20, len(uploaded_files)))
+
+        structured = st.checkbox("🧾 Structured JSON analysis", value=True,
+                                 help="Ask Gemini for schema-constrained JSON instead of free text (free-text parsing remains the fallback)")
+        per_request = 1
+        if structured:
+            per_request = st.number_input("📦 Resumes per Gemini request", min_value=1, max_value=MAX_CANDIDATES_PER_REQUEST,
+                                          value=min(5, MAX_CANDIDATES_PER_REQUEST),
+                                          help="Pack several resumes into one request; oversized or incomplete batches are split automatically")
+
+        stream = st.checkbox("📡 Stream results as they finish", value=True,
+                             help="Show a ranked table and running score statistics while the rest of the batch is "
+                                  "still being analysed")
+
+        background = st.checkbox("🌙 Run as background job", value=len(uploaded_files) > 100,
+                                 help="Queue the batch for the background workers; it keeps running if you close this tab "
+                                      "and resumes after a restart")
+
+        # Results survive reruns (slider, selectbox) as long as the JD and files are unchanged
+        documents = [(uploaded_file.name, uploaded_file.getvalue()) for uploaded_file in uploaded_files]
+        results_key = cache_key(input_text, [hashlib.sha256(pdf_bytes).hexdigest() for _, pdf_bytes in documents])
+        hr_results = st.session_state.setdefault("hr_results", {})
+
+        analyze_clicked = st.button("🔍 Analyze Resumes", type="primary")
+        if analyze_clicked and background:
+            job_id = job_queue.submit(input_text, documents, HR_ANALYSIS_PROMPT,
+                                      generation_config=JSON_GENERATION_CONFIG if structured else {},
+                                      name=f"{len(documents)} resumes — {' '.join(input_text.split())[:40]}")
+            st.session_state.hr_queued_job = job_id
+            st.rerun()
+
+        elif analyze_clicked:
+            all_results = []
+            progress_bar = st.progress(0)
+            status_text = st.empty()
+            live_results = st.empty()
+            live_stats = ScoreStats()
+            last_refresh = 0.0
+
+            def analyze_resume(resume_text):
+                # Runs on a worker thread: no Streamlit calls in here
+                return screening.analyze_resume(llm, response_cache, resume_text, input_text, structured=structured)
+
+            def generate_packed(contents):
+                # Instructions and job description, then one part per candidate (see build_batch_contents);
+                # a partial response is not cached, or every rerun would replay it and split the group again
+                size = len(contents) - 2
+                return response_cache.get_or_compute(
+                    (llm.model_name, contents, BATCH_GENERATION_CONFIG),
+                    lambda: llm.generate(contents, **BATCH_GENERATION_CONFIG),
+                    validate=lambda response: is_complete_response(response, size),
+                )
+
+            def report_failure(filename, error):
+                if error == NO_TEXT_ERROR:
+                    st.warning(f"Skipped {filename}: No text extracted")
+                else:
+                    st.error(f"❌ Error analyzing {filename}: {error}")
+
+            # Re-uploaded files are neither parsed nor analysed; they reuse their original's result
+            dedup = Deduplicator()
+            unique_documents = dedup.unique_documents(documents)
+
+            keyword_scores = {}
+            tokens_saved = {}
+            if prescreen or per_request > 1:
+                # Parse everything first so resumes can be ranked and/or packed into shared requests
+                texts = []
+                for i, (filename, resume_text, error) in enumerate(parse_batch(unique_documents,
+                                                                                extraction_cache=extraction_cache)):
+                    progress_bar.progress((i + 1) / len(unique_documents))
+                    status_text.text(f"Extracted {i+1}/{len(unique_documents)}: {filename[:30]}...")
+                    if error:
+                        report_failure(filename, error)
+                    else:
+                        texts.append((filename, resume_text))
+                texts = dedup.unique_texts(texts)
+
+                if prescreen:
+                    # Score the whole batch in one vectorised pass, analyse only the best
+                    scores = score_resumes(input_text, [resume_text for _, resume_text in texts])
+                    keyword_scores = {filename: score for (filename, _), score in zip(texts, scores)}
+                    texts = [texts[i] for i in shortlist(scores, top_n)]
+                    st.info(f"🎯 Pre-screen sent the top {len(texts)} of {len(keyword_scores)} resumes to Gemini")
+
+                copies = dedup.copies()
+                total = len(texts) + sum(len(copies.get(filename, ())) for filename, _ in texts)
+                if per_request > 1:
+                    # Packed requests bypass analyze_resume, so compact here (single-resume fallbacks are no-ops)
+                    compacted = {filename: compact_resume(resume_text) for filename, resume_text in texts}
+                    tokens_saved = {filename: result["tokens_saved"] for filename, result in compacted.items()}
+                    texts = [(filename, compacted[filename]["text"]) for filename, _ in texts]
+                    results = analyze_packed(texts, generate_packed, HR_ANALYSIS_PROMPT, input_text, analyze_resume,
+                                             max_candidates=per_request, max_in_flight=max_in_flight)
+                else:
+                    results = analyze_texts(texts, analyze_resume, max_in_flight=max_in_flight)
+                results = with_duplicates(results, copies)
+            else:
+                # Duplicate texts are detected inside the pipeline, identical files already are
+                total = len(documents)
+                copies = dedup.copies()
+                results = with_duplicates(analyze_batch(unique_documents, analyze_resume, max_in_flight=max_in_flight,
+                                                        dedupe=dedup.check_text, extraction_cache=extraction_cache),
+                                           copies)
+
+            progress_bar.progress(0)
+            for i, (filename, extracted_info, error) in enumerate(results):
+                # Update progress as each resume lands
+                progress_bar.progress((i + 1) / total)
+                status_text.text(f"Analyzed {i+1}/{total}: {filename[:30]}...")
+
+                if error:
+                    report_failure(filename, error)
+                    continue
+
+                extracted_info["Filename"] = filename
+                original = dedup.original(filename)
+                if original in keyword_scores:
+                    extracted_info["Keyword Match"] = round(float(keyword_scores[original]) * 100, 1)
+                if original in tokens_saved:
+                    extracted_info["Tokens Saved"] = tokens_saved[original]
+                if filename in dedup.duplicates:
+                    extracted_info["Duplicate Of"] = f"{original} ({dedup.duplicates[filename][1]})"
+                all_results.append(extracted_info)
+                # Each candidate counts once in the score statistics, however often it was uploaded
+                if 'ATS Score' in extracted_info and filename not in dedup.duplicates:
+                    live_stats.add(extracted_info['ATS Score'])
+                if stream and (time.monotonic() - last_refresh >= LIVE_REFRESH_SECONDS or i + 1 == total):
+                    show_live_results(live_results, all_results, live_stats, total)
+                    last_refresh = time.monotonic()
+
+            progress_bar.empty()
+            status_text.empty()
+            live_results.empty()
+            
+            if not all_results:
+                st.error("No valid results generated")
+            saved = sum(row.get("Tokens Saved", 0) for row in all_results if row["Filename"] not in dedup.duplicates)
+            if saved:
+                st.caption(f"✂️ Resume compaction saved about {saved:,} prompt tokens in this batch")
+            # Only duplicates of an analysed resume got a result; the others share their original's fate
+            reused = sum(1 for row in all_results if row["Filename"] in dedup.duplicates)
+            if reused:
+                st.info(f"♻️ {reused} duplicate upload(s) reused the analysis of an earlier resume "
+                        "(see the 'Duplicate Of' column)")
+            if len(dedup.duplicates) > reused:
+                st.info(f"♻️ {len(dedup.duplicates) - reused} duplicate upload(s) were skipped because the resume "
+                        "they duplicate was not shortlisted or could not be analysed")
+
+            df = pd.DataFrame(all_results)
+            if 'Duplicate Of' in df.columns:
+                df['Duplicate Of'] = df['Duplicate Of'].fillna("")
+            stats = None
+            if 'ATS Score' in df.columns:
+                df.sort_values('ATS Score', ascending=False, inplace=True)
+                # The running statistics double as the chart data, so nothing is recomputed on reruns
+                stats = live_stats
+            hr_results.pop(results_key, None)
+            hr_results[results_key] = {"df": df, "stats": stats}
+            while len(hr_results) > HR_RESULTS_TO_KEEP:
+                hr_results.pop(next(iter(hr_results)))
+
+        # Display the stored results, sorted by ATS Score (descending)
+        stored = hr_results.get(results_key)
+        if stored is not None:
+            render_start = time.perf_counter()
+            df, stats = stored["df"], stored["stats"]
+            if stats is not None:
+                # Visualizations
+                st.markdown("---")
+                st.subheader("📈 Analysis Summary")
+                
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.metric("Top Candidate Score", 
+                             f"{stats.max:g}%",
+                             delta=f"{stats.mean:.1f}% avg")
+                    
+                    st.vega_lite_chart(histogram_spec(stats), use_container_width=True)
+                
+                with col2:
+                    st.metric("Candidates Analyzed", 
+                             len(df),
+                             delta=f"{len(uploaded_files) - len(df)} not analyzed")
+                    
+                    st.vega_lite_chart(box_spec(stats), use_container_width=True)
+                
+                # Detailed Results
+                st.markdown("---")
+                st.subheader("📋 Candidate Breakdown")
+                
+                # Interactive filtering
+                min_score = st.slider("Filter by minimum ATS score", 
+                                     min_value=0, 
+                                     max_value=100,
+                                     value=50)
+                
+                filtered_df = df[df['ATS Score'] >= min_score]
+                st.dataframe(filtered_df.style.highlight_max(subset=['ATS Score'], color='lightgreen'),
+                           use_container_width=True)
+                
+                # Individual candidate details
+                st.markdown("---")
+                st.subheader("🧑‍💼 Candidate Details")
+                
+                selected_file = st.selectbox("Select candidate to view details:",
+                                           filtered_df['Filename'])
+                
+                if selected_file:
+                    candidate_data = df[df['Filename'] == selected_file].iloc[0]
+                    with st.expander(f"Full analysis for {selected_file}"):
+                        for key, value in candidate_data.items():
+                            if key != 'Filename':
+                                st.markdown(f"**{key}**: {value}")
+            
+            else:
+                st.warning("No ATS scores were extracted from the analysis")
+            METRICS.observe(STAGE_SECONDS, time.perf_counter() - render_start, stage="render")
+
+    elif not input_text and uploaded_files:
+        st.warning("⚠️ Please enter a job description")
+    elif not uploaded_files and input_text:
+        st.warning("⚠️ Please upload resumes")
+    elif not uploaded_files and not input_text:
+        st.warning("⚠️ Please upload resumes and enter a job description")
@@ -0,0 +1,101 @@
+"""
+Job seeker with a target role: streams Gemini's review of one resume.
+"""
+import streamlit as st
+
+from rezumex.analysis import extract_ats_score
+from rezumex.compaction import compact_resume
+from rezumex.prompts import JOB_ROLE_PROMPT
+from rezumex.ui.common import get_knowledge_base, get_llm_client, get_response_cache, input_pdf_setup, set_user_type
+
+
+def extract_keywords_missing(response):
+    try:
+        lines = response.splitlines()
+        for line in lines:
+            if "Keywords Missing:" in line:
+                keywords_missing = line.split(":")[1].strip()
+                return keywords_missing
+        return "No Keywords Missing"
+    except:
+        return "Error in keywords missing"
+#===========================================================================================================================================
+def extract_final_thoughts(response):
+    try:
+        lines = response.splitlines()
+        for line in lines:
+            if "Final Thoughts:" in line:
+                final_thoughts = line.split(":")[1].strip()
+                return final_thoughts
+        return "No Final Thoughts"
+    except:
+        return "Error in final thoughts"
+
+
+def render():
+    llm = get_llm_client()
+    response_cache = get_response_cache()
+    job_roles = get_knowledge_base().job_titles
+
+    st.title("RezumeX - User (with Job Role)")
+    st.subheader("Application Tracking System")
+
+    if st.button("Back to Home"):
+        set_user_type("welcome")
+
+    # Job Role Selection
+    selected_job_role = st.selectbox("Select Job Role:", job_roles)
+    
+    # Input Validation
+    input_text = st.text_area("Enter Job Description:", height=200)
+    uploaded_file = st.file_uploader("Upload Your Resume (PDF)...", type=["pdf"])
+
+    if uploaded_file and input_text:
+        if st.button("Analyze Resume"):
+            try:
+                # Extract text
+                pdf_text = input_pdf_setup(uploaded_file)
+                
+                if not pdf_text:
+                    st.error("Failed to extract text from PDF. Please ensure the file is valid.")
+                    st.stop()
+                pdf_text = compact_resume(pdf_text)["text"]
+
+                # Prepare prompt
+                full_prompt = [
+                    JOB_ROLE_PROMPT.replace("[JOB_ROLE]", selected_job_role),
+                    f"Job Description:\n{input_text}",
+                    f"Resume:\n{pdf_text}",
+                ]
+                generation_config = {"temperature": 0.0, "max_output_tokens": 2048}
+
+                # Display results as they are generated
+                st.subheader("Resume Analysis Results")
+                st.markdown("---")
+                response_text = st.write_stream(response_cache.get_or_stream(
+                    (llm.model_name, full_prompt, generation_config),
+                    lambda: llm.generate_stream(full_prompt, **generation_config)
+                ))
+
+                # ATS Score visualization
+                try:
+                    ats_score = extract_ats_score(response_text)
+                    if ats_score:
+                        st.subheader("ATS Compatibility Score")
+                        st.progress(ats_score/100)
+                        st.caption(f"{ats_score}% match with job requirements")
+                except Exception as e:
+                    st.warning(f"Could not extract ATS score: {str(e)}")
+
+            except Exception as e:
+                st.error(f"Analysis failed: {str(e)}")
+                if st.toggle("Show technical details"):
+                    st.exception(e)
+
+    # Handle empty states
+    elif not input_text and uploaded_file:
+        st.warning("Please enter a job description to analyze against.")
+    elif not uploaded_file and input_text:
+        st.warning("Please upload your resume PDF for analysis.")
+    elif not uploaded_file and not input_text:
+        st.warning("Please upload your resume and enter a job description.")
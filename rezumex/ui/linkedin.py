@@ -0,0 +1,129 @@
+"""
+LinkedIn profile analyser.
+"""
+import re
+
+import streamlit as st
+
+from rezumex.skills import get_skill_matcher
+from rezumex.ui.common import get_llm_client, get_response_cache, set_user_type
+
+
+def generate_gemini_suggestions(linkedin_text, target_skills, job_description):
+    prompt = f"""
+    Analyze the following LinkedIn profile text against the provided job description and provide detailed suggestions for improvement.
+
+    LinkedIn Profile Text:
+    ```
+    {linkedin_text}
+    ```
+
+    Job Description:
+    ```
+    {job_description}
+    ```
+    Target Skills (for context):
+    ```
+    {", ".join(target_skills)}
+    ```
+
+    Focus on these areas in your suggestions:
+
+    * **Skills:** Are the required skills prominently featured and demonstrated?  Are there any missing skills list the skills in numbers format step by step ?
+    * **Experience:** Does the experience section effectively showcase relevant experience and accomplishments?  Are the achievements quantified?  How well does it align with the job requirements?
+    * **Projects:** Do the projects demonstrate the required skills and experience?  Are they well-described and impactful?
+    * **Summary/About:** Does the summary highlight the candidate's qualifications and how they match the job description?  Is it compelling and engaging?
+    * **Headline:** Is the headline professional, keyword-rich, and relevant to the target role?
+    * **Overall Fit:** How well does the candidate's profile align with the job description overall? What are their strengths and weaknesses?
+
+    Give me the suggestions in a list format, each suggestion starting with a "-". Be specific and actionable.
+    """
+
+    llm = get_llm_client()
+    response_cache = get_response_cache()
+    try:
+        suggestions_text = response_cache.get_or_compute(
+            (llm.model_name, prompt, 0.2),
+            lambda: llm.generate(prompt, temperature=0.2)
+        )
+        suggestions = [s.strip() for s in suggestions_text.splitlines() if s.strip()]
+        return suggestions
+    except Exception as e:
+        st.error(f"Error generating suggestions with Gemini: {e}")
+        return []
+
+# =============================================================================================================================================
+
+
+def analyze_linkedin_text(linkedin_text, target_skills):
+    skills_found = set(get_skill_matcher(tuple(target_skills)).match(linkedin_text))
+
+    skill_match_score = (len(skills_found) / len(target_skills)) * 100 if target_skills else 0
+
+    experience_years = 0
+    experience_matches = re.findall(r"(?:[0-9]+(?:\.[0-9]+)?)\s*(?:years?|yrs?)\s*of\s*experience", linkedin_text, re.IGNORECASE)
+    for match in experience_matches:
+        try:
+            years = float(match.split()[0])
+            experience_years += years
+        except ValueError:
+            pass
+
+    project_count = len(re.findall(r"(?:project|projects)\b", linkedin_text, re.IGNORECASE))
+
+    education_matches = re.findall(r"(?:Bachelor|Master|PhD|MBA|M.Tech|B.Tech) of (?:[a-zA-Z\s]+)", linkedin_text, re.IGNORECASE)
+    degrees = [match.strip() for match in education_matches]
+
+    return {
+        "skill_match_score": skill_match_score,
+        "skills_found": list(skills_found),
+        "experience_years": experience_years,
+        "project_count": project_count,
+        "degrees": degrees,
+    }
+
+
+def render():
+    st.title("LinkedIn Profile Analyzer")
+
+    if st.button("Back to Home"):
+        set_user_type("welcome") 
+
+    job_description = st.text_area("Paste the Job Description:", height=200)
+
+    linkedin_text = st.text_area("Paste your LinkedIn profile text:", height=300)
+
+    target_skills_str = st.text_area("Enter target skills :", height=68)
+
+    use_gemini = st.checkbox("Check The Box If You Want Profile Improving Suggestions As Well As Profile Analysis")
+
+    if st.button("Analyze"):
+        if not linkedin_text:
+            st.warning("Please paste your LinkedIn profile text.")
+        elif not target_skills_str:
+            st.warning("Please enter at least one target skill.")
+        elif not job_description:
+            st.warning("Please paste the job description.")
+        else:
+            target_skills = [skill.strip() for skill in target_skills_str.split(",")]
+            analysis_results = analyze_linkedin_text(linkedin_text, target_skills)
+
+            st.subheader("Analysis Results:")
+            st.write(f"**Skill Match Score:** {analysis_results['skill_match_score']:.2f}%")
+            st.write(f"**Skills Found:** {', '.join(analysis_results['skills_found']) or 'None'}")
+            st.write(f"**Years of Experience (approx.):** {analysis_results['experience_years']:.1f}")
+            st.write(f"**Project Count:** {analysis_results['project_count']}")
+            st.write(f"**Degrees:** {', '.join(analysis_results['degrees']) or 'None'}")
+
+            st.subheader("Improving Suggestions...")
+
+            if use_gemini:
+                gemini_suggestions = generate_gemini_suggestions(linkedin_text, target_skills, job_description)
+                if gemini_suggestions:
+                    for suggestion in gemini_suggestions:
+                        st.write(f"- {suggestion}")
+                else:
+                    st.write("Gemini could not generate suggestions.")
+            else:
+                # ... (Your existing rule-based suggestions)
+                pass  # You can keep the old suggestions here if you want them as a fallback. 
@@ -0,0 +1,35 @@
+"""
+Welcome page: links to the other pages.
+"""
+import streamlit as st
+
+from rezumex.ui.common import set_user_type
+
+
+def render():
+    # Welcome Page
+    st.markdown("<h1 class='welcome-text'>Welcome To Rezume✘ </h1>", unsafe_allow_html=True)
+    st.markdown("<p class='app-description'>Application Tracking System</p>", unsafe_allow_html=True)
+
+    # User Type Buttons
+    st.markdown("<div class='user-buttons'>", unsafe_allow_html=True)
+    if st.button("User (with Job Role)", use_container_width=False):
+        set_user_type("user_with_job_role")  # Fixed function name
+    if st.button("User (without Job Role)", use_container_width=False):
+        set_user_type("general_user")  # Fixed function name
+    if st.button("HR", use_container_width=False):
+        set_user_type("hr")  # Fixed function name
+    if st.button("Linkedin Analyser ", use_container_width=False):
+        set_user_type("linkedin")  # Fixed function name
+    if st.button("Cover Letter Generator", use_container_width=False):
+        set_user_type("cover_letter_generator")  # Fixed function name
+    st.markdown("</div>", unsafe_allow_html=True)
+
+    # Welcome Content
+    st.markdown("<div class='welcome-content'>", unsafe_allow_html=True)
+    st.subheader("🔥 Unlock Your Potential with RezumeX")
+    st.write("🚀 RezumeX empowers you to take control of your career journey. Whether you're a seasoned professional or just starting out, our powerful ATS helps you create a resume that stands out and gets noticed by recruiters.")
+    st.write("🚀 For **job seekers with a specific role in mind**, our tailored analysis ensures your resume aligns perfectly with the target position. We highlight your relevant skills and experience, maximizing your chances of landing an interview.")
+    st.write("🚀 For **job seekers exploring different options**, RezumeX provides valuable insights into your strengths and areas for improvement. Discover your potential and identify the roles that best match your skills and aspirations.")
+    st.write("🚀 For **HR professionals**, RezumeX simplifies the tedious task of resume screening. Quickly identify top candidates, assess their qualifications, and make data-driven hiring decisions.")
+    st.markdown("</div>", unsafe_allow_html=True)
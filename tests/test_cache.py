@@ -0,0 +1,39 @@
+from rezumex.cache import ExtractionCache
+
+
+def _document(backend):
+    text = "" if backend == "ocr_failed" else "Python developer"
+    return {"text": text, "pages": [{"page": 1, "backend": backend, "text": text}], "ocr": backend.startswith("ocr")}
+
+
+def _counting(document):
+    calls = []
+
+    def extract(pdf_bytes):
+        calls.append(pdf_bytes)
+        return document
+
+    return extract, calls
+
+
+def test_failed_ocr_is_not_cached(tmp_path):
+    cache = ExtractionCache("test", path=str(tmp_path / "documents.sqlite3"))
+    extract, calls = _counting(_document("ocr_failed"))
+
+    cache.get_or_extract(b"%PDF scan", extract)
+    cache.get_or_extract(b"%PDF scan", extract)
+
+    assert len(calls) == 2
+    assert cache.get(b"%PDF scan") is None
+    assert ExtractionCache("test", path=cache.path).get(b"%PDF scan") is None
+
+
+def test_extracted_document_is_cached_on_disk(tmp_path):
+    cache = ExtractionCache("test", path=str(tmp_path / "documents.sqlite3"))
+    extract, calls = _counting(_document("ocr"))
+
+    cache.get_or_extract(b"%PDF scan", extract)
+    cache.get_or_extract(b"%PDF scan", extract)
+
+    assert len(calls) == 1
+    assert ExtractionCache("test", path=cache.path).get(b"%PDF scan") == _document("ocr")
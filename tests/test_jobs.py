@@ -0,0 +1,64 @@
+import time
+
+import pytest
+
+from rezumex.jobs import JobQueue
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(path=str(tmp_path / "jobs.sqlite3"), lease_seconds=0.05, max_attempts=2)
+
+
+def _submit(queue, count=1):
+    return queue.submit("job", [(f"resume{i}.pdf", b"%PDF") for i in range(count)], "prompt")
+
+
+def test_expired_lease_is_reclaimed_and_stale_holder_is_ignored(queue):
+    job_id = _submit(queue)
+    stale = queue.claim()
+    assert queue.claim() is None  # Leased
+
+    time.sleep(0.1)
+    fresh = queue.claim()
+    assert fresh["id"] == stale["id"] and fresh["attempts"] == stale["attempts"] + 1
+
+    assert not queue.renew(stale["id"], stale["attempts"])
+    assert not queue.complete(stale["id"], stale["attempts"], {"ATS Score": 1})
+    queue.fail(stale["id"], stale["attempts"], "stale")
+    assert queue.status(job_id)["running"] == 1
+
+    assert queue.renew(fresh["id"], fresh["attempts"])
+    assert queue.complete(fresh["id"], fresh["attempts"], {"ATS Score": 2})
+    assert queue.results(job_id) == ([{"ATS Score": 2, "Filename": "resume0.pdf"}], [])
+
+
+def test_renewed_lease_is_not_reclaimed(queue):
+    _submit(queue)
+    task = queue.claim()
+    for _ in range(4):
+        time.sleep(0.02)
+        assert queue.renew(task["id"], task["attempts"])
+    assert queue.claim() is None
+
+
+def test_retry_stops_at_max_attempts(queue):
+    job_id = _submit(queue)
+    task = queue.claim()
+    queue.fail(task["id"], task["attempts"], "overloaded", retry=True)
+    assert queue.status(job_id)["pending"] == 1
+
+    task = queue.claim()
+    assert task["attempts"] == queue.max_attempts
+    queue.fail(task["id"], task["attempts"], "overloaded", retry=True)
+    assert queue.claim() is None
+    assert queue.results(job_id) == ([], [("resume0.pdf", "overloaded")])
+
+
+def test_task_whose_leases_keep_expiring_is_given_up(queue):
+    job_id = _submit(queue)
+    for _ in range(queue.max_attempts):
+        assert queue.claim() is not None
+        time.sleep(0.1)
+    assert queue.claim() is None
+    assert queue.results(job_id) == ([], [("resume0.pdf", "Gave up after 2 attempts")])
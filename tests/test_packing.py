@@ -0,0 +1,69 @@
+import json
+
+import pytest
+
+from rezumex.cache import ResponseCache
+from rezumex.packing import analyze_group, analyze_packed, is_complete_response
+
+
+def _group(size):
+    return [(f"resume{i}.pdf", f"text {i}") for i in range(size)]
+
+
+def _unusable(contents):
+    return "not json"
+
+
+class QuotaError(Exception):
+    code = 429
+
+
+def test_one_failing_fallback_fails_only_its_resume():
+    def analyze_one(text):
+        if text == "text 3":
+            raise ValueError("boom")
+        return {"Candidate": text}
+
+    results = analyze_group(_group(6), _unusable, "prompt", "job", analyze_one)
+
+    assert results.pop("resume3.pdf") == (None, "boom")
+    assert results == {f"resume{i}.pdf": ({"Candidate": f"text {i}"}, None) for i in (0, 1, 2, 4, 5)}
+
+
+def test_analyze_packed_yields_per_resume_errors():
+    def analyze_one(text):
+        if text == "text 3":
+            raise ValueError("boom")
+        return {"Candidate": text}
+
+    results = {filename: (row, error)
+               for filename, row, error in analyze_packed(_group(6), _unusable, "prompt", "job", analyze_one)}
+
+    assert results["resume3.pdf"] == (None, "boom")
+    assert sum(error is None for _, error in results.values()) == 5
+
+
+def test_retryable_fallback_error_propagates():
+    def analyze_one(text):
+        raise QuotaError("429 Resource has been exhausted")
+
+    with pytest.raises(QuotaError):
+        analyze_group(_group(2), _unusable, "prompt", "job", analyze_one)
+
+
+def test_partial_packed_response_is_not_cached(tmp_path):
+    cache = ResponseCache(path=str(tmp_path / "responses.sqlite3"))
+    partial = json.dumps([{"candidate_id": "1"}])[:-5]
+
+    assert cache.get_or_compute(("model", "group"), lambda: partial,
+                                validate=lambda response: is_complete_response(response, 2)) == partial
+    assert cache.stats()["entries"] == 0
+
+
+def test_is_complete_response_needs_every_candidate():
+    assert not is_complete_response("not json", 1)
+    assert not is_complete_response("42", 1)
+    assert not is_complete_response(json.dumps([{"candidate_id": "1"}]), 1)
+    assert not is_complete_response(json.dumps([{"candidate_id": "1", "ats_score": 80}]), 2)
+    assert is_complete_response(json.dumps([{"candidate_id": "2", "ats_score": 70},
+                                            {"candidate_id": "1", "ats_score": 80}]), 2)